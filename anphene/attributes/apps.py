@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class AttributesConfig(AppConfig):
     name = "anphene.attributes"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        from . import signals
@@ -7,8 +7,8 @@ from core.graph.types import FilterInputObjectType
 from core.graph.utils import from_global_id_strict_type
 from core.utils.filters import filter_fields_containing_value
 from .enums import AttributeTypeEnum
-from .models import Attribute
-from ..categories.models import Category
+from .models import Attribute, AttributeProduct, AttributeVariant
+from ..categories.utils import get_category_tree
 from ..products.models import Product
 
 
@@ -24,13 +24,13 @@ def filter_attributes_by_product_types(qs, field, value):
 
     if field == "in_category":
         category_id = from_global_id_strict_type(value, only_type="Category", field=field)
-        category = Category.objects.filter(pk=category_id).first()
+        category_tree = get_category_tree()
 
-        if category is None:
+        if int(category_id) not in category_tree:
             return qs.none()
 
-        tree = category.get_descendants(include_self=True)
-        product_qs = Product.objects.filter(category__in=tree)
+        tree = category_tree.get_descendant_ids([int(category_id)])
+        product_qs = Product.objects.filter(category_id__in=tree)
 
     elif field == "in_collection":
         collection_id = from_global_id_strict_type(value, only_type="Collection", field=field)
@@ -39,9 +39,18 @@ def filter_attributes_by_product_types(qs, field, value):
     else:
         raise NotImplementedError(f"Filtering by {field} is unsupported")
 
-    product_types = set(product_qs.values_list("product_type_id", flat=True))
+    product_types = product_qs.values("product_type_id")
     return qs.filter(
-        Q(product_types__in=product_types) | Q(product_variant_types__in=product_types)
+        Q(
+            pk__in=AttributeProduct.objects.filter(product_type_id__in=product_types).values(
+                "attribute_id"
+            )
+        )
+        | Q(
+            pk__in=AttributeVariant.objects.filter(product_type_id__in=product_types).values(
+                "attribute_id"
+            )
+        )
     )
 
 
@@ -7,4 +7,4 @@ def resolve_attributes(info, **_kwargs):
         info.context.user, AttributePermissions.MANAGE_ATTRIBUTES
     )
 
-    return qs.distinct()
+    return qs
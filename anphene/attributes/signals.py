@@ -0,0 +1,18 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .models import Attribute, AttributeProduct, AttributeVariant
+from .utils import invalidate_attribute_schemas
+
+
+def invalidate_attribute_schemas_handler(**_kwargs):
+    invalidate_attribute_schemas()
+
+
+for model in (Attribute, AttributeProduct, AttributeVariant):
+    post_save.connect(invalidate_attribute_schemas_handler, sender=model)
+    post_delete.connect(invalidate_attribute_schemas_handler, sender=model)
+
+# Assignments created through `product_type.product_attributes.set(...)` are
+# inserted in bulk and don't emit `post_save`.
+m2m_changed.connect(invalidate_attribute_schemas_handler, sender=AttributeProduct)
+m2m_changed.connect(invalidate_attribute_schemas_handler, sender=AttributeVariant)
@@ -4,6 +4,7 @@ import graphene
 from graphene import relay
 
 from core.graph.connection import CountableDjangoObjectType
+from core.graph.cost import FieldCost
 from . import models
 from .enums import AttributeInputTypeEnum, AttributeValueType
 from ..products.dataloaders import AttributeValuesByAttributeIdLoader
@@ -31,6 +32,8 @@ class Attribute(CountableDjangoObjectType):
         "anphene.attributes.types.AttributeValue", description="List of attribute's values."
     )
 
+    field_costs = {"values": FieldCost(list_size=20)}
+
     class Meta:
         description = (
             "Custom attribute of a product. Attributes can be assigned to products and "
@@ -87,6 +90,8 @@ class SelectedAttribute(graphene.ObjectType):
     )
     values = graphene.List(AttributeValue, description="Values of an attribute.", required=True)
 
+    field_costs = {"values": FieldCost(list_size=3)}
+
     class Meta:
         description = "Represents a custom attribute."
 
@@ -0,0 +1,38 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple, Type, Union
+
+from core.utils.cache import bump_cache_version, get_or_set_many_versioned
+from .models import Attribute, AttributeProduct, AttributeVariant
+
+ATTRIBUTE_SCHEMA_CACHE_NAMESPACE = "attribute_schema"
+
+# List of `(assignment_id, attribute)` pairs ordered the same way as
+# the attributes are sorted in the product type.
+AttributeSchema = List[Tuple[int, Attribute]]
+
+
+def get_attribute_schemas(
+    model: Type[Union[AttributeProduct, AttributeVariant]], product_type_ids: Iterable[int]
+) -> Dict[int, AttributeSchema]:
+    """Return the attributes assigned to given product types.
+
+    `model` is either `AttributeProduct` or `AttributeVariant`. Schemas are shared
+    across requests and kept until any attribute or attribute assignment changes.
+    """
+
+    def fetch(missing_ids):
+        assignments = model.objects.filter(product_type_id__in=missing_ids).select_related(
+            "attribute"
+        )
+        schemas: Dict[int, AttributeSchema] = defaultdict(list)
+        for assignment in assignments:
+            schemas[assignment.product_type_id].append((assignment.id, assignment.attribute))
+        return {product_type_id: schemas[product_type_id] for product_type_id in missing_ids}
+
+    return get_or_set_many_versioned(
+        ATTRIBUTE_SCHEMA_CACHE_NAMESPACE, product_type_ids, fetch, prefix=f"{model.__name__}:"
+    )
+
+
+def invalidate_attribute_schemas():
+    bump_cache_version(ATTRIBUTE_SCHEMA_CACHE_NAMESPACE)
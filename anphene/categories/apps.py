@@ -5,4 +5,5 @@ class CategoriesConfig(AppConfig):
     name = "anphene.categories"
 
     def ready(self):
-        pass
+        # noinspection PyUnresolvedReferences
+        from . import signals
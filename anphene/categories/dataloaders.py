@@ -0,0 +1,24 @@
+from core.graph.dataloader import DataLoader
+from .models import Category
+from .utils import get_category_tree
+
+
+class ChildrenByCategoryIdLoader(DataLoader):
+    """Load children of categories, in the tree order, in a single query."""
+
+    context_key = "children_by_category"
+
+    def batch_load(self, keys):
+        tree = get_category_tree()
+        children_ids = {category_id: tree.get_children_ids(category_id) for category_id in keys}
+        categories = Category.objects.in_bulk(
+            [child_id for ids in children_ids.values() for child_id in ids]
+        )
+        return [
+            [
+                categories[child_id]
+                for child_id in children_ids[category_id]
+                if child_id in categories
+            ]
+            for category_id in keys
+        ]
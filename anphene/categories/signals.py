@@ -0,0 +1,20 @@
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save
+
+from .models import Category
+from .utils import invalidate_category_tree, reset_category_tree_state
+
+
+def invalidate_category_tree_handler(**_kwargs):
+    invalidate_category_tree()
+
+
+def reset_category_tree_state_handler(**_kwargs):
+    reset_category_tree_state()
+
+
+# MPTT shifts `lft`/`rght` of other nodes with queryset updates, these always
+# come along with a save or delete of the moved category.
+post_save.connect(invalidate_category_tree_handler, sender=Category)
+post_delete.connect(invalidate_category_tree_handler, sender=Category)
+request_started.connect(reset_category_tree_state_handler)
@@ -0,0 +1,17 @@
+from typing import List
+
+from config.celery_app import app
+from .utils import delete_subtrees, get_subtree_ranges, unpublish_subtrees_products
+
+
+@app.task(bind=True, soft_time_limit=30 * 60, time_limit=35 * 60)
+def delete_categories_task(self, categories_ids: List[int]):
+    """Delete categories with their subtrees, reporting progress as task state."""
+
+    def report_progress(deleted, total):
+        self.update_state(state="PROGRESS", meta={"deleted": deleted, "total": total})
+
+    ranges = get_subtree_ranges(categories_ids)
+    # Products could be assigned to the subtrees since the deletion was requested
+    unpublish_subtrees_products(ranges)
+    delete_subtrees(ranges, progress=report_progress)
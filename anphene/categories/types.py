@@ -1,11 +1,12 @@
 import graphene
-import graphene_django_optimizer as gql_optimizer
 from graphene import relay
 
 from core.graph.connection import CountableDjangoObjectType
 from core.graph.fields import PrefetchingConnectionField
 from core.graph.types import Image
 from . import models
+from .dataloaders import ChildrenByCategoryIdLoader
+from .utils import get_category_tree
 from ..products import models as products_models
 from ..products.types.products import Product
 
@@ -41,7 +42,8 @@ class Category(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_ancestors(root: models.Category, _info, **_kwargs):
-        return root.get_ancestors()
+        ancestor_ids = get_category_tree().get_ancestor_ids(root.pk)
+        return models.Category.objects.filter(pk__in=ancestor_ids).order_by("level")
 
     @staticmethod
     def resolve_background_image(root: models.Category, info, size=None, **_kwargs):
@@ -55,12 +57,11 @@ class Category(CountableDjangoObjectType):
             )
 
     @staticmethod
-    @gql_optimizer.resolver_hints(prefetch_related="children")
-    def resolve_children(root: models.Category, _info, **_kwargs):
-        return root.children.all()
+    def resolve_children(root: models.Category, info, **_kwargs):
+        return ChildrenByCategoryIdLoader(info.context).load(root.pk)
 
     @staticmethod
     def resolve_products(root: models.Category, info, **_kwargs):
-        tree = root.get_descendants(include_self=True)
+        tree = get_category_tree().get_descendant_ids([root.pk])
         qs = products_models.Product.objects.published()
-        return qs.filter(category__in=tree)
+        return qs.filter(category_id__in=tree)
@@ -1,33 +1,261 @@
-from typing import List
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Q, Subquery
+
+from core.utils.cache import bump_cache_version, get_cache_version
+
+CATEGORY_TREE_CACHE_NAMESPACE = "category_tree"
+
+
+# Subtrees of more categories than this are deleted by a background task.
+CATEGORY_DELETE_BACKGROUND_THRESHOLD = 1000
+CATEGORY_DELETE_CHUNK_SIZE = 500
+PRODUCT_UNPUBLISH_CHUNK_SIZE = 2000
+
+# `(tree_id, lft, rght)` of a subtree root
+TreeRange = Tuple[int, int, int]
+
+
+def get_subtree_ranges(categories_ids: Iterable[int]) -> List[TreeRange]:
+    """Return ranges of subtrees rooted at given categories.
+
+    Ranges nested in another one are skipped, so the subtrees don't overlap.
+    """
+    from .models import Category
+
+    ranges = sorted(
+        Category.objects.filter(pk__in=categories_ids).values_list("tree_id", "lft", "rght")
+    )
+    subtree_ranges: List[TreeRange] = []
+    for tree_id, lft, rght in ranges:
+        if subtree_ranges:
+            last_tree_id, _, last_rght = subtree_ranges[-1]
+            if tree_id == last_tree_id and rght < last_rght:
+                continue
+        subtree_ranges.append((tree_id, lft, rght))
+    return subtree_ranges
+
+
+def get_subtrees_lookup(ranges: Iterable[TreeRange], prefix: str = "") -> Q:
+    """Return lookup matching categories in the subtrees, roots included."""
+    lookup = Q(pk__in=[])
+    for tree_id, lft, rght in ranges:
+        lookup |= Q(
+            **{f"{prefix}tree_id": tree_id, f"{prefix}lft__gte": lft, f"{prefix}rght__lte": rght}
+        )
+    return lookup
+
+
+def unpublish_subtrees_products(
+    ranges: List[TreeRange], chunk_size: int = PRODUCT_UNPUBLISH_CHUNK_SIZE
+) -> int:
+    """Unpublish all products of categories in the subtrees.
+
+    Every update joins products with the subtree ranges and touches at most
+    `chunk_size` rows, so large catalogues don't get locked in a single statement.
+    """
+    from ..products.models import Product
+
+    if not ranges:
+        return 0
+    products = Product.objects.filter(get_subtrees_lookup(ranges, prefix="category__")).filter(
+        Q(is_published=True) | Q(publication_date__isnull=False)
+    )
+    total = 0
+    while True:
+        chunk = products.order_by().values("pk")[:chunk_size]
+        updated = Product.objects.filter(pk__in=Subquery(chunk)).update(
+            is_published=False, publication_date=None
+        )
+        total += updated
+        if updated < chunk_size:
+            return total
+
+
+def delete_subtrees(
+    ranges: List[TreeRange],
+    chunk_size: int = CATEGORY_DELETE_CHUNK_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+):
+    """Delete whole subtrees of categories.
+
+    Descendants are deleted deepest first in chunks, so each chunk cascades only
+    to rows of its own categories. Roots are deleted last one by one, letting MPTT
+    close the gaps their subtrees leave in the tree. `progress` is called with the
+    number of deleted and all categories after every chunk.
+    """
+    from .models import Category
+
+    roots_lookup = Q(pk__in=[])
+    for tree_id, lft, _ in ranges:
+        roots_lookup |= Q(tree_id=tree_id, lft=lft)
+    root_ids = list(Category.objects.filter(roots_lookup).values_list("pk", flat=True))
+    descendant_ids = list(
+        Category.objects.filter(get_subtrees_lookup(ranges))
+        .exclude(pk__in=root_ids)
+        .order_by("-level")
+        .values_list("pk", flat=True)
+    )
+    total = len(descendant_ids) + len(root_ids)
+    deleted = 0
+    for index in range(0, len(descendant_ids), chunk_size):
+        chunk = descendant_ids[index : index + chunk_size]
+        with transaction.atomic():
+            Category.objects.filter(pk__in=chunk).delete()
+        deleted += len(chunk)
+        if progress:
+            progress(deleted, total)
+
+    for root_id in root_ids:
+        with transaction.atomic():
+            # Closing a gap shifts `lft`/`rght` of other roots, always use fresh values
+            root = Category.objects.select_for_update().filter(pk=root_id).first()
+            if root:
+                root.delete()
+        deleted += 1
+        if progress:
+            progress(deleted, total)
 
 
 @transaction.atomic
-def delete_categories(categories_ids: List[str]):
+def delete_categories(categories_ids: Iterable[int]):
+    """Delete categories with their subtrees and unpublish their products.
+
+    Subtrees bigger than `CATEGORY_DELETE_BACKGROUND_THRESHOLD` categories are
+    deleted by a background task started once the transaction is committed.
     """
-        Delete categories and perform all necessary actions.
-        Set products of deleted categories as unpublished, delete categories
-        and update products minimal variant prices.
+    from .models import Category
+    from .tasks import delete_categories_task
+
+    categories_ids = list(
+        Category.objects.select_for_update()
+        .filter(pk__in=list(categories_ids))
+        .values_list("pk", flat=True)
+    )
+    ranges = get_subtree_ranges(categories_ids)
+    unpublish_subtrees_products(ranges)
+
+    subtrees_size = sum((rght - lft + 1) // 2 for _, lft, rght in ranges)
+    if subtrees_size > CATEGORY_DELETE_BACKGROUND_THRESHOLD:
+        transaction.on_commit(lambda: delete_categories_task.delay(categories_ids))
+    else:
+        delete_subtrees(ranges)
+
+
+class CategoryNode(NamedTuple):
+    id: int
+    parent_id: Optional[int]
+    tree_id: int
+    lft: int
+    rght: int
+    level: int
+    slug: str
+    name: str
+
+
+class CategoryTree:
+    """Snapshot of the category tree answering tree lookups without queries.
+
+    Nodes are kept in the tree order, so the descendants of a node are
+    the slice of nodes following it up to the node's `rght` boundary.
     """
+
+    def __init__(self, nodes: Iterable[CategoryNode]):
+        self.nodes = sorted(nodes, key=lambda node: (node.tree_id, node.lft))
+        self.positions = [(node.tree_id, node.lft) for node in self.nodes]
+        self.index_by_id: Dict[int, int] = {
+            node.id: index for index, node in enumerate(self.nodes)
+        }
+        self.children_ids: Dict[int, List[int]] = {node.id: [] for node in self.nodes}
+        for node in self.nodes:
+            if node.parent_id in self.children_ids:
+                self.children_ids[node.parent_id].append(node.id)
+
+    def __contains__(self, category_id) -> bool:
+        return category_id in self.index_by_id
+
+    def get(self, category_id: int) -> Optional[CategoryNode]:
+        index = self.index_by_id.get(category_id)
+        return None if index is None else self.nodes[index]
+
+    def get_children_ids(self, category_id: int) -> List[int]:
+        return self.children_ids.get(category_id, [])
+
+    def get_descendant_ids(self, category_ids: Iterable[int], include_self=True) -> Set[int]:
+        """Return IDs of all descendants of given categories, unknown IDs are skipped."""
+        descendant_ids: Set[int] = set()
+        for category_id in category_ids:
+            index = self.index_by_id.get(category_id)
+            if index is None:
+                continue
+            node = self.nodes[index]
+            # Bulk deletes may leave gaps in `lft`/`rght`, don't derive the size from them
+            end = bisect_left(self.positions, (node.tree_id, node.rght), lo=index)
+            start = index if include_self else index + 1
+            descendant_ids.update(n.id for n in self.nodes[start:end])
+        return descendant_ids
+
+    def get_ancestor_ids(self, category_id: int, include_self=False) -> List[int]:
+        """Return IDs of the category ancestors, starting from the root."""
+        ancestor_ids = []
+        node = self.get(category_id)
+        if node is not None and include_self:
+            ancestor_ids.append(node.id)
+        while node is not None and node.parent_id is not None:
+            node = self.get(node.parent_id)
+            if node is not None:
+                ancestor_ids.append(node.id)
+        return ancestor_ids[::-1]
+
+
+class _CategoryTreeState(threading.local):
+    # Set when the current thread changed categories in a transaction that isn't
+    # committed yet, the shared snapshot doesn't contain these changes.
+    dirty = False
+
+
+_tree_state = _CategoryTreeState()
+_snapshot = (None, None)
+
+
+def build_category_tree() -> CategoryTree:
     from .models import Category
-    from ..products.models import Product
 
-    categories = Category.objects.select_for_update().filter(pk__in=categories_ids)
-    categories.prefetch_related("products")
+    return CategoryTree(
+        CategoryNode(*values)
+        for values in Category.objects.values_list(*CategoryNode._fields).order_by()
+    )
+
+
+def get_category_tree() -> CategoryTree:
+    """Return the category tree snapshot shared by all requests of the process.
+
+    The snapshot is rebuilt once categories change in any process.
+    """
+    global _snapshot
+
+    if _tree_state.dirty:
+        if connection.in_atomic_block:
+            return build_category_tree()
+        _tree_state.dirty = False
+
+    version = get_cache_version(CATEGORY_TREE_CACHE_NAMESPACE)
+    snapshot_version, tree = _snapshot
+    if tree is None or snapshot_version != version:
+        tree = build_category_tree()
+        _snapshot = (version, tree)
+    return tree
 
-    products = Product.objects.none()
-    for category in categories:
-        products = products | collect_categories_tree_products(category)
 
-    products.update(is_published=False, publication_date=None)
-    categories.delete()
+def invalidate_category_tree():
+    _tree_state.dirty = True
+    bump_cache_version(CATEGORY_TREE_CACHE_NAMESPACE)
+    transaction.on_commit(reset_category_tree_state)
 
 
-def collect_categories_tree_products(category):
-    """Collect products from all levels in category tree."""
-    products = category.products.all()
-    descendants = category.get_descendants()
-    for descendant in descendants:
-        products = products | descendant.products.all()
-    return products
+def reset_category_tree_state():
+    # Changes of a rolled back transaction never reach the shared snapshot
+    _tree_state.dirty = False
@@ -6,5 +6,4 @@ class CheckoutsConfig(AppConfig):
 
     def ready(self):
         # noinspection PyUnresolvedReferences
-        # from . import types
-        pass
+        from . import signals
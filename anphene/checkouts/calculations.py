@@ -0,0 +1,124 @@
+"""Totals of checkouts, calculated for all lines at once.
+
+Lines are loaded with their variants, products and collections in a fixed number
+of queries, whatever their count. Results are memoized on the checkout instance,
+as the checkout page resolves several totals of the same checkout, until its
+lines are changed, see `invalidate_checkout_totals`.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from django.db.models import Prefetch
+
+from ..collections.models import Collection
+from ..discounts import DiscountInfo
+from ..discounts.utils import calculate_discounted_price
+
+if TYPE_CHECKING:
+    # flake8: noqa
+    from .models import Checkout, CheckoutLine
+
+LINES_CACHE_ATTR = "_calculated_lines"
+TOTALS_CACHE_ATTR = "_calculated_totals"
+
+
+@dataclass
+class CheckoutLineTotal:
+    line: "CheckoutLine"
+    unit_price: int
+    unit_price_undiscounted: int
+    total: int
+    discount: int
+    weight: int
+
+
+@dataclass
+class CheckoutTotals:
+    lines: Dict[int, CheckoutLineTotal]
+    quantity: int
+    weight: int
+    total_lines: int
+    total_lines_discount: int
+    total: int
+
+
+def fetch_checkout_lines(checkout: "Checkout") -> List["CheckoutLine"]:
+    """Return lines of the checkout with their variants, products and collections."""
+    lines = getattr(checkout, LINES_CACHE_ATTR, None)
+    if lines is None:
+        lines = list(
+            checkout.lines.select_related("variant__product").prefetch_related(
+                Prefetch("variant__product__collections", queryset=Collection.objects.only("id"))
+            )
+        )
+        setattr(checkout, LINES_CACHE_ATTR, lines)
+    return lines
+
+
+def calculate_line_total(
+    line: "CheckoutLine", discounts: Optional[Iterable[DiscountInfo]]
+) -> CheckoutLineTotal:
+    variant = line.variant
+    product = variant.product
+    unit_price = calculate_discounted_price(
+        product=product,
+        price=variant.price,
+        collections=product.collections.all(),
+        discounts=discounts,
+    )
+    return CheckoutLineTotal(
+        line=line,
+        unit_price=unit_price,
+        unit_price_undiscounted=variant.price,
+        total=unit_price * line.quantity,
+        discount=(variant.price - unit_price) * line.quantity,
+        weight=variant.weight * line.quantity,
+    )
+
+
+def calculate_checkout_totals(
+    checkout: "Checkout", discounts: Optional[Iterable[DiscountInfo]]
+) -> CheckoutTotals:
+    """Return totals of the checkout with sales of the discounts applied.
+
+    Shipping, its discount, the voucher discount, the pay code and the used
+    balance are read from the checkout, where the checkout info sets them.
+    """
+    cached = getattr(checkout, TOTALS_CACHE_ATTR, None)
+    if cached is not None and cached[0] is discounts:
+        return cached[1]
+
+    line_totals = {}
+    quantity = weight = total_lines = total_lines_discount = 0
+    for line in fetch_checkout_lines(checkout):
+        line_total = calculate_line_total(line, discounts)
+        line_totals[line.pk] = line_total
+        quantity += line.quantity
+        weight += line_total.weight
+        total_lines += line_total.total + line_total.discount
+        total_lines_discount += line_total.discount
+
+    total = (
+        total_lines
+        - total_lines_discount
+        + getattr(checkout, "shipping", 0)
+        - getattr(checkout, "shipping_discount", 0)
+        - getattr(checkout, "discount", 0)
+        + getattr(checkout, "pay_code", 0)
+        - getattr(checkout, "used_balance", 0)
+    )
+    totals = CheckoutTotals(
+        lines=line_totals,
+        quantity=quantity,
+        weight=weight,
+        total_lines=total_lines,
+        total_lines_discount=total_lines_discount,
+        total=max(total, 0),
+    )
+    setattr(checkout, TOTALS_CACHE_ATTR, (discounts, totals))
+    return totals
+
+
+def invalidate_checkout_totals(checkout: "Checkout"):
+    for attr in (LINES_CACHE_ATTR, TOTALS_CACHE_ATTR):
+        checkout.__dict__.pop(attr, None)
@@ -0,0 +1,46 @@
+# Generated by Django 3.0.6 on 2026-10-19 07:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0001_initial"),
+        ("checkouts", "0002_auto_20200714_1302"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Allocation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("quantity_allocated", models.PositiveIntegerField()),
+                ("expires", models.DateTimeField(db_index=True)),
+                (
+                    "checkout",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="allocations",
+                        to="checkouts.Checkout",
+                    ),
+                ),
+                (
+                    "variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="allocations",
+                        to="products.ProductVariant",
+                    ),
+                ),
+            ],
+            options={"ordering": ("pk",), "unique_together": {("checkout", "variant")},},
+        ),
+    ]
@@ -20,7 +20,9 @@ class Checkout(models.Model):
         ordering = ("-last_change", "pk")
 
     def get_total_weight(self):
-        return sum([line.variant.weight * line.quantity for line in self.lines.all()])
+        from .calculations import fetch_checkout_lines
+
+        return sum(line.variant.weight * line.quantity for line in fetch_checkout_lines(self))
 
 
 class CheckoutLine(models.Model):
@@ -33,3 +35,24 @@ class CheckoutLine(models.Model):
     class Meta:
         unique_together = ("checkout", "variant")
         ordering = ("id",)
+
+
+class Allocation(models.Model):
+    """Stock of a variant reserved for a checkout, counted in `quantity_allocated`.
+
+    Allocations outlive their checkout until they expire, so that stock of deleted
+    checkouts is released with the abandoned ones.
+    """
+
+    checkout = models.ForeignKey(
+        Checkout, related_name="allocations", null=True, on_delete=models.SET_NULL
+    )
+    variant = models.ForeignKey(
+        "products.ProductVariant", related_name="allocations", on_delete=models.CASCADE
+    )
+    quantity_allocated = models.PositiveIntegerField()
+    expires = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = ("checkout", "variant")
+        ordering = ("pk",)
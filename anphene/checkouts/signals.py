@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+
+from .calculations import invalidate_checkout_totals
+from .models import CheckoutLine
+
+
+def invalidate_line_checkout_totals(sender, instance, **_kwargs):
+    # Lines created or fetched through the checkout hold the same instance
+    if CheckoutLine.checkout.is_cached(instance):
+        invalidate_checkout_totals(instance.checkout)
+
+
+post_save.connect(invalidate_line_checkout_totals, sender=CheckoutLine)
+post_delete.connect(invalidate_line_checkout_totals, sender=CheckoutLine)
@@ -0,0 +1,206 @@
+"""Reservation of stock for checkouts.
+
+Stock is reserved by raising `quantity_allocated` of variants with conditional
+updates, which only succeed while enough stock is available, instead of reading
+stock first and locking it for the rest of the transaction. Variants of all
+lines are updated by a single statement, locking their rows in the order of
+their ids so that concurrent checkouts cannot deadlock. Every reservation is
+recorded in the `Allocation` ledger, reservations of abandoned checkouts are
+released once they expire.
+"""
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, Set
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from core.exceptions import InsufficientStock
+from .models import Allocation, Checkout
+from ..products.models import ProductVariant
+from ..products.subscriptions import publish_variants_stock
+
+RELEASE_BATCH_SIZE = 1000
+
+UPDATE_VARIANTS_SQL = """
+WITH requested (id, quantity) AS (VALUES {values}),
+locked AS (
+    SELECT variant.id
+    FROM {table} variant
+    JOIN requested ON requested.id = variant.id
+    ORDER BY variant.id
+    FOR UPDATE OF variant
+)
+UPDATE {table} variant
+SET {assignments}
+FROM requested, locked
+WHERE variant.id = requested.id AND locked.id = requested.id AND {condition}
+RETURNING variant.id
+"""
+
+ALLOCATE = "quantity_allocated = variant.quantity_allocated + requested.quantity"
+DEALLOCATE = "quantity_allocated = GREATEST(variant.quantity_allocated - requested.quantity, 0)"
+FULFIL = f"quantity = variant.quantity - requested.quantity, {DEALLOCATE}"
+
+HAS_AVAILABLE_STOCK = (
+    "(NOT variant.track_inventory OR "
+    "variant.quantity - variant.quantity_allocated >= requested.quantity)"
+)
+HAS_STOCK = "variant.quantity >= requested.quantity"
+
+
+def update_variants_stock(
+    quantities: Dict[int, int], assignments: str, condition: str = "TRUE"
+) -> Set[int]:
+    """Update stock of variants by their quantities in one statement.
+
+    Return ids of the updated variants, variants not meeting the condition are
+    left as they are.
+    """
+    if not quantities:
+        return set()
+    items = sorted(quantities.items())
+    sql = UPDATE_VARIANTS_SQL.format(
+        values=", ".join(["(%s::integer, %s::integer)"] * len(items)),
+        table=connection.ops.quote_name(ProductVariant._meta.db_table),
+        assignments=assignments,
+        condition=condition,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value for item in items for value in item])
+        return {row[0] for row in cursor.fetchall()}
+
+
+def raise_insufficient_stock(variant_pks: Iterable[int]):
+    raise InsufficientStock(ProductVariant.objects.get(pk=min(variant_pks)))
+
+
+def get_allocation_expiry():
+    return timezone.now() + timedelta(seconds=settings.CHECKOUT_ALLOCATION_TTL)
+
+
+@transaction.atomic
+def reserve_stock(checkout: Checkout, quantities: Dict[int, int]):
+    """Make the checkout hold the quantities of variants, by their ids.
+
+    Only differences to what the checkout already holds are allocated or
+    released, all of its reservations are extended. Raise `InsufficientStock`
+    and reserve nothing if any variant lacks available stock.
+    """
+    allocations = {
+        allocation.variant_id: allocation
+        for allocation in Allocation.objects.select_for_update().filter(checkout=checkout)
+    }
+    to_allocate, to_release = {}, {}
+    for variant_pk in quantities.keys() | allocations.keys():
+        allocation = allocations.get(variant_pk)
+        allocated = allocation.quantity_allocated if allocation else 0
+        difference = quantities.get(variant_pk, 0) - allocated
+        if difference > 0:
+            to_allocate[variant_pk] = difference
+        elif difference < 0:
+            to_release[variant_pk] = -difference
+
+    allocated_pks = update_variants_stock(to_allocate, ALLOCATE, HAS_AVAILABLE_STOCK)
+    if len(allocated_pks) < len(to_allocate):
+        raise_insufficient_stock(to_allocate.keys() - allocated_pks)
+    update_variants_stock(to_release, DEALLOCATE)
+
+    expires = get_allocation_expiry()
+    to_create, to_update, to_delete = [], [], []
+    for variant_pk, quantity in quantities.items():
+        allocation = allocations.get(variant_pk)
+        if quantity <= 0:
+            continue
+        if allocation is None:
+            to_create.append(
+                Allocation(
+                    checkout=checkout,
+                    variant_id=variant_pk,
+                    quantity_allocated=quantity,
+                    expires=expires,
+                )
+            )
+        else:
+            allocation.quantity_allocated = quantity
+            allocation.expires = expires
+            to_update.append(allocation)
+    for variant_pk, allocation in allocations.items():
+        if quantities.get(variant_pk, 0) <= 0:
+            to_delete.append(allocation.pk)
+    Allocation.objects.bulk_create(to_create)
+    Allocation.objects.bulk_update(to_update, ["quantity_allocated", "expires"])
+    Allocation.objects.filter(pk__in=to_delete).delete()
+
+    changed_pks = list(to_allocate.keys() | to_release.keys())
+    if changed_pks:
+        transaction.on_commit(lambda: publish_variants_stock(changed_pks))
+
+
+def reserve_checkout_stock(checkout: Checkout):
+    """Reserve stock for the current lines of the checkout."""
+    reserve_stock(checkout, dict(checkout.lines.values_list("variant_id", "quantity")))
+
+
+def _sum_allocations(allocations: Iterable[Allocation]) -> Dict[int, int]:
+    quantities: Dict[int, int] = defaultdict(int)
+    for allocation in allocations:
+        quantities[allocation.variant_id] += allocation.quantity_allocated
+    return quantities
+
+
+@transaction.atomic
+def release_allocations(allocations: QuerySet, skip_locked: bool = False) -> int:
+    """Return reserved stock of the allocations and delete them.
+
+    Return the number of released allocations.
+    """
+    allocations = list(allocations.select_for_update(skip_locked=skip_locked))
+    if not allocations:
+        return 0
+    quantities = _sum_allocations(allocations)
+    update_variants_stock(quantities, DEALLOCATE)
+    Allocation.objects.filter(pk__in=[allocation.pk for allocation in allocations]).delete()
+
+    variant_pks = list(quantities)
+    transaction.on_commit(lambda: publish_variants_stock(variant_pks))
+    return len(allocations)
+
+
+def release_checkout_stock(checkout: Checkout) -> int:
+    return release_allocations(Allocation.objects.filter(checkout=checkout))
+
+
+def release_expired_allocations() -> int:
+    """Release allocations of abandoned and deleted checkouts, in batches.
+
+    Allocations locked by checkouts extending them are skipped, they are
+    released by a later run if they do expire.
+    """
+    released = 0
+    while True:
+        batch = Allocation.objects.filter(expires__lte=timezone.now()).order_by("pk")
+        count = release_allocations(batch[:RELEASE_BATCH_SIZE], skip_locked=True)
+        released += count
+        if count < RELEASE_BATCH_SIZE:
+            return released
+
+
+@transaction.atomic
+def fulfil_checkout_stock(checkout: Checkout):
+    """Take the reserved stock of the checkout out of the inventory.
+
+    Raise `InsufficientStock` and change nothing if stock of a variant was lowered
+    below the reserved quantity in the meantime.
+    """
+    allocations = list(Allocation.objects.select_for_update().filter(checkout=checkout))
+    quantities = _sum_allocations(allocations)
+    fulfilled_pks = update_variants_stock(quantities, FULFIL, HAS_STOCK)
+    if len(fulfilled_pks) < len(quantities):
+        raise_insufficient_stock(quantities.keys() - fulfilled_pks)
+    Allocation.objects.filter(pk__in=[allocation.pk for allocation in allocations]).delete()
+
+    variant_pks = list(quantities)
+    transaction.on_commit(lambda: publish_variants_stock(variant_pks))
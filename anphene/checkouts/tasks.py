@@ -0,0 +1,7 @@
+from config.celery_app import app
+from .stock import release_expired_allocations
+
+
+@app.task
+def release_expired_allocations_task():
+    release_expired_allocations()
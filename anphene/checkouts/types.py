@@ -5,7 +5,17 @@ from core.exceptions import PermissionDenied
 from core.graph.connection import CountableDjangoObjectType
 from core.graph.scalars import UUID
 from . import models
+from .calculations import calculate_checkout_totals, fetch_checkout_lines
 from ..core.permissions import UserPermissions
+from ..discounts.dataloaders import DiscountsByDateTimeLoader
+
+
+def resolve_checkout_totals(checkout: models.Checkout, info):
+    return (
+        DiscountsByDateTimeLoader(info.context)
+        .load(info.context.request_time)
+        .then(lambda discounts: calculate_checkout_totals(checkout, discounts))
+    )
 
 
 class Checkout(CountableDjangoObjectType):
@@ -42,9 +52,8 @@ class Checkout(CountableDjangoObjectType):
         raise PermissionDenied()
 
     @staticmethod
-    def resolve_lines(root: models.Checkout, info):
-        # TODO: after checking it
-        pass
+    def resolve_lines(root: models.Checkout, _info):
+        return fetch_checkout_lines(root)
 
     @staticmethod
     def resolve_weight(root: models.Checkout, _info):
@@ -67,20 +76,20 @@ class Checkout(CountableDjangoObjectType):
         return getattr(root, "used_balance", 0)
 
     @staticmethod
-    def resolve_total_lines(root: models.Checkout, _info):
-        return getattr(root, "total_lines", 0)
+    def resolve_total_lines(root: models.Checkout, info):
+        return resolve_checkout_totals(root, info).then(lambda totals: totals.total_lines)
 
     @staticmethod
-    def resolve_total_lines_discount(root: models.Checkout, _info):
-        return getattr(root, "total_lines_discount", 0)
+    def resolve_total_lines_discount(root: models.Checkout, info):
+        return resolve_checkout_totals(root, info).then(lambda totals: totals.total_lines_discount)
 
     @staticmethod
     def resolve_discount(root: models.Checkout, _info):
         return getattr(root, "discount", 0)
 
     @staticmethod
-    def resolve_total(root: models.Checkout, _info):
-        return getattr(root, "total", 0)
+    def resolve_total(root: models.Checkout, info):
+        return resolve_checkout_totals(root, info).then(lambda totals: totals.total)
 
 
 class CheckoutLine(CountableDjangoObjectType):
@@ -93,5 +102,7 @@ class CheckoutLine(CountableDjangoObjectType):
         only_fields = ["id", "variant", "quantity"]
 
     @staticmethod
-    def resolve_discount(root: models.CheckoutLine, _info):
-        return getattr(root, "discount", 0)
+    def resolve_discount(root: models.CheckoutLine, info):
+        return resolve_checkout_totals(root.checkout, info).then(
+            lambda totals: totals.lines[root.pk].discount
+        )
@@ -1,4 +1,5 @@
 import graphene
+from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from core.graph.mutations import (
@@ -8,7 +9,10 @@ from core.graph.mutations import (
 )
 from . import models
 from .types import Collection
+from .utils import add_products_to_collection, remove_products_from_collection
 from ..core.permissions import CollectionPermissions
+from ..menus.utils import invalidate_menu_trees
+from ..products import models as product_models
 from ..products.types.products import Product
 
 
@@ -41,6 +45,7 @@ class CollectionBulkPublish(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, queryset, is_published):
         queryset.update(is_published=is_published)
+        invalidate_menu_trees()
 
 
 class CollectionAddProducts(BaseMutation):
@@ -64,8 +69,21 @@ class CollectionAddProducts(BaseMutation):
         collection = cls.get_node_or_error(
             info, collection_id, field="collection_id", only_type=Collection
         )
-        products = cls.get_nodes_or_error(products, "products", Product)
-        collection.products.add(*products)
+        product_pks = cls.get_pks_or_error(products, "products", Product)
+        existing_pks = set(
+            product_models.Product.objects.filter(pk__in=product_pks).values_list("pk", flat=True)
+        )
+        missing_pks = [pk for pk in product_pks if pk not in existing_pks]
+        if missing_pks:
+            raise ValidationError(
+                {
+                    "products": ValidationError(
+                        f"There is no node of type {Product} with pk {missing_pks[0]}",
+                        code="graphql_error",
+                    )
+                }
+            )
+        add_products_to_collection(collection, product_pks)
 
         return CollectionAddProducts(collection=collection)
 
@@ -86,11 +104,12 @@ class CollectionRemoveProducts(BaseMutation):
         permissions = (CollectionPermissions.MANAGE_COLLECTIONS,)
 
     @classmethod
+    @transaction.atomic()
     def perform_mutation(cls, _root, info, collection_id, products):
         collection = cls.get_node_or_error(
             info, collection_id, field="collection_id", only_type=Collection
         )
-        products = cls.get_nodes_or_error(products, "products", only_type=Product)
-        collection.products.remove(*products)
+        product_pks = cls.get_pks_or_error(products, "products", only_type=Product)
+        remove_products_from_collection(collection, product_pks)
 
         return CollectionRemoveProducts(collection=collection)
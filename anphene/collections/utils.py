@@ -0,0 +1,47 @@
+from typing import Iterable, List
+
+from django.db.models import Max
+
+from .models import Collection, CollectionProduct
+
+
+def add_products_to_collection(collection: Collection, product_pks: Iterable[int]) -> List[int]:
+    """Link the products to the collection, skipping the already linked ones.
+
+    New links get consecutive sort orders after the last product of the collection,
+    in the order the products were given. Return PKs of the newly linked products.
+    """
+    # Lock the collection so concurrent additions can't reserve the same sort orders
+    Collection.objects.select_for_update().filter(pk=collection.pk).first()
+
+    product_pks = list(dict.fromkeys(product_pks))
+    linked_pks = set(
+        CollectionProduct.objects.filter(
+            collection=collection, product_id__in=product_pks
+        ).values_list("product_id", flat=True)
+    )
+    new_pks = [pk for pk in product_pks if pk not in linked_pks]
+    if not new_pks:
+        return []
+
+    max_sort_order = CollectionProduct.objects.filter(collection=collection).aggregate(
+        Max("sort_order")
+    )["sort_order__max"]
+    first_sort_order = 0 if max_sort_order is None else max_sort_order + 1
+    CollectionProduct.objects.bulk_create(
+        [
+            CollectionProduct(
+                collection=collection, product_id=product_pk, sort_order=first_sort_order + i
+            )
+            for i, product_pk in enumerate(new_pks)
+        ]
+    )
+    return new_pks
+
+
+def remove_products_from_collection(collection: Collection, product_pks: Iterable[int]) -> int:
+    """Unlink the products from the collection and return the number of removed links."""
+    deleted, _ = CollectionProduct.objects.filter(
+        collection=collection, product_id__in=list(product_pks)
+    ).delete()
+    return deleted
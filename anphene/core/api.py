@@ -4,10 +4,11 @@ from ..attributes.schema import AttributeMutations, AttributeQueries
 from ..categories.schema import CategoryMutations, CategoryQueries
 from ..collections.schema import CollectionMutations, CollectionQueries
 from ..discounts.schema import DiscountMutations, DiscountQueries
+from ..exports.schema import ExportMutations, ExportQueries
 from ..menus.schema import MenuMutations, MenuQueries
 from ..pages.schema import PageMutations, PageQueries
 from ..plugins.schema import PluginsMutations, PluginsQueries
-from ..products.schema import ProductMutations, ProductQueries
+from ..products.schema import ProductMutations, ProductQueries, ProductSubscriptions
 from ..regions.schema import RegionQueries
 from ..shipping.schema import ShippingMutations
 from ..site.schema import ShopMutations, ShopQueries
@@ -20,6 +21,7 @@ class Query(
     CategoryQueries,
     CollectionQueries,
     DiscountQueries,
+    ExportQueries,
     MenuQueries,
     PageQueries,
     PluginsQueries,
@@ -37,6 +39,7 @@ class Mutation(
     CategoryMutations,
     CollectionMutations,
     DiscountMutations,
+    ExportMutations,
     MenuMutations,
     PageMutations,
     PluginsMutations,
@@ -49,4 +52,8 @@ class Mutation(
     pass
 
 
-schema = graphene.Schema(query=Query, mutation=Mutation)
+class Subscription(ProductSubscriptions):
+    pass
+
+
+schema = graphene.Schema(query=Query, mutation=Mutation, subscription=Subscription)
@@ -0,0 +1,390 @@
+"""Deterministic catalogue used to benchmark the API.
+
+The same seed and sizes always generate the same data in an empty database,
+so results of the benchmarks can be compared across commits.
+"""
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from ...attributes.models import (
+    AssignedProductAttribute,
+    AssignedVariantAttribute,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+    AttributeVariant,
+)
+from ...categories.models import Category
+from ...collections.models import Collection, CollectionProduct
+from ...discounts import DiscountType, VoucherType
+from ...discounts.models import Sale, Voucher
+from ...menus.models import Menu, MenuItem
+from ...menus.utils import invalidate_menu_trees
+from ...products.models import Product, ProductType, ProductVariant
+from ...regions.models import SubDistrict
+from ...suppliers.models import Supplier
+from ...users.models import Address, User
+from ...users.search import update_users_search_documents
+
+BATCH_SIZE = 1000
+
+STAFF_EMAIL = "admin@example.com"
+STAFF_PASSWORD = "password"
+
+ADJECTIVES = [
+    "Classic",
+    "Cotton",
+    "Denim",
+    "Leather",
+    "Linen",
+    "Modern",
+    "Retro",
+    "Silk",
+    "Sport",
+    "Vintage",
+    "Woolen",
+]
+NOUNS = ["Bag", "Cap", "Dress", "Hoodie", "Jacket", "Scarf", "Shirt", "Shoes", "Skirt", "Sweater"]
+
+
+@dataclass(frozen=True)
+class CatalogueSize:
+    category_roots: int
+    category_depth: int
+    category_children: int
+    product_types: int
+    attributes_per_type: int
+    values_per_attribute: int
+    products: int
+    variants_per_product: int
+    collections: int
+    products_per_collection: int
+    sales: int
+    vouchers: int
+    customers: int
+
+
+CATALOGUE_SIZES = {
+    "small": CatalogueSize(
+        category_roots=3,
+        category_depth=3,
+        category_children=3,
+        product_types=5,
+        attributes_per_type=2,
+        values_per_attribute=5,
+        products=500,
+        variants_per_product=3,
+        collections=10,
+        products_per_collection=50,
+        sales=5,
+        vouchers=5,
+        customers=200,
+    ),
+    "medium": CatalogueSize(
+        category_roots=5,
+        category_depth=4,
+        category_children=4,
+        product_types=10,
+        attributes_per_type=3,
+        values_per_attribute=8,
+        products=5000,
+        variants_per_product=4,
+        collections=30,
+        products_per_collection=200,
+        sales=20,
+        vouchers=20,
+        customers=5000,
+    ),
+    "large": CatalogueSize(
+        category_roots=8,
+        category_depth=6,
+        category_children=4,
+        product_types=20,
+        attributes_per_type=4,
+        values_per_attribute=12,
+        products=50000,
+        variants_per_product=5,
+        collections=100,
+        products_per_collection=1000,
+        sales=50,
+        vouchers=50,
+        customers=50000,
+    ),
+}
+
+# Attributes of a product type with their values, as `(assignment, values)` pairs
+AttributeAssignments = List[Tuple[int, List[int]]]
+
+
+class CatalogueGenerator:
+    def __init__(self, size: CatalogueSize, seed: int = 0):
+        self.size = size
+        self.random = random.Random(seed)
+        self.now = timezone.now()
+
+    def create_categories(self) -> List[Category]:
+        """Create category trees and return their leaves."""
+        leaves = []
+
+        def create_subtree(parent, name, depth):
+            category = Category(name=name, slug=slugify(name), parent=parent)
+            category.save()
+            if depth == self.size.category_depth:
+                leaves.append(category)
+                return
+            for index in range(self.size.category_children):
+                create_subtree(category, f"{name} {index + 1}", depth + 1)
+
+        with Category.tree.disable_mptt_updates():
+            for index in range(self.size.category_roots):
+                create_subtree(None, f"Category {index + 1}", 1)
+        Category.tree.rebuild()
+        return leaves
+
+    def create_attribute(self, name: str) -> Tuple[Attribute, List[int]]:
+        attribute = Attribute.objects.create(name=name, slug=slugify(name))
+        values = AttributeValue.objects.bulk_create(
+            [
+                AttributeValue(
+                    attribute=attribute,
+                    name=f"{name} value {index + 1}",
+                    slug=f"{slugify(name)}-value-{index + 1}",
+                    sort_order=index,
+                )
+                for index in range(self.size.values_per_attribute)
+            ]
+        )
+        return attribute, [value.pk for value in values]
+
+    def create_product_types(
+        self,
+    ) -> List[Tuple[ProductType, AttributeAssignments, AttributeAssignments]]:
+        product_types = []
+        for index in range(self.size.product_types):
+            product_type = ProductType.objects.create(name=f"Product type {index + 1}")
+            product_assignments = []
+            variant_assignments = []
+            for position in range(self.size.attributes_per_type):
+                attribute, values = self.create_attribute(
+                    f"Product type {index + 1} attribute {position + 1}"
+                )
+                assignment = AttributeProduct.objects.create(
+                    attribute=attribute, product_type=product_type, sort_order=position
+                )
+                product_assignments.append((assignment.pk, values))
+
+                attribute, values = self.create_attribute(
+                    f"Product type {index + 1} variant attribute {position + 1}"
+                )
+                assignment = AttributeVariant.objects.create(
+                    attribute=attribute, product_type=product_type, sort_order=position
+                )
+                variant_assignments.append((assignment.pk, values))
+            product_types.append((product_type, product_assignments, variant_assignments))
+        return product_types
+
+    def create_products(self, categories: List[Category]) -> List[int]:
+        suppliers = Supplier.objects.bulk_create(
+            [Supplier(name=f"Supplier {index + 1}") for index in range(10)]
+        )
+        product_types = self.create_product_types()
+
+        products = []
+        product_type_by_index = []
+        for index in range(self.size.products):
+            product_type = self.random.choice(product_types)
+            name = f"{self.random.choice(ADJECTIVES)} {self.random.choice(NOUNS)} {index + 1}"
+            products.append(
+                Product(
+                    name=name,
+                    slug=slugify(name),
+                    supplier=self.random.choice(suppliers),
+                    category=self.random.choice(categories),
+                    product_type=product_type[0],
+                    is_published=self.random.random() < 0.9,
+                )
+            )
+            product_type_by_index.append(product_type)
+        products = Product.objects.bulk_create(products, batch_size=BATCH_SIZE)
+
+        variants = []
+        for product_index, product in enumerate(products):
+            for index in range(self.size.variants_per_product):
+                price = self.random.randint(10, 1000) * 1000
+                variants.append(
+                    ProductVariant(
+                        product=product,
+                        sku=f"BENCH-{product_index + 1}-{index + 1}",
+                        name=f"Variant {index + 1}",
+                        price=price,
+                        cost=int(price * self.random.uniform(0.4, 0.9)),
+                        weight=self.random.randint(100, 2000),
+                        quantity=self.random.randint(0, 100),
+                    )
+                )
+        variants = ProductVariant.objects.bulk_create(variants, batch_size=BATCH_SIZE)
+
+        product_attributes = [
+            (AssignedProductAttribute(product=product, assignment_id=assignment), values)
+            for product, (_, assignments, _) in zip(products, product_type_by_index)
+            for assignment, values in assignments
+        ]
+        self.assign_attributes(AssignedProductAttribute, product_attributes)
+
+        assignments_by_product = {
+            product.pk: variant_assignments
+            for product, (_, _, variant_assignments) in zip(products, product_type_by_index)
+        }
+        variant_attributes = [
+            (AssignedVariantAttribute(variant=variant, assignment_id=assignment), values)
+            for variant in variants
+            for assignment, values in assignments_by_product[variant.product_id]
+        ]
+        self.assign_attributes(AssignedVariantAttribute, variant_attributes)
+        return [product.pk for product in products]
+
+    def assign_attributes(self, model, assigned_attributes):
+        instances = model.objects.bulk_create(
+            [instance for instance, _ in assigned_attributes], batch_size=BATCH_SIZE
+        )
+        through = model.values.through
+        through.objects.bulk_create(
+            [
+                through(
+                    **{f"{model._meta.model_name}_id": instance.pk, "attributevalue_id": value}
+                )
+                for instance, (_, values) in zip(instances, assigned_attributes)
+                for value in self.random.sample(values, min(len(values), 2))
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+    def create_collections(self, product_ids: List[int]) -> List[Collection]:
+        collections = Collection.objects.bulk_create(
+            [
+                Collection(
+                    name=f"Collection {index + 1}",
+                    slug=f"collection-{index + 1}",
+                    is_published=True,
+                )
+                for index in range(self.size.collections)
+            ]
+        )
+        count = min(self.size.products_per_collection, len(product_ids))
+        CollectionProduct.objects.bulk_create(
+            [
+                CollectionProduct(collection=collection, product_id=product_id, sort_order=index)
+                for collection in collections
+                for index, product_id in enumerate(self.random.sample(product_ids, count))
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        return collections
+
+    def create_discounts(
+        self, categories: List[Category], collections: List[Collection], product_ids: List[int]
+    ):
+        start_date = self.now - timedelta(days=1)
+        for index in range(self.size.sales):
+            sale = Sale.objects.create(
+                name=f"Sale {index + 1}",
+                type=self.random.choice([DiscountType.FIXED, DiscountType.PERCENTAGE]),
+                value=self.random.randint(1, 50),
+                start_date=start_date,
+            )
+            sale.categories.add(*self.random.sample(categories, min(len(categories), 3)))
+            sale.collections.add(*self.random.sample(collections, min(len(collections), 2)))
+            sale.products.add(*self.random.sample(product_ids, min(len(product_ids), 20)))
+
+        for index in range(self.size.vouchers):
+            voucher = Voucher.objects.create(
+                code=f"BENCH{index + 1:04d}",
+                type=VoucherType.SPECIFIC_PRODUCT,
+                discount_value=self.random.randint(1, 50),
+                start_date=start_date,
+            )
+            voucher.categories.add(*self.random.sample(categories, min(len(categories), 3)))
+            voucher.products.add(*self.random.sample(product_ids, min(len(product_ids), 20)))
+
+    def create_users(self):
+        sub_district_ids = list(SubDistrict.objects.values_list("pk", flat=True))
+        password = make_password(STAFF_PASSWORD)
+        User.objects.create(
+            email=STAFF_EMAIL, name="Admin", password=password, is_staff=True, is_superuser=True
+        )
+
+        users = User.objects.bulk_create(
+            [
+                User(email=f"customer{index + 1}@example.com", name=f"Customer {index + 1}")
+                for index in range(self.size.customers)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        addresses = Address.objects.bulk_create(
+            [
+                Address(
+                    sub_district_id=self.random.choice(sub_district_ids),
+                    name=user.name,
+                    phone=f"+62812{index + 1:07d}",
+                    street_address=f"Jalan Benchmark {index + 1}",
+                )
+                for index, user in enumerate(users)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        through = User.addresses.through
+        through.objects.bulk_create(
+            [
+                through(user_id=user.pk, address_id=address.pk)
+                for user, address in zip(users, addresses)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        for user, address in zip(users, addresses):
+            user.default_shipping_address = address
+        User.objects.bulk_update(users, ["default_shipping_address"], batch_size=BATCH_SIZE)
+        update_users_search_documents(User.objects.values_list("pk", flat=True))
+
+    def create_navigation(self, collections: List[Collection]):
+        menu = Menu.objects.create(name="navbar")
+        for index, root in enumerate(Category.objects.filter(level=0)):
+            item = MenuItem.objects.create(
+                menu=menu, name=root.name, category=root, sort_order=index
+            )
+            for child_index, child in enumerate(root.get_children()):
+                MenuItem.objects.create(
+                    menu=menu, name=child.name, category=child, parent=item, sort_order=child_index
+                )
+        for index, collection in enumerate(collections[:5]):
+            MenuItem.objects.create(
+                menu=menu, name=collection.name, collection=collection, sort_order=100 + index
+            )
+        invalidate_menu_trees()
+
+        site_settings = Site.objects.get_current().settings
+        site_settings.top_menu = menu
+        site_settings.save(update_fields=["top_menu"])
+
+    @transaction.atomic
+    def create_catalogue(self) -> Dict[str, int]:
+        categories = self.create_categories()
+        product_ids = self.create_products(categories)
+        collections = self.create_collections(product_ids)
+        self.create_discounts(categories, collections, product_ids)
+        self.create_users()
+        self.create_navigation(collections)
+        return {
+            "categories": Category.objects.count(),
+            "products": len(product_ids),
+            "variants": ProductVariant.objects.count(),
+            "collections": len(collections),
+            "users": User.objects.count(),
+        }
@@ -0,0 +1,234 @@
+"""Representative GraphQL operations of the storefront and the dashboard."""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+import graphene
+
+from ...attributes.models import AttributeProduct
+from ...categories.models import Category
+from ...collections.models import Collection
+from ...products.models import Product
+
+
+@dataclass(frozen=True)
+class Operation:
+    name: str
+    query: str
+    # Return variables of the operation, called once the catalogue exists
+    get_variables: Callable[[], Dict] = field(default=dict)
+    staff: bool = False
+
+
+PRODUCT_LIST_FRAGMENT = """
+fragment ProductListItem on Product {
+  id
+  name
+  slug
+  thumbnail { url alt }
+  category { id name }
+  isAvailable
+  pricing {
+    onSale
+    priceRange { start stop }
+    priceRangeUndiscounted { start stop }
+  }
+}
+"""
+
+PRODUCT_LIST = (
+    PRODUCT_LIST_FRAGMENT
+    + """
+query ProductList($first: Int!, $filter: ProductFilterInput) {
+  products(first: $first, filter: $filter) {
+    totalCount
+    edges { node { ...ProductListItem } }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+)
+
+PRODUCT_DETAILS = """
+query ProductDetails($id: ID!) {
+  product(id: $id) {
+    id
+    name
+    description
+    category { id name ancestors(first: 5) { edges { node { id name } } } }
+    attributes { attribute { id name } values { id name } }
+    pricing { onSale priceRange { start stop } }
+    images { id url alt }
+    variants {
+      id
+      sku
+      name
+      quantityAvailable
+      attributes { attribute { id name } values { id name } }
+      pricing { onSale price }
+    }
+    collections { id name }
+  }
+}
+"""
+
+COLLECTION_PRODUCTS = (
+    PRODUCT_LIST_FRAGMENT
+    + """
+query CollectionProducts($id: ID!, $first: Int!) {
+  collection(id: $id) {
+    id
+    name
+    products(first: $first) { edges { node { ...ProductListItem } } }
+  }
+}
+"""
+)
+
+CATEGORY_TREE = """
+query CategoryTree {
+  categories(first: 20, level: 0) {
+    edges {
+      node {
+        id
+        name
+        children(first: 20) {
+          edges { node { id name children(first: 20) { edges { node { id name } } } } }
+        }
+      }
+    }
+  }
+}
+"""
+
+NAVIGATION = """
+query Navigation {
+  shop {
+    navigation {
+      main {
+        id
+        items {
+          id
+          name
+          category { id slug }
+          collection { id slug }
+          children { id name category { id slug } }
+        }
+      }
+    }
+  }
+}
+"""
+
+CUSTOMER_SEARCH = """
+query CustomerSearch($search: String!) {
+  customers(first: 20, filter: {search: $search}) {
+    totalCount
+    edges { node { id email name defaultShippingAddress { id streetAddress } } }
+  }
+}
+"""
+
+REGION_SEARCH = """
+query RegionSearch($search: String!) {
+  subDistricts(first: 20, filter: {search: $search}) {
+    edges { node { id name fullName } }
+  }
+}
+"""
+
+PRODUCT_BULK_PUBLISH = """
+mutation ProductBulkPublish($ids: [ID]!) {
+  productBulkPublish(ids: $ids, isPublished: true) {
+    count
+    errors { field message }
+  }
+}
+"""
+
+COLLECTION_ADD_PRODUCTS = """
+mutation CollectionAddProducts($id: ID!, $products: [ID]!) {
+  collectionAddProducts(collectionId: $id, products: $products) {
+    collection { id }
+    errors { field message }
+  }
+}
+"""
+
+
+def to_global_ids(type_name: str, pks) -> List[str]:
+    return [graphene.Node.to_global_id(type_name, pk) for pk in pks]
+
+
+def get_first_product_id() -> str:
+    return to_global_ids("Product", [Product.objects.order_by("pk").first().pk])[0]
+
+
+def get_first_collection_id() -> str:
+    return to_global_ids("Collection", [Collection.objects.order_by("pk").first().pk])[0]
+
+
+def get_attribute_filter() -> Dict:
+    assignment = AttributeProduct.objects.select_related("attribute").order_by("pk").first()
+    values = assignment.attribute.values.order_by("sort_order")[:2]
+    return {
+        "first": 20,
+        "filter": {
+            "attributes": [
+                {"slug": assignment.attribute.slug, "values": [value.slug for value in values]}
+            ]
+        },
+    }
+
+
+def get_category_filter() -> Dict:
+    root = Category.objects.filter(level=0).order_by("tree_id").first()
+    return {"first": 20, "filter": {"categories": to_global_ids("Category", [root.pk])}}
+
+
+def get_collection_products() -> Dict:
+    collection = Collection.objects.order_by("pk").first()
+    product_ids = (
+        Product.objects.exclude(collections=collection)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:50]
+    )
+    return {
+        "id": to_global_ids("Collection", [collection.pk])[0],
+        "products": to_global_ids("Product", product_ids),
+    }
+
+
+OPERATIONS = [
+    Operation(
+        "product_list", PRODUCT_LIST, lambda: {"first": 20, "filter": {"isPublished": True}},
+    ),
+    Operation("product_list_100", PRODUCT_LIST, lambda: {"first": 100}),
+    Operation("product_list_by_category", PRODUCT_LIST, get_category_filter),
+    Operation("product_list_by_attributes", PRODUCT_LIST, get_attribute_filter),
+    Operation(
+        "product_search", PRODUCT_LIST, lambda: {"first": 20, "filter": {"search": "leather"}}
+    ),
+    Operation("product_details", PRODUCT_DETAILS, lambda: {"id": get_first_product_id()}),
+    Operation(
+        "collection_products",
+        COLLECTION_PRODUCTS,
+        lambda: {"id": get_first_collection_id(), "first": 20},
+    ),
+    Operation("category_tree", CATEGORY_TREE),
+    Operation("navigation", NAVIGATION),
+    Operation("region_search", REGION_SEARCH, lambda: {"search": "bandung"}),
+    Operation("customer_search", CUSTOMER_SEARCH, lambda: {"search": "customer1"}, staff=True),
+    Operation(
+        "product_bulk_publish",
+        PRODUCT_BULK_PUBLISH,
+        lambda: {
+            "ids": to_global_ids(
+                "Product", Product.objects.order_by("pk").values_list("pk", flat=True)[:100]
+            )
+        },
+        staff=True,
+    ),
+    Operation(
+        "collection_add_products", COLLECTION_ADD_PRODUCTS, get_collection_products, staff=True
+    ),
+]
@@ -0,0 +1,93 @@
+"""Expected SQL queries of the benchmark operations.
+
+Query counts and shapes of every operation are recorded in a baseline file
+kept in the repository. Changes executing more queries, or queries of a new
+shape, fail the check until the baseline is updated on purpose.
+"""
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .operations import Operation
+from .runner import BenchmarkRunner
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "query_counts.json")
+
+# Page sizes used to check that the number of queries does not depend on them
+PAGE_SIZES = (5, 20)
+
+NORMALIZE_PATTERNS = [
+    # Server-side cursors of `iterator()` are named after the thread and a counter
+    (re.compile(r'"_django_curs_\w+"'), '"_django_curs"'),
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(\.\d+)?\b"), "?"),
+    (re.compile(r"\((?:\?, )*\?\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize_sql(sql: str) -> str:
+    """Return the shape of the query, with its values replaced by placeholders."""
+    for pattern, replacement in NORMALIZE_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+@dataclass
+class QueryProfile:
+    count: int
+    shapes: List[str]
+
+    @classmethod
+    def from_queries(cls, queries: List[str]) -> "QueryProfile":
+        return cls(count=len(queries), shapes=sorted({normalize_sql(sql) for sql in queries}))
+
+
+def profile_operation(runner: BenchmarkRunner, operation: Operation) -> QueryProfile:
+    variables = operation.get_variables()
+    # Shared caches are filled by the first execution
+    runner.execute(operation, variables)
+    return QueryProfile.from_queries(runner.execute(operation, variables))
+
+
+def get_page_size_dependent_counts(
+    runner: BenchmarkRunner, operation: Operation
+) -> Optional[List[int]]:
+    """Return query counts of the operation for all page sizes if they differ."""
+    variables = operation.get_variables()
+    if "first" not in variables:
+        return None
+    counts = []
+    for page_size in PAGE_SIZES:
+        page_variables = {**variables, "first": page_size}
+        runner.execute(operation, page_variables)
+        counts.append(len(runner.execute(operation, page_variables)))
+    return counts if len(set(counts)) > 1 else None
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, QueryProfile]:
+    with open(path) as f:
+        data = json.load(f)
+    return {name: QueryProfile(**profile) for name, profile in data.items()}
+
+
+def save_baseline(profiles: Dict[str, QueryProfile], path: str = BASELINE_PATH):
+    data = {
+        name: {"count": profile.count, "shapes": profile.shapes}
+        for name, profile in sorted(profiles.items())
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def compare_profiles(expected: QueryProfile, actual: QueryProfile) -> List[str]:
+    """Return descriptions of regressions of the actual queries."""
+    problems = []
+    if actual.count > expected.count:
+        problems.append(f"executes {actual.count} queries, expected {expected.count}")
+    for shape in sorted(set(actual.shapes) - set(expected.shapes)):
+        problems.append(f"executes a new query: {shape}")
+    return problems
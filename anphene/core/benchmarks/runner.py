@@ -0,0 +1,118 @@
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ...users.models import User
+from .data import STAFF_EMAIL
+from .operations import Operation
+
+
+# Savepoints of the benchmark and of atomic requests are not part of operations
+TRANSACTION_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+# Settings operations are benchmarked with. Rolled back executions never bump the
+# version of cached public responses, all of them would be served from the cache.
+BENCHMARK_SETTINGS = {"GRAPHQL_PUBLIC_CACHE_TIMEOUT": 0}
+
+
+class OperationFailed(Exception):
+    pass
+
+
+@dataclass
+class OperationResult:
+    name: str
+    iterations: int
+    p50: float
+    p90: float
+    p99: float
+    mean: float
+    min_queries: int
+    max_queries: int
+
+
+def get_percentiles(durations: List[float]) -> Dict[str, float]:
+    if len(durations) < 2:
+        return {"p50": durations[0], "p90": durations[0], "p99": durations[0]}
+    percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+    return {"p50": percentiles[49], "p90": percentiles[89], "p99": percentiles[98]}
+
+
+class BenchmarkRunner:
+    """Execute operations through the whole request stack of the API.
+
+    Every execution is rolled back, mutations leave the catalogue unchanged
+    and all iterations run against the same data.
+    """
+
+    def __init__(self, iterations: int = 20, warmup: int = 2):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.client = Client()
+        self.staff_client = Client()
+        self.staff_client.force_login(User.objects.get(email=STAFF_EMAIL))
+        self.url = reverse("api")
+
+    def execute(self, operation: Operation, variables: Dict) -> List[str]:
+        """Execute the operation and return SQL of the executed queries."""
+        client = self.staff_client if operation.staff else self.client
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                response = client.post(
+                    self.url,
+                    json.dumps({"query": operation.query, "variables": variables}),
+                    content_type="application/json",
+                )
+            transaction.set_rollback(True)
+
+        content = json.loads(response.content)
+        if response.status_code != 200 or content.get("errors"):
+            raise OperationFailed(f"{operation.name} failed: {content.get('errors')}")
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if not query["sql"].startswith(TRANSACTION_STATEMENTS)
+        ]
+
+    def run_operation(self, operation: Operation) -> OperationResult:
+        variables = operation.get_variables()
+        for _ in range(self.warmup):
+            self.execute(operation, variables)
+
+        durations = []
+        query_counts = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            query_counts.append(len(self.execute(operation, variables)))
+            durations.append((time.perf_counter() - start) * 1000)
+
+        return OperationResult(
+            name=operation.name,
+            iterations=self.iterations,
+            mean=statistics.mean(durations),
+            min_queries=min(query_counts),
+            max_queries=max(query_counts),
+            **get_percentiles(durations),
+        )
+
+    def run(self, operations: Iterable[Operation]) -> List[OperationResult]:
+        return [self.run_operation(operation) for operation in operations]
+
+
+def results_to_json(results: List[OperationResult], label: Optional[str] = None) -> str:
+    return json.dumps(
+        {"label": label, "results": [asdict(result) for result in results]}, indent=2
+    )
+
+
+def load_results(path: str) -> Dict[str, OperationResult]:
+    with open(path) as f:
+        data = json.load(f)
+    return {result["name"]: OperationResult(**result) for result in data["results"]}
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class DiscountsConfig(AppConfig):
     name = "anphene.discounts"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        from . import signals
@@ -3,7 +3,7 @@ from collections import defaultdict
 from core.graph.dataloader import DataLoader
 from . import DiscountInfo
 from .models import Sale
-from ..categories.models import Category
+from ..categories.utils import get_category_tree
 
 
 class DiscountsByDateTimeLoader(DataLoader):
@@ -18,13 +18,10 @@ class DiscountsByDateTimeLoader(DataLoader):
         category_map = defaultdict(set)
         for sale_pk, category_pk in categories:
             category_map[sale_pk].add(category_pk)
+        category_tree = get_category_tree()
         subcategory_map = defaultdict(set)
         for sale_pk, category_pks in category_map.items():
-            subcategory_map[sale_pk] = set(
-                Category.tree.filter(pk__in=category_pks)
-                .get_descendants(include_self=True)
-                .values_list("id", flat=True)
-            )
+            subcategory_map[sale_pk] = category_tree.get_descendant_ids(category_pks)
         return subcategory_map
 
     def fetch_collections(self, sale_pks):
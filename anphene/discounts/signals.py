@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+
+from .models import Sale
+from ..products.tasks import publish_catalogue_variants_pricing_task
+
+
+def publish_catalogue_pricing(product_pks=(), category_pks=(), collection_pks=()):
+    catalogue = [list(product_pks), list(category_pks), list(collection_pks)]
+    if any(catalogue):
+        transaction.on_commit(lambda: publish_catalogue_variants_pricing_task.delay(*catalogue))
+
+
+def publish_sale_pricing(sale: Sale):
+    publish_catalogue_pricing(
+        product_pks=sale.products.values_list("pk", flat=True),
+        category_pks=sale.categories.values_list("pk", flat=True),
+        collection_pks=sale.collections.values_list("pk", flat=True),
+    )
+
+
+def handle_sale_save(sender, instance, created, raw=False, **_kwargs):
+    # Catalogues of new sales are published once they are added
+    if not raw and not created:
+        publish_sale_pricing(instance)
+
+
+def handle_sale_delete(sender, instance, **_kwargs):
+    publish_sale_pricing(instance)
+
+
+def handle_sale_catalogue_change(sender, instance, action, reverse, pk_set, **_kwargs):
+    if action not in ("post_add", "post_remove"):
+        return
+    if reverse:
+        # A catalogue is added to or removed from sales, e.g. `product.sale_set`
+        publish_catalogue_pricing(**{CATALOGUE_KWARGS[sender]: [instance.pk]})
+    else:
+        publish_catalogue_pricing(**{CATALOGUE_KWARGS[sender]: pk_set})
+
+
+CATALOGUE_KWARGS = {
+    Sale.products.through: "product_pks",
+    Sale.categories.through: "category_pks",
+    Sale.collections.through: "collection_pks",
+}
+
+post_save.connect(handle_sale_save, sender=Sale)
+pre_delete.connect(handle_sale_delete, sender=Sale)
+for through in CATALOGUE_KWARGS:
+    m2m_changed.connect(handle_sale_catalogue_change, sender=through)
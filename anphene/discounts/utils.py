@@ -135,7 +135,7 @@ def get_products_voucher_discount(voucher, prices):
 
 
 def _fetch_categories(sale_pks):
-    from ..categories.models import Category
+    from ..categories.utils import get_category_tree
 
     categories = Sale.categories.through.objects.filter(sale_id__in=sale_pks).values_list(
         "sale_id", "category_id"
@@ -143,13 +143,10 @@ def _fetch_categories(sale_pks):
     category_map = defaultdict(set)
     for sale_pk, category_pk in categories:
         category_map[sale_pk].add(category_pk)
+    category_tree = get_category_tree()
     subcategory_map = defaultdict(set)
     for sale_pk, category_pks in category_map.items():
-        subcategory_map[sale_pk] = set(
-            Category.tree.filter(pk__in=category_pks)
-            .get_descendants(include_self=True)
-            .values_list("pk", flat=True)
-        )
+        subcategory_map[sale_pk] = category_tree.get_descendant_ids(category_pks)
     return subcategory_map
 
 
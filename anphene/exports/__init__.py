@@ -0,0 +1,34 @@
+class ExportType:
+    CUSTOMERS = "customers"
+    PRODUCTS = "products"
+    VOUCHER_USAGE = "voucher_usage"
+
+    CHOICES = [
+        (CUSTOMERS, "Customers"),
+        (PRODUCTS, "Products with their variants"),
+        (VOUCHER_USAGE, "Voucher usage"),
+    ]
+
+
+class FileFormat:
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    CHOICES = [
+        (CSV, "CSV"),
+        (JSONL, "JSON Lines"),
+    ]
+
+
+class ExportStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+    CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (SUCCESS, "Success"),
+        (FAILED, "Failed"),
+    ]
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ExportsConfig(AppConfig):
+    name = "anphene.exports"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        from . import types
@@ -0,0 +1,21 @@
+import graphene
+
+from . import ExportStatus, ExportType, FileFormat
+
+
+class ExportTypeEnum(graphene.Enum):
+    CUSTOMERS = ExportType.CUSTOMERS
+    PRODUCTS = ExportType.PRODUCTS
+    VOUCHER_USAGE = ExportType.VOUCHER_USAGE
+
+
+class FileFormatEnum(graphene.Enum):
+    CSV = FileFormat.CSV
+    JSONL = FileFormat.JSONL
+
+
+class ExportStatusEnum(graphene.Enum):
+    PENDING = ExportStatus.PENDING
+    RUNNING = ExportStatus.RUNNING
+    SUCCESS = ExportStatus.SUCCESS
+    FAILED = ExportStatus.FAILED
@@ -0,0 +1,24 @@
+# Generated by Django 3.0.8 on 2026-10-19 07:28
+
+import core.utils.storages
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exports", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="exportfile",
+            name="content_file",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=core.utils.storages.PrivateStorage(),
+                upload_to="export_files",
+            ),
+        ),
+    ]
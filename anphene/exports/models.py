@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.db import models
+
+from core.utils.storages import private_storage
+from . import ExportStatus, ExportType, FileFormat
+
+
+class ExportFile(models.Model):
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="export_files",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+    export_type = models.CharField(max_length=32, choices=ExportType.CHOICES)
+    file_format = models.CharField(max_length=8, choices=FileFormat.CHOICES)
+    status = models.CharField(
+        max_length=16, choices=ExportStatus.CHOICES, default=ExportStatus.PENDING
+    )
+    # Exports hold personal data, they are only downloaded through `views.download_export_file`
+    content_file = models.FileField(
+        upload_to="export_files", storage=private_storage, blank=True, null=True
+    )
+    total_rows = models.PositiveIntegerField(blank=True, null=True)
+    exported_rows = models.PositiveIntegerField(default=0)
+    message = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-pk",)
+
+    def __str__(self):
+        return f"{self.export_type} export {self.pk}"
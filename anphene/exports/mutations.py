@@ -0,0 +1,44 @@
+import graphene
+from django.db import transaction
+
+from core.exceptions import PermissionDenied
+from core.graph.mutations import BaseMutation
+from . import FileFormat, models
+from .enums import ExportTypeEnum, FileFormatEnum
+from .permissions import EXPORT_PERMISSIONS
+from .tasks import export_task
+from .types import ExportFile
+
+
+class ExportInput(graphene.InputObjectType):
+    export_type = ExportTypeEnum(description="Type of the exported data.", required=True)
+    file_format = FileFormatEnum(
+        description="Format of the exported file.", default_value=FileFormat.CSV
+    )
+
+
+class ExportStart(BaseMutation):
+    export_file = graphene.Field(ExportFile, description="The started export.")
+
+    class Arguments:
+        input = ExportInput(required=True, description="Fields required to start an export.")
+
+    class Meta:
+        description = (
+            "Start exporting data to a file in the background. Progress of the export "
+            "is reported by the `exportFile` query."
+        )
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        export_type = data["input"]["export_type"]
+        if not cls.check_permissions(info.context, (EXPORT_PERMISSIONS[export_type],)):
+            raise PermissionDenied()
+
+        export_file = models.ExportFile.objects.create(
+            created_by=info.context.user,
+            export_type=export_type,
+            file_format=data["input"].get("file_format") or FileFormat.CSV,
+        )
+        transaction.on_commit(lambda: export_task.delay(export_file.pk))
+        return ExportStart(export_file=export_file)
@@ -0,0 +1,21 @@
+from . import ExportType
+from ..core.permissions import DiscountPermissions, ProductPermissions, UserPermissions
+
+# Permission required to export and download each type of export
+EXPORT_PERMISSIONS = {
+    ExportType.CUSTOMERS: UserPermissions.MANAGE_CUSTOMERS,
+    ExportType.PRODUCTS: ProductPermissions.MANAGE_PRODUCTS,
+    ExportType.VOUCHER_USAGE: DiscountPermissions.MANAGE_DISCOUNTS,
+}
+
+
+def has_export_permission(user, export_type: str) -> bool:
+    return user.has_perms([EXPORT_PERMISSIONS[export_type]])
+
+
+def get_permitted_export_types(user):
+    return [
+        export_type
+        for export_type in EXPORT_PERMISSIONS
+        if has_export_permission(user, export_type)
+    ]
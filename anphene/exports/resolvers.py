@@ -0,0 +1,7 @@
+from .models import ExportFile
+from .permissions import get_permitted_export_types
+
+
+def resolve_export_files(info, **_kwargs):
+    export_types = get_permitted_export_types(info.context.user)
+    return ExportFile.objects.filter(export_type__in=export_types)
@@ -0,0 +1,31 @@
+import graphene
+
+from core.db.routers import use_primary_database
+from core.graph.fields import FilterInputConnectionField
+from .mutations import ExportStart
+from .resolvers import resolve_export_files
+from .types import ExportFile
+
+
+class ExportQueries(graphene.ObjectType):
+    export_file = graphene.Field(
+        ExportFile,
+        id=graphene.Argument(graphene.ID, description="ID of the export file.", required=True),
+        description="Look up an export file by ID.",
+    )
+    export_files = FilterInputConnectionField(
+        ExportFile, description="List of the exports the user is allowed to download."
+    )
+
+    # Exports are polled for the progress written by their tasks
+    @use_primary_database
+    def resolve_export_file(self, info, id):
+        return graphene.Node.get_node_from_global_id(info, id, ExportFile)
+
+    @use_primary_database
+    def resolve_export_files(self, info, **kwargs):
+        return resolve_export_files(info, **kwargs)
+
+
+class ExportMutations(graphene.ObjectType):
+    export_start = ExportStart.Field()
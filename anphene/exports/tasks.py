@@ -0,0 +1,28 @@
+import logging
+
+from django.utils import timezone
+
+from config.celery_app import app
+from . import ExportStatus
+from .models import ExportFile
+from .utils import export_data
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(soft_time_limit=60 * 60, time_limit=65 * 60)
+def export_task(export_file_id: int):
+    export_file = ExportFile.objects.get(pk=export_file_id)
+
+    def report_progress(exported_rows):
+        ExportFile.objects.filter(pk=export_file_id).update(
+            exported_rows=exported_rows, updated=timezone.now()
+        )
+
+    try:
+        export_data(export_file, progress=report_progress)
+    except Exception as e:
+        logger.exception("Export failed", extra={"export_file_id": export_file_id})
+        ExportFile.objects.filter(pk=export_file_id).update(
+            status=ExportStatus.FAILED, message=str(e), updated=timezone.now()
+        )
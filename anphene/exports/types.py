@@ -0,0 +1,52 @@
+import graphene
+from django.urls import reverse
+from graphene import relay
+
+from core.graph.connection import CountableDjangoObjectType
+from . import ExportStatus, models
+from .enums import ExportStatusEnum, ExportTypeEnum, FileFormatEnum
+from .permissions import has_export_permission
+
+
+class ExportFile(CountableDjangoObjectType):
+    export_type = ExportTypeEnum(description="Type of the exported data.", required=True)
+    file_format = FileFormatEnum(description="Format of the exported file.", required=True)
+    status = ExportStatusEnum(description="Status of the export.", required=True)
+    progress = graphene.Float(description="Percentage of the exported rows.", required=True)
+    url = graphene.String(description="URL of the exported file, once the export succeeded.")
+
+    class Meta:
+        description = "Represents a file with exported data, gzip compressed."
+        only_fields = [
+            "id",
+            "export_type",
+            "file_format",
+            "status",
+            "total_rows",
+            "exported_rows",
+            "message",
+            "created",
+            "updated",
+        ]
+        interfaces = [relay.Node]
+        model = models.ExportFile
+
+    @classmethod
+    def get_node(cls, info, id):
+        export_file = super().get_node(info, id)
+        if export_file and has_export_permission(info.context.user, export_file.export_type):
+            return export_file
+        return None
+
+    @staticmethod
+    def resolve_progress(root: models.ExportFile, _info):
+        if not root.total_rows:
+            return 100.0 if root.status == ExportStatus.SUCCESS else 0.0
+        return min(100.0, round(root.exported_rows / root.total_rows * 100, 2))
+
+    @staticmethod
+    def resolve_url(root: models.ExportFile, info):
+        if not root.content_file:
+            return None
+        url = reverse("export-file-download", kwargs={"pk": root.pk})
+        return info.context.build_absolute_uri(url)
@@ -0,0 +1,224 @@
+import csv
+import gzip
+import json
+import secrets
+import tempfile
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from . import ExportStatus, ExportType, FileFormat
+from .models import ExportFile
+from ..discounts.models import VoucherCustomer
+from ..products.models import ProductVariant
+from ..users.models import User
+
+CHUNK_SIZE = 2000
+
+
+class Exporter(NamedTuple):
+    headers: List[str]
+    get_queryset: Callable[[], QuerySet]
+    # Return rows of objects of the queryset, ordered the same way as headers
+    get_rows: Callable[[QuerySet], Iterator[list]]
+
+
+def iterate_by_keyset(queryset: QuerySet, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Iterate over the queryset in chunks of primary key ordered objects.
+
+    Each chunk is a cheap index range scan, no matter how far the export is.
+    """
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield from chunk
+        last_pk = chunk[-1].pk
+
+
+def get_customers_queryset() -> QuerySet:
+    return User.objects.customers().select_related("default_shipping_address__sub_district")
+
+
+def get_customers_rows(queryset: QuerySet) -> Iterator[list]:
+    # Server side cursor, users are streamed without being cached by the queryset
+    for user in queryset.order_by("pk").iterator(chunk_size=CHUNK_SIZE):
+        address = user.default_shipping_address
+        yield [
+            user.pk,
+            user.email,
+            user.name,
+            user.is_active,
+            user.date_joined,
+            user.balance,
+            user.note,
+            str(address.phone) if address else "",
+            address.street_address if address else "",
+            address.sub_district.full_name if address else "",
+            address.postal_code if address else "",
+        ]
+
+
+def get_products_queryset() -> QuerySet:
+    return ProductVariant.objects.select_related(
+        "product__category", "product__product_type", "product__supplier"
+    )
+
+
+def get_products_rows(queryset: QuerySet) -> Iterator[list]:
+    for variant in iterate_by_keyset(queryset):
+        product = variant.product
+        yield [
+            product.pk,
+            product.name,
+            product.slug,
+            product.is_published,
+            product.category.name if product.category else "",
+            product.product_type.name,
+            product.supplier.name if product.supplier else "",
+            variant.pk,
+            variant.sku,
+            variant.name,
+            variant.price,
+            variant.cost,
+            variant.quantity,
+            variant.quantity_allocated,
+            variant.weight,
+        ]
+
+
+def get_voucher_usage_queryset() -> QuerySet:
+    return VoucherCustomer.objects.select_related("voucher")
+
+
+def get_voucher_usage_rows(queryset: QuerySet) -> Iterator[list]:
+    for voucher_customer in queryset.order_by("pk").iterator(chunk_size=CHUNK_SIZE):
+        voucher = voucher_customer.voucher
+        yield [
+            voucher.code,
+            voucher.type,
+            voucher.discount_type,
+            voucher.discount_value,
+            voucher.used,
+            voucher.usage_limit,
+            voucher.start_date,
+            voucher.end_date,
+            voucher_customer.customer_email,
+        ]
+
+
+EXPORTERS = {
+    ExportType.CUSTOMERS: Exporter(
+        headers=[
+            "id",
+            "email",
+            "name",
+            "is_active",
+            "date_joined",
+            "balance",
+            "note",
+            "phone",
+            "street_address",
+            "sub_district",
+            "postal_code",
+        ],
+        get_queryset=get_customers_queryset,
+        get_rows=get_customers_rows,
+    ),
+    ExportType.PRODUCTS: Exporter(
+        headers=[
+            "product_id",
+            "product_name",
+            "product_slug",
+            "is_published",
+            "category",
+            "product_type",
+            "supplier",
+            "variant_id",
+            "sku",
+            "variant_name",
+            "price",
+            "cost",
+            "quantity",
+            "quantity_allocated",
+            "weight",
+        ],
+        get_queryset=get_products_queryset,
+        get_rows=get_products_rows,
+    ),
+    ExportType.VOUCHER_USAGE: Exporter(
+        headers=[
+            "code",
+            "type",
+            "discount_type",
+            "discount_value",
+            "used",
+            "usage_limit",
+            "start_date",
+            "end_date",
+            "customer_email",
+        ],
+        get_queryset=get_voucher_usage_queryset,
+        get_rows=get_voucher_usage_rows,
+    ),
+}
+
+
+def write_csv(stream, headers: List[str], rows: Iterator[list]) -> Iterator[None]:
+    writer = csv.writer(stream)
+    writer.writerow(headers)
+    for row in rows:
+        writer.writerow(row)
+        yield
+
+
+def write_jsonl(stream, headers: List[str], rows: Iterator[list]) -> Iterator[None]:
+    for row in rows:
+        stream.write(json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder))
+        stream.write("\n")
+        yield
+
+
+WRITERS = {FileFormat.CSV: write_csv, FileFormat.JSONL: write_jsonl}
+
+
+def get_export_file_name(export_file: ExportFile) -> str:
+    date = timezone.now().strftime("%Y%m%d%H%M%S")
+    token = secrets.token_hex(16)
+    return f"{export_file.export_type}-{date}-{token}.{export_file.file_format}.gz"
+
+
+def export_data(export_file: ExportFile, progress: Optional[Callable[[int], None]] = None):
+    """Write all rows of the export to a gzipped file in the private storage.
+
+    Rows are streamed from the database to a temporary file, memory usage does
+    not depend on the number of exported rows.
+    """
+    exporter = EXPORTERS[export_file.export_type]
+    write = WRITERS[export_file.file_format]
+    queryset = exporter.get_queryset()
+
+    ExportFile.objects.filter(pk=export_file.pk).update(
+        status=ExportStatus.RUNNING, total_rows=queryset.count(), updated=timezone.now()
+    )
+    exported_rows = 0
+    with tempfile.TemporaryFile() as temporary_file:
+        with gzip.open(temporary_file, "wt", encoding="utf-8", newline="") as stream:
+            for _ in write(stream, exporter.headers, exporter.get_rows(queryset)):
+                exported_rows += 1
+                if progress and exported_rows % CHUNK_SIZE == 0:
+                    progress(exported_rows)
+        temporary_file.seek(0)
+        export_file.content_file.save(
+            get_export_file_name(export_file), File(temporary_file), save=False
+        )
+
+    export_file.status = ExportStatus.SUCCESS
+    export_file.exported_rows = exported_rows
+    export_file.save(update_fields=["content_file", "status", "exported_rows", "updated"])
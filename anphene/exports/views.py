@@ -0,0 +1,28 @@
+import os
+
+from django.http import FileResponse, Http404
+
+from . import ExportStatus
+from .models import ExportFile
+from .permissions import has_export_permission
+
+
+def download_export_file(request, pk):
+    """Stream an exported file to a user permitted to export its type.
+
+    Files are kept in the private storage, they are never served from a URL.
+    """
+    try:
+        export_file = ExportFile.objects.get(pk=pk, status=ExportStatus.SUCCESS)
+    except ExportFile.DoesNotExist:
+        raise Http404
+    if not export_file.content_file or not has_export_permission(
+        request.user, export_file.export_type
+    ):
+        raise Http404
+    return FileResponse(
+        export_file.content_file.open("rb"),
+        as_attachment=True,
+        filename=os.path.basename(export_file.content_file.name),
+        content_type="application/gzip",
+    )
@@ -5,6 +5,5 @@ class MenusConfig(AppConfig):
     name = "anphene.menus"
 
     def ready(self):
-        pass
         # noinspection PyUnresolvedReferences
-        # from . import types
+        from . import signals
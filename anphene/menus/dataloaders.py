@@ -2,6 +2,7 @@ from collections import defaultdict
 
 from core.graph.dataloader import DataLoader
 from .models import Menu, MenuItem
+from .utils import get_menu_trees
 
 
 class MenuByIdLoader(DataLoader):
@@ -20,15 +21,14 @@ class MenuItemByIdLoader(DataLoader):
         return [menu_items.get(menu_item_id) for menu_item_id in keys]
 
 
-class MenuItemsByParentMenuLoader(DataLoader):
-    context_key = "menuitems_by_parent_menu"
+class MenuItemTreeByMenuIdLoader(DataLoader):
+    """Load top level items of menus with their whole subtrees prebuilt."""
+
+    context_key = "menuitem_tree_by_menu"
 
     def batch_load(self, keys):
-        menu_items = MenuItem.objects.filter(menu_id__in=keys, level=0)
-        items_map = defaultdict(list)
-        for menu_item in menu_items:
-            items_map[menu_item.menu_id].append(menu_item)
-        return [items_map[menu_id] for menu_id in keys]
+        trees = get_menu_trees(keys)
+        return [trees[menu_id] for menu_id in keys]
 
 
 class MenuItemChildrenLoader(DataLoader):
@@ -6,6 +6,7 @@ from core.graph.mutations import BaseMutation, ModelDeleteMutation, ModelMutatio
 from . import models
 from .enums import NavigationType
 from .types import Menu, MenuItem
+from .utils import invalidate_menu_trees
 from ..categories import models as categories_models
 from ..categories.types import Category
 from ..collections import models as collections_models
@@ -245,6 +246,7 @@ class MenuItemMove(BaseMutation):
         for idx, item in enumerate(qs):
             item.sort_order = idx
         models.MenuItem.objects.bulk_update(qs, ["sort_order"])
+        invalidate_menu_trees()
         menu.refresh_from_db()
 
         return MenuItemMove(menu=menu)
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+
+from .models import Menu, MenuItem
+from .utils import invalidate_menu_trees
+from ..categories.models import Category
+from ..collections.models import Collection
+from ..pages.models import Page
+
+
+def invalidate_menu_trees_handler(**_kwargs):
+    invalidate_menu_trees()
+
+
+# Cached trees embed the linked categories, collections and pages.
+for model in (Menu, MenuItem, Category, Collection, Page):
+    post_save.connect(invalidate_menu_trees_handler, sender=model)
+    post_delete.connect(invalidate_menu_trees_handler, sender=model)
@@ -1,3 +1,5 @@
+import datetime
+
 import graphene
 from graphene import relay
 
@@ -7,12 +9,22 @@ from .dataloaders import (
     MenuByIdLoader,
     MenuItemByIdLoader,
     MenuItemChildrenLoader,
-    MenuItemsByParentMenuLoader,
+    MenuItemTreeByMenuIdLoader,
 )
+from .utils import CHILDREN_ATTR
+from ..core.permissions import PagePermissions
 from ..pages.dataloaders import PageByIdLoader
+from ..pages.models import Page
 from ..products.dataloaders import CategoryByIdLoader, CollectionByIdLoader
 
 
+def is_page_visible_to_user(page: Page, user) -> bool:
+    if Page.objects.user_has_access_to_all(user, PagePermissions.MANAGE_PAGES):
+        return True
+    today = datetime.date.today()
+    return page.is_published and (page.publication_date is None or page.publication_date <= today)
+
+
 class Menu(CountableDjangoObjectType):
     items = graphene.List(lambda: MenuItem)
     is_main_navigation = graphene.Boolean(description="Is this menu the main navigation.")
@@ -31,7 +43,7 @@ class Menu(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_items(root: models.Menu, info, **_kwargs):
-        return MenuItemsByParentMenuLoader(info.context).load(root.id)
+        return MenuItemTreeByMenuIdLoader(info.context).load(root.id)
 
     @staticmethod
     def resolve_is_main_navigation(root: models.Menu, info, **_kwargs):
@@ -71,16 +83,22 @@ class MenuItem(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_category(root: models.MenuItem, info, **_kwargs):
+        if models.MenuItem.category.is_cached(root):
+            return root.category
         if root.category_id:
             return CategoryByIdLoader(info.context).load(root.category_id)
         return None
 
     @staticmethod
     def resolve_children(root: models.MenuItem, info, **_kwargs):
+        if hasattr(root, CHILDREN_ATTR):
+            return getattr(root, CHILDREN_ATTR)
         return MenuItemChildrenLoader(info.context).load(root.id)
 
     @staticmethod
     def resolve_collection(root: models.MenuItem, info, **_kwargs):
+        if models.MenuItem.collection.is_cached(root):
+            return root.collection
         if root.collection_id:
             return CollectionByIdLoader(info.context).load(root.collection_id)
         return None
@@ -99,6 +117,12 @@ class MenuItem(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_page(root: models.MenuItem, info, **kwargs):
+        if models.MenuItem.page.is_cached(root):
+            # Menu trees are shared by all users, pages are filtered as by the loader
+            page = root.page
+            if page is None or is_page_visible_to_user(page, info.context.user):
+                return page
+            return None
         if root.page_id:
             return PageByIdLoader(info.context).load(root.page_id)
         return None
@@ -0,0 +1,59 @@
+from typing import Dict, Iterable, List
+
+from core.utils.cache import bump_cache_version, get_or_set_many_versioned
+from .models import MenuItem
+
+MENU_TREE_CACHE_NAMESPACE = "menu_tree"
+
+# Attribute of a menu item holding the list of its children in a prebuilt tree.
+CHILDREN_ATTR = "tree_children"
+
+
+def _sort_key(menu_item: MenuItem):
+    # Same order as `MenuItem.Meta.ordering`, items without sort order go last
+    return menu_item.sort_order is None, menu_item.sort_order or 0, menu_item.pk
+
+
+def build_menu_trees(menu_ids: Iterable[int]) -> Dict[int, List[MenuItem]]:
+    """Fetch all items of given menus in a single query and nest them.
+
+    Return top level items of each menu. Every item has its sorted children
+    stored under `CHILDREN_ATTR` and its linked category, collection and page
+    already fetched.
+    """
+    menu_ids = list(menu_ids)
+    menu_items = (
+        MenuItem.objects.filter(menu_id__in=menu_ids)
+        .select_related("category", "collection", "page")
+        .order_by("tree_id", "lft")
+    )
+    trees: Dict[int, List[MenuItem]] = {menu_id: [] for menu_id in menu_ids}
+    items_by_id = {}
+    # Tree ordering guarantees parents are visited before their children
+    for menu_item in menu_items:
+        setattr(menu_item, CHILDREN_ATTR, [])
+        items_by_id[menu_item.pk] = menu_item
+        parent = items_by_id.get(menu_item.parent_id)
+        if parent is not None:
+            getattr(parent, CHILDREN_ATTR).append(menu_item)
+        else:
+            trees[menu_item.menu_id].append(menu_item)
+
+    for menu_item in items_by_id.values():
+        getattr(menu_item, CHILDREN_ATTR).sort(key=_sort_key)
+    for items in trees.values():
+        items.sort(key=_sort_key)
+    return trees
+
+
+def get_menu_trees(menu_ids: Iterable[int]) -> Dict[int, List[MenuItem]]:
+    """Return prebuilt item trees of given menus, shared across requests.
+
+    Trees are kept until any menu, menu item or linked category, collection
+    or page changes.
+    """
+    return get_or_set_many_versioned(MENU_TREE_CACHE_NAMESPACE, menu_ids, build_menu_trees)
+
+
+def invalidate_menu_trees():
+    bump_cache_version(MENU_TREE_CACHE_NAMESPACE)
@@ -6,6 +6,7 @@ from core.graph.mutations import (
 )
 from . import models
 from ..core.permissions import PagePermissions
+from ..menus.utils import invalidate_menu_trees
 
 
 class PageBulkDelete(ModelBulkDeleteMutation):
@@ -35,3 +36,4 @@ class PageBulkPublish(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, queryset, is_published):
         queryset.update(is_published=is_published)
+        invalidate_menu_trees()
@@ -152,9 +152,14 @@ class BasePlugin:
     def fetch_shipping_costs(
         self, address: "Address", weight: int, previous_value: list
     ) -> List["Courier"]:
+        """Return couriers delivering to the address, or a coroutine of them.
+
+        Coroutines of external requests are awaited by the GraphQL executor.
+        """
         return NotImplemented
 
     def fetch_waybill(
         self, waybill: str, courier: str, previous_value: "Waybill"
     ) -> Optional["Waybill"]:
+        """Return the waybill of the courier, or a coroutine of it."""
         return NotImplemented
@@ -6,4 +6,4 @@ class ProductsConfig(AppConfig):
 
     def ready(self):
         # noinspection PyUnresolvedReferences
-        pass
+        from . import signals
@@ -10,6 +10,7 @@ from .products import (
     ImagesByProductIdLoader,
     ImagesByProductVariantIdLoader,
     ProductByIdLoader,
+    ProductCostsDataByProductIdLoader,
     ProductVariantByIdLoader,
     ProductVariantsByProductIdLoader,
 )
@@ -22,6 +23,7 @@ __all__ = [
     "ImagesByProductIdLoader",
     "ImagesByProductVariantIdLoader",
     "ProductByIdLoader",
+    "ProductCostsDataByProductIdLoader",
     "ProductVariantByIdLoader",
     "ProductVariantsByProductIdLoader",
     "SelectedAttributesByProductIdLoader",
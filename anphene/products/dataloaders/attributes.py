@@ -7,11 +7,11 @@ from .products import ProductByIdLoader, ProductVariantByIdLoader
 from ...attributes.models import (
     AssignedProductAttribute,
     AssignedVariantAttribute,
-    Attribute,
     AttributeProduct,
     AttributeValue,
     AttributeVariant,
 )
+from ...attributes.utils import get_attribute_schemas
 from ...core.permissions import ProductPermissions
 
 
@@ -26,48 +26,32 @@ class AttributeValuesByAttributeIdLoader(DataLoader):
         return [attribute_to_attributevalues[attribute_id] for attribute_id in keys]
 
 
-class AttributesByAttributeId(DataLoader):
-    context_key = "attributes_by_id"
-
-    def batch_load(self, keys):
-        attributes = Attribute.objects.in_bulk(keys)
-        return [attributes.get(key) for key in keys]
-
-
-class AttributeProductsByProductTypeIdLoader(DataLoader):
-    context_key = "attributeproducts_by_producttype"
+class BaseAttributeSchemaByProductTypeIdLoader(DataLoader):
+    model = None
 
     def batch_load(self, keys):
+        schemas = get_attribute_schemas(self.model, keys)
         user = self.user
         if user.is_active and user.has_perm(ProductPermissions.MANAGE_PRODUCTS):
-            qs = AttributeProduct.objects.all()
-        else:
-            qs = AttributeProduct.objects.filter(attribute__visible_in_storefront=True)
-        attribute_products = qs.filter(product_type_id__in=keys)
-        producttype_to_attributeproducts = defaultdict(list)
-        for attribute_product in attribute_products:
-            producttype_to_attributeproducts[attribute_product.product_type_id].append(
-                attribute_product
-            )
-        return [producttype_to_attributeproducts[key] for key in keys]
+            return [schemas[key] for key in keys]
+        return [
+            [
+                (assignment_id, attribute)
+                for assignment_id, attribute in schemas[key]
+                if attribute.visible_in_storefront
+            ]
+            for key in keys
+        ]
 
 
-class AttributeVariantsByProductTypeIdLoader(DataLoader):
-    context_key = "attributevariants_by_producttype"
+class AttributeProductSchemaByProductTypeIdLoader(BaseAttributeSchemaByProductTypeIdLoader):
+    context_key = "attributeproductschema_by_producttype"
+    model = AttributeProduct
 
-    def batch_load(self, keys):
-        user = self.user
-        if user.is_active and user.has_perm(ProductPermissions.MANAGE_PRODUCTS):
-            qs = AttributeVariant.objects.all()
-        else:
-            qs = AttributeVariant.objects.filter(attribute__visible_in_storefront=True)
-        attribute_variants = qs.filter(product_type_id__in=keys)
-        producttype_to_attributevariants = defaultdict(list)
-        for attribute_variant in attribute_variants:
-            producttype_to_attributevariants[attribute_variant.product_type_id].append(
-                attribute_variant
-            )
-        return [producttype_to_attributevariants[key] for key in keys]
+
+class AttributeVariantSchemaByProductTypeIdLoader(BaseAttributeSchemaByProductTypeIdLoader):
+    context_key = "attributevariantschema_by_producttype"
+    model = AttributeVariant
 
 
 class AssignedProductAttributesByProductIdLoader(DataLoader):
@@ -174,6 +158,23 @@ class AttributeValuesByAssignedVariantAttributeIdLoader(DataLoader):
         )
 
 
+def get_selected_attributes(schema, assignments, attribute_values):
+    """Return the attributes of the schema along with the values assigned to them.
+
+    `assignments` maps the product type assignment IDs to the product or variant
+    assigned attributes.
+    """
+    selected_attributes = []
+    for assignment_id, attribute in schema:
+        assigned_attribute = assignments.get(assignment_id)
+        if assigned_attribute:
+            values = attribute_values[assigned_attribute.id]
+        else:
+            values = []
+        selected_attributes.append({"values": values, "attribute": attribute})
+    return selected_attributes
+
+
 class SelectedAttributesByProductIdLoader(DataLoader):
     context_key = "selectedattributes_by_product"
 
@@ -181,59 +182,32 @@ class SelectedAttributesByProductIdLoader(DataLoader):
         def with_products_and_assigned_attributed(result):
             products, product_attributes = result
             assigned_product_attribute_ids = [a.id for attrs in product_attributes for a in attrs]
-            product_type_ids = list({p.product_type_id for p in products})
-            product_attributes = dict(zip(keys, product_attributes))
-
-            def with_attributeproducts_and_values(result):
-                attribute_products, attribute_values = result
-                attribute_ids = list({ap.attribute_id for aps in attribute_products for ap in aps})
-                attribute_products = dict(zip(product_type_ids, attribute_products))
+            product_type_ids = list({p.product_type_id for p in products if p})
+            product_attributes = {
+                key: {apa.assignment_id: apa for apa in attrs}
+                for key, attrs in zip(keys, product_attributes)
+            }
+
+            def with_schemas_and_values(result):
+                schemas, attribute_values = result
+                schemas = dict(zip(product_type_ids, schemas))
                 attribute_values = dict(zip(assigned_product_attribute_ids, attribute_values))
+                return [
+                    get_selected_attributes(
+                        schemas[product.product_type_id], product_attributes[key], attribute_values
+                    )
+                    if product
+                    else []
+                    for key, product in zip(keys, products)
+                ]
 
-                def with_attributes(attributes):
-                    id_to_attribute = dict(zip(attribute_ids, attributes))
-                    selected_attributes_map = defaultdict(list)
-                    for key, product in zip(keys, products):
-                        assigned_producttype_attributes = attribute_products[
-                            product.product_type_id
-                        ]
-                        assigned_product_attributes = product_attributes[key]
-                        for assigned_producttype_attribute in assigned_producttype_attributes:
-                            product_assignment = next(
-                                (
-                                    apa
-                                    for apa in assigned_product_attributes
-                                    if apa.assignment_id == assigned_producttype_attribute.id
-                                ),
-                                None,
-                            )
-                            attribute = id_to_attribute[
-                                assigned_producttype_attribute.attribute_id
-                            ]
-                            if product_assignment:
-                                values = attribute_values[product_assignment.id]
-                            else:
-                                values = []
-                            selected_attributes_map[key].append(
-                                {"values": values, "attribute": attribute}
-                            )
-                    return [selected_attributes_map[key] for key in keys]
-
-                return (
-                    AttributesByAttributeId(self.context)
-                    .load_many(attribute_ids)
-                    .then(with_attributes)
-                )
-
-            attribute_products = AttributeProductsByProductTypeIdLoader(self.context).load_many(
+            schemas = AttributeProductSchemaByProductTypeIdLoader(self.context).load_many(
                 product_type_ids
             )
             attribute_values = AttributeValuesByAssignedProductAttributeIdLoader(
                 self.context
             ).load_many(assigned_product_attribute_ids)
-            return Promise.all([attribute_products, attribute_values]).then(
-                with_attributeproducts_and_values
-            )
+            return Promise.all([schemas, attribute_values]).then(with_schemas_and_values)
 
         products = ProductByIdLoader(self.context).load_many(keys)
         assigned_attributes = AssignedProductAttributesByProductIdLoader(self.context).load_many(
@@ -251,62 +225,42 @@ class SelectedAttributesByProductVariantIdLoader(DataLoader):
     def batch_load(self, keys):
         def with_variants_and_assigned_attributed(results):
             product_variants, variant_attributes = results
-            product_ids = list({v.product_id for v in product_variants})
+            product_ids = list({v.product_id for v in product_variants if v})
             assigned_variant_attribute_ids = [a.id for attrs in variant_attributes for a in attrs]
-            variant_attributes = dict(zip(keys, variant_attributes))
+            variant_attributes = {
+                key: {ava.assignment_id: ava for ava in attrs}
+                for key, attrs in zip(keys, variant_attributes)
+            }
 
             def with_products_and_attribute_values(results):
                 products, attribute_values = results
-                product_type_ids = list({p.product_type_id for p in products})
+                product_type_ids = list({p.product_type_id for p in products if p})
                 products = dict(zip(product_ids, products))
                 attribute_values = dict(zip(assigned_variant_attribute_ids, attribute_values))
 
-                def with_attribute_products(attribute_products):
-                    attribute_ids = list(
-                        {ap.attribute_id for aps in attribute_products for ap in aps}
-                    )
-                    attribute_products = dict(zip(product_type_ids, attribute_products))
-
-                    def with_attributes(attributes):
-                        id_to_attribute = dict(zip(attribute_ids, attributes))
-                        selected_attributes_map = defaultdict(list)
-                        for key, product_variant in zip(keys, product_variants):
-                            product = products[product_variant.product_id]
-                            assigned_producttype_attributes = attribute_products[
-                                product.product_type_id
-                            ]
-                            assigned_variant_attributes = variant_attributes[key]
-                            for assigned_producttype_attribute in assigned_producttype_attributes:
-                                variant_assignment = next(
-                                    (
-                                        apa
-                                        for apa in assigned_variant_attributes
-                                        if apa.assignment_id == assigned_producttype_attribute.id
-                                    ),
-                                    None,
-                                )
-                                attribute = id_to_attribute[
-                                    assigned_producttype_attribute.attribute_id
-                                ]
-                                if variant_assignment:
-                                    values = attribute_values[variant_assignment.id]
-                                else:
-                                    values = []
-                                selected_attributes_map[key].append(
-                                    {"values": values, "attribute": attribute}
-                                )
-                        return [selected_attributes_map[key] for key in keys]
-
-                    return (
-                        AttributesByAttributeId(self.context)
-                        .load_many(attribute_ids)
-                        .then(with_attributes)
-                    )
+                def with_schemas(schemas):
+                    schemas = dict(zip(product_type_ids, schemas))
+                    selected_attributes = []
+                    for key, product_variant in zip(keys, product_variants):
+                        product = (
+                            products.get(product_variant.product_id) if product_variant else None
+                        )
+                        if not product:
+                            selected_attributes.append([])
+                            continue
+                        selected_attributes.append(
+                            get_selected_attributes(
+                                schemas[product.product_type_id],
+                                variant_attributes[key],
+                                attribute_values,
+                            )
+                        )
+                    return selected_attributes
 
                 return (
-                    AttributeVariantsByProductTypeIdLoader(self.context)
+                    AttributeVariantSchemaByProductTypeIdLoader(self.context)
                     .load_many(product_type_ids)
-                    .then(with_attribute_products)
+                    .then(with_schemas)
                 )
 
             products = ProductByIdLoader(self.context).load_many(product_ids)
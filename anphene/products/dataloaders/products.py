@@ -2,6 +2,7 @@ from collections import defaultdict
 
 from core.graph.dataloader import DataLoader
 from ..models import Product, ProductImage, ProductVariant, VariantImage
+from ..utils.costs import get_costs_data_from_prices
 from ...categories.models import Category
 from ...collections.models import Collection, CollectionProduct
 from ...core.permissions import ProductPermissions
@@ -88,6 +89,19 @@ class ProductVariantsByProductIdLoader(DataLoader):
         return [variant_map.get(product_id, []) for product_id in keys]
 
 
+class ProductCostsDataByProductIdLoader(DataLoader):
+    context_key = "productcostsdata_by_product"
+
+    def batch_load(self, keys):
+        variant_prices = ProductVariant.objects.filter(product_id__in=keys).values_list(
+            "product_id", "cost", "price"
+        )
+        prices_map = defaultdict(list)
+        for product_id, cost, price in variant_prices.iterator():
+            prices_map[product_id].append((cost, price))
+        return [get_costs_data_from_prices(prices_map[product_id]) for product_id in keys]
+
+
 class CollectionByIdLoader(DataLoader):
     context_key = "collection_by_id"
 
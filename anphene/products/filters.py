@@ -18,9 +18,10 @@ from core.utils.filters import (
 )
 from .enums import ProductTypeConfigurable, StockAvailability
 from .models import Product, ProductType, ProductVariant
-from ..attributes.models import Attribute
+from ..attributes.models import Attribute, AssignedProductAttribute, AssignedVariantAttribute
 from ..attributes.types import AttributeInput
 from ..categories import types as categories_types
+from ..categories.utils import get_category_tree
 from ..collections import types as collections_types
 from ..core.filters import (
     filter_not_in_sales,
@@ -96,14 +97,22 @@ def _clean_product_attributes_filter_input(filter_value):
 def filter_products_by_attributes_values(qs, queries):
     # Combine filters of the same attribute with OR operator
     # and then combine full query with AND operator.
+    # Assigned values are matched with subqueries, joins would duplicate products.
     combine_and = [
-        Q(**{"attributes__values__pk__in": values_pk})
-        | Q(**{"variants__attributes__values__pk__in": values_pk})
+        Q(
+            pk__in=AssignedProductAttribute.objects.filter(values__pk__in=values_pk).values(
+                "product_id"
+            )
+        )
+        | Q(
+            pk__in=AssignedVariantAttribute.objects.filter(values__pk__in=values_pk).values(
+                "variant__product_id"
+            )
+        )
         for _, values_pk in queries.items()
     ]
     query = functools.reduce(operator.and_, combine_and)
-    qs = qs.filter(query).distinct()
-    return qs
+    return qs.filter(query)
 
 
 def filter_products_by_attributes(qs, filter_value):
@@ -144,15 +153,14 @@ def filter_stock_availability(qs, _, value):
 def filter_search(qs, _, value):
     if value:
         search = picker.pick_backend()
-        qs &= search(value).distinct()
+        qs &= search(value)
     return qs
 
 
 def filter_categories(qs, _, value):
     if value:
         categories = get_nodes(value, categories_types.Category)
-        categories = [category.get_descendants(include_self=True) for category in categories]
-        ids = {category.id for tree in categories for category in tree}
+        ids = get_category_tree().get_descendant_ids(category.pk for category in categories)
         qs = filter_by_include_ids(qs, ids, "category")
     return qs
 
@@ -0,0 +1,55 @@
+import os
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from core.utils.thumbnails import warm_images
+
+# Models with images, as `(model label, image field, rendition key set)`
+THUMBNAIL_SOURCES = [
+    ("products.ProductImage", "image", "products"),
+    ("categories.Category", "background_image", "background_images"),
+    ("collections.Collection", "background_image", "background_images"),
+]
+
+
+class Command(BaseCommand):
+    help = "Create missing thumbnails of all images in the media library."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            choices=[label for label, _, _ in THUMBNAIL_SOURCES],
+            help="Only backfill images of the given model, can be used multiple times.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Number of processes creating thumbnails.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of images processed by a worker at once.",
+        )
+
+    def handle(self, *args, **options):
+        models = options["models"]
+        for model_label, image_attr, rendition_key_set in THUMBNAIL_SOURCES:
+            if models and model_label not in models:
+                continue
+            self.stdout.write(f"Creating missing thumbnails for {model_label}")
+            num_created, failed_to_create = warm_images(
+                apps.get_model(model_label).objects.all(),
+                rendition_key_set,
+                image_attr=image_attr,
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+            )
+            self.stdout.write(f"Created {num_created} thumbnails")
+            for path in failed_to_create:
+                self.stderr.write(f"Failed to create {path}")
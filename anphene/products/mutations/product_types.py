@@ -17,6 +17,7 @@ from ...attributes import AttributeInputType, models as attributes_models
 from ...attributes.enums import AttributeTypeEnum
 from ...attributes.mutations import ReorderInput
 from ...attributes.types import Attribute
+from ...attributes.utils import invalidate_attribute_schemas
 from ...core.permissions import ProductPermissions
 
 
@@ -161,6 +162,8 @@ class ProductTypeReorderAttributes(BaseMutation):
 
         with transaction.atomic():
             perform_reordering(attributes_m2m, operations)
+            # Reordering updates the assignments in bulk, without emitting signals
+            invalidate_attribute_schemas()
         return ProductTypeReorderAttributes(product_type=product_type)
 
 
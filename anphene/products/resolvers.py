@@ -1,7 +1,13 @@
+from graphql.error import GraphQLError
+
+from core.graph.subscriptions import subscribe_to_channels
 from core.graph.utils import get_database_id
 from . import models
+from .subscriptions import get_variant_channel
 from ..core.permissions import ProductPermissions
 
+MAX_SUBSCRIBED_VARIANTS = 100
+
 
 def resolve_product_types(_info, **_kwargs):
     return models.ProductType.objects.all()
@@ -11,7 +17,7 @@ def resolve_products(info, **_kwargs):
     user = info.context.user
     qs = models.Product.objects.visible_to_user(user, ProductPermissions.MANAGE_PRODUCTS)
 
-    return qs.distinct()
+    return qs
 
 
 def resolve_product_variants(info, ids=None):
@@ -26,6 +32,17 @@ def resolve_product_variants(info, ids=None):
     return qs
 
 
+def resolve_product_variants_updated(info, ids):
+    if len(ids) > MAX_SUBSCRIBED_VARIANTS:
+        raise GraphQLError(f"Cannot subscribe to more than {MAX_SUBSCRIBED_VARIANTS} variants.")
+    db_ids = [get_database_id(node_id, "ProductVariant") for node_id in ids]
+    # Subscriptions are anonymous, only variants of published products are visible
+    variants_pks = models.ProductVariant.objects.filter(
+        pk__in=db_ids, product__in=models.Product.objects.published()
+    ).values_list("pk", flat=True)
+    return subscribe_to_channels(info, [get_variant_channel(pk) for pk in variants_pks])
+
+
 # TODO: After order completed
 # def resolve_report_product_sales(period):
 #     qs = models.ProductVariant.objects.all()
@@ -1,6 +1,7 @@
 import graphene
 
-from core.graph.fields import FilterInputConnectionField, PrefetchingConnectionField
+from core.graph.connection import CachedCount
+from core.graph.fields import FilterInputConnectionField
 from core.graph.utils import get_node_or_slug
 from .filters import ProductFilterInput, ProductTypeFilterInput
 from .mutations.product_types import (
@@ -34,10 +35,15 @@ from .mutations_bulk.products import (
     ProductVariantBulkCreate,
     ProductVariantBulkDelete,
 )
-from .resolvers import resolve_product_types, resolve_product_variants, resolve_products
+from .resolvers import (
+    resolve_product_types,
+    resolve_product_variants,
+    resolve_product_variants_updated,
+    resolve_products,
+)
 from .sorters import ProductSortingInput, ProductTypeSortingInput
 from .types.product_types import ProductType
-from .types.products import Product, ProductVariant
+from .types.products import Product, ProductVariant, ProductVariantUpdated
 
 
 class ProductQueries(graphene.ObjectType):
@@ -64,6 +70,8 @@ class ProductQueries(graphene.ObjectType):
         filter=ProductFilterInput(description="Filtering options for products."),
         sort_by=ProductSortingInput(description="Sort products."),
         description="List of the shop's products.",
+        keyset_pagination=True,
+        count_strategy=CachedCount(timeout=60),
     )
 
     product_variant = graphene.Field(
@@ -71,10 +79,11 @@ class ProductQueries(graphene.ObjectType):
         id=graphene.Argument(graphene.ID, description="ID of the product variant.", required=True),
         description="Look up a product variant by ID.",
     )
-    product_variants = PrefetchingConnectionField(
+    product_variants = FilterInputConnectionField(
         ProductVariant,
         ids=graphene.List(graphene.ID, description="Filter product variants by given IDs."),
         description="List of product variants.",
+        keyset_pagination=True,
     )
 
     def resolve_product_type(self, info, id):
@@ -131,3 +140,18 @@ class ProductMutations(graphene.ObjectType):
 
     # SKU GENERATOR
     product_get_sku = GenerateSKU.Field()
+
+
+class ProductSubscriptions(graphene.ObjectType):
+    product_variants_updated = graphene.Field(
+        ProductVariantUpdated,
+        ids=graphene.List(
+            graphene.NonNull(graphene.ID),
+            required=True,
+            description="IDs of the product variants to watch.",
+        ),
+        description="Stock and pricing changes of product variants, served over websocket.",
+    )
+
+    def resolve_product_variants_updated(self, info, ids):
+        return resolve_product_variants_updated(info, ids)
@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+
+from .models import ProductVariant
+from .subscriptions import publish_variants_pricing, publish_variants_stock
+
+STOCK_FIELDS = {"quantity", "quantity_allocated"}
+PRICING_FIELDS = {"price"}
+
+
+def publish_variant_update(sender, instance, created, raw=False, update_fields=None, **_kwargs):
+    if raw or created:
+        return
+    pk = instance.pk
+    # Stock of `increase_stock` and `decrease_stock` is an expression until
+    # refreshed, current values are read once the transaction commits
+    if update_fields is None or PRICING_FIELDS & update_fields:
+        transaction.on_commit(
+            lambda: publish_variants_pricing(ProductVariant.objects.filter(pk=pk), stock=True)
+        )
+    elif STOCK_FIELDS & update_fields:
+        transaction.on_commit(lambda: publish_variants_stock([pk]))
+
+
+post_save.connect(publish_variant_update, sender=ProductVariant)
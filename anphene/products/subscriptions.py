@@ -0,0 +1,78 @@
+"""Stock and pricing changes of variants pushed to websocket subscriptions."""
+from dataclasses import asdict
+from typing import Iterable
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+
+from core.graph.subscriptions import get_channel, publish
+from .models import ProductVariant
+from .utils.availability import get_variant_availability
+from ..categories.utils import get_subtree_ranges, get_subtrees_lookup
+from ..discounts.utils import fetch_active_discounts
+
+PUBLISH_BATCH_SIZE = 500
+
+
+def get_variant_channel(variant_pk) -> str:
+    return get_channel(f"product_variant.{variant_pk}")
+
+
+def get_quantity_available(variant: ProductVariant) -> int:
+    return min(variant.quantity - variant.quantity_allocated, settings.MAX_CHECKOUT_LINE_QUANTITY)
+
+
+def publish_variants_stock(variant_pks: Iterable[int]):
+    variants = ProductVariant.objects.filter(pk__in=variant_pks).only(
+        "pk", "quantity", "quantity_allocated"
+    )
+    publish(
+        (
+            get_variant_channel(variant.pk),
+            {"id": variant.pk, "quantity_available": get_quantity_available(variant)},
+        )
+        for variant in variants
+    )
+
+
+def publish_variants_pricing(variants: QuerySet, stock: bool = False):
+    """Publish prices of the variants, with active sales applied.
+
+    Stock is published along with prices when it could have changed as well.
+    """
+    discounts = fetch_active_discounts()
+    variants = variants.select_related("product").prefetch_related("product__collections")
+    last_pk = 0
+    while True:
+        chunk = list(variants.filter(pk__gt=last_pk).order_by("pk")[:PUBLISH_BATCH_SIZE])
+        if not chunk:
+            return
+        messages = []
+        for variant in chunk:
+            availability = get_variant_availability(
+                variant=variant,
+                product=variant.product,
+                collections=variant.product.collections.all(),
+                discounts=discounts,
+            )
+            message = {"id": variant.pk, "pricing": asdict(availability)}
+            if stock:
+                message["quantity_available"] = get_quantity_available(variant)
+            messages.append((get_variant_channel(variant.pk), message))
+        publish(messages)
+        last_pk = chunk[-1].pk
+
+
+def get_catalogue_variants(
+    product_pks: Iterable[int] = (),
+    category_pks: Iterable[int] = (),
+    collection_pks: Iterable[int] = (),
+) -> QuerySet:
+    """Return variants of the products, categories and collections of a discount."""
+    lookup = Q(product__in=product_pks) | Q(product__collections__in=collection_pks)
+    category_pks = list(category_pks)
+    if category_pks:
+        lookup |= get_subtrees_lookup(
+            get_subtree_ranges(category_pks), prefix="product__category__"
+        )
+    return ProductVariant.objects.filter(pk__in=ProductVariant.objects.filter(lookup).values("pk"))
@@ -2,6 +2,7 @@ from typing import Iterable, List
 
 from config.celery_app import app
 from .models import ProductType, ProductVariant
+from .subscriptions import get_catalogue_variants, publish_variants_pricing
 from .utils.attributes import generate_name_for_variant
 from ..attributes.models import Attribute
 
@@ -31,3 +32,11 @@ def update_variants_names(product_type_pk: int, saved_attributes_ids: List[int])
     instance = ProductType.objects.get(pk=product_type_pk)
     saved_attributes = Attribute.objects.filter(pk__in=saved_attributes_ids)
     _update_variants_names(instance, saved_attributes)
+
+
+@app.task
+def publish_catalogue_variants_pricing_task(
+    product_pks: List[int], category_pks: List[int], collection_pks: List[int]
+):
+    variants = get_catalogue_variants(product_pks, category_pks, collection_pks)
+    publish_variants_pricing(variants)
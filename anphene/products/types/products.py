@@ -8,20 +8,28 @@ from graphql.error import GraphQLError
 
 from core.decorators import permission_required
 from core.graph.connection import CountableDjangoObjectType
+from core.graph.cost import FieldCost
 from core.graph.types import Image, MoneyRange
 from core.graph.utils import get_database_id
-from core.utils.images import get_product_image_thumbnail, get_thumbnail
+from core.utils.images import (
+    build_absolute_image_uri,
+    get_product_image_thumbnail,
+    get_thumbnail,
+)
 from .. import models
 from ..dataloaders import (
+    CategoryByIdLoader,
     CollectionsByProductIdLoader,
     ImagesByProductIdLoader,
     ImagesByProductVariantIdLoader,
     ProductByIdLoader,
+    ProductCostsDataByProductIdLoader,
     ProductVariantsByProductIdLoader,
     SelectedAttributesByProductIdLoader,
     SelectedAttributesByProductVariantIdLoader,
 )
 from ..utils.availability import get_product_availability, get_variant_availability
+from ..utils.costs import get_margin_for_variant
 from ..utils.sku import generate_sku
 from ...attributes.types import SelectedAttribute
 from ...collections.types import Collection
@@ -75,6 +83,10 @@ class Product(CountableDjangoObjectType):
     is_available = graphene.Boolean(
         description="Whether the product is in stock and visible or not."
     )
+    purchase_cost = graphene.Field(
+        MoneyRange, description="The purchase cost range of the product variants."
+    )
+    margin = graphene.Field(Margin, description="The margin range of the product variants.")
     attributes = graphene.List(
         graphene.NonNull(SelectedAttribute),
         required=True,
@@ -95,6 +107,13 @@ class Product(CountableDjangoObjectType):
 
     get_unique_sku = graphene.String(description="Only used in variants generator.")
 
+    field_costs = {
+        "pricing": FieldCost(complexity=5),
+        "variants": FieldCost(list_size=20),
+        "images": FieldCost(list_size=5),
+        "collections": FieldCost(list_size=5),
+    }
+
     class Meta:
         description = "Represents an individual item for sale in the storefront."
         interfaces = [relay.Node]
@@ -121,7 +140,7 @@ class Product(CountableDjangoObjectType):
             if image:
                 url = get_product_image_thumbnail(image, size, method="thumbnail")
                 alt = image.alt
-                return Image(alt=alt, url=info.context.build_absolute_uri(url))
+                return Image(alt=alt, url=build_absolute_image_uri(info.context, url))
             return None
 
         return ImagesByProductIdLoader(info.context).load(root.id).then(return_first_thumbnail)
@@ -154,14 +173,30 @@ class Product(CountableDjangoObjectType):
         )
 
     @staticmethod
-    @gql_optimizer.resolver_hints(prefetch_related="variants")
     def resolve_is_available(root: models.Product, info):
-        in_stock = any(
-            root.variants.annotate_available_quantity().values_list(
-                "available_quantity", flat=True
-            )
-        )
-        return root.is_visible and in_stock
+        def is_available(variants):
+            in_stock = any(variant.quantity - variant.quantity_allocated for variant in variants)
+            return root.is_visible and in_stock
+
+        return ProductVariantsByProductIdLoader(info.context).load(root.id).then(is_available)
+
+    @staticmethod
+    @permission_required(ProductPermissions.MANAGE_PRODUCTS)
+    def resolve_purchase_cost(root: models.Product, info):
+        def with_costs_data(costs_data):
+            purchase_cost, _ = costs_data
+            return purchase_cost
+
+        return ProductCostsDataByProductIdLoader(info.context).load(root.id).then(with_costs_data)
+
+    @staticmethod
+    @permission_required(ProductPermissions.MANAGE_PRODUCTS)
+    def resolve_margin(root: models.Product, info):
+        def with_costs_data(costs_data):
+            _, margin = costs_data
+            return Margin(start=margin[0], stop=margin[1])
+
+        return ProductCostsDataByProductIdLoader(info.context).load(root.id).then(with_costs_data)
 
     @staticmethod
     def resolve_attributes(root: models.Product, info):
@@ -175,6 +210,15 @@ class Product(CountableDjangoObjectType):
         except models.ProductImage.DoesNotExist:
             raise GraphQLError("Product image not found.")
 
+    @staticmethod
+    @gql_optimizer.resolver_hints(select_related="category")
+    def resolve_category(root: models.Product, info, **_kwargs):
+        if models.Product.category.is_cached(root):
+            return root.category
+        if root.category_id:
+            return CategoryByIdLoader(info.context).load(root.category_id)
+        return None
+
     @staticmethod
     def resolve_images(root: models.Product, info, **_kwargs):
         return ImagesByProductIdLoader(info.context).load(root.id)
@@ -227,6 +271,8 @@ class ProductVariant(CountableDjangoObjectType):
     #     ),
     # )
 
+    field_costs = {"pricing": FieldCost(complexity=5), "images": FieldCost(list_size=5)}
+
     class Meta:
         description = "Represents a version of a product such as different size or color."
         only_fields = [
@@ -282,8 +328,7 @@ class ProductVariant(CountableDjangoObjectType):
     @staticmethod
     @permission_required(ProductPermissions.MANAGE_PRODUCTS)
     def resolve_margin(root: models.ProductVariant, *_args):
-        margin = root.price - root.cost
-        return round((margin / root.price) * 100, 0)
+        return get_margin_for_variant(root)
 
     @staticmethod
     def resolve_quantity_available(root: models.ProductVariant, _info):
@@ -310,6 +355,33 @@ class ProductVariant(CountableDjangoObjectType):
         return qs.filter(pk=pk).first()
 
 
+class ProductVariantUpdated(graphene.ObjectType):
+    variant_id = graphene.ID(required=True, description="ID of the updated product variant.")
+    quantity_available = graphene.Int(
+        description="Quantity of a product available for sale, null if it did not change."
+    )
+    pricing = graphene.Field(
+        VariantPricingInfo,
+        description="The storefront variant's pricing, null if it did not change.",
+    )
+
+    class Meta:
+        description = "Represents a change of stock or pricing of a product variant."
+
+    @staticmethod
+    def resolve_variant_id(root: dict, _info):
+        return graphene.Node.to_global_id("ProductVariant", root["id"])
+
+    @staticmethod
+    def resolve_quantity_available(root: dict, _info):
+        return root.get("quantity_available")
+
+    @staticmethod
+    def resolve_pricing(root: dict, _info):
+        pricing = root.get("pricing")
+        return VariantPricingInfo(**pricing) if pricing else None
+
+
 class ProductImage(CountableDjangoObjectType):
     url = graphene.String(
         required=True,
@@ -329,4 +401,4 @@ class ProductImage(CountableDjangoObjectType):
             url = get_thumbnail(root.image, size, method="thumbnail")
         else:
             url = root.image.url
-        return info.context.build_absolute_uri(url)
+        return build_absolute_image_uri(info.context, url)
@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING
+from typing import Iterable, Optional, Tuple, TYPE_CHECKING
 
 from ...core.data import MoneyRange
 
@@ -7,51 +6,41 @@ if TYPE_CHECKING:
     from ..models import Product, ProductVariant
 
 
-@dataclass
-class CostsData:
-    costs: List[int]
-    margins: List[float]
+CostsData = Tuple[MoneyRange, Tuple[float, float]]
 
-    def __post_init__(self):
-        self.costs = sorted(self.costs)
-        self.margins = sorted(self.margins)
 
+def get_product_costs_data(product: "Product",) -> CostsData:
+    """Return purchase costs range and margin range of the product variants."""
+    return get_costs_data_from_prices(product.variants.values_list("cost", "price"))
 
-def get_product_costs_data(product: "Product",) -> Tuple[MoneyRange, Tuple[int, int]]:
 
-    purchase_costs_range = MoneyRange(start=0, stop=0)
-    margin = (0, 0)
+def get_costs_data_from_prices(prices: Iterable[Tuple[int, int]]) -> CostsData:
+    """Calculate costs and margin ranges from `(cost, price)` pairs in a single pass.
 
-    if not product.variants.exists():
-        return purchase_costs_range, margin
+    Variants without cost are counted as zero cost and are left out of the margin
+    range, the same way `get_margin_for_variant` treats them.
+    """
+    cost_min = cost_max = None
+    margin_min = margin_max = None
+    for cost, price in prices:
+        cost = cost or 0
+        if cost_min is None or cost < cost_min:
+            cost_min = cost
+        if cost_max is None or cost > cost_max:
+            cost_max = cost
 
-    variants = product.variants.all()
-    costs_data = get_cost_data_from_variants(variants)
-    if costs_data.costs:
-        purchase_costs_range = MoneyRange(min(costs_data.costs), max(costs_data.costs))
-    if costs_data.margins:
-        margin = (costs_data.margins[0], costs_data.margins[-1])
-    return purchase_costs_range, margin
+        margin = get_margin(price, cost)
+        if not margin:
+            continue
+        if margin_min is None or margin < margin_min:
+            margin_min = margin
+        if margin_max is None or margin > margin_max:
+            margin_max = margin
 
-
-def get_cost_data_from_variants(variants: Iterable["ProductVariant"]) -> CostsData:
-    costs: List[int] = []
-    margins: List[float] = []
-    for variant in variants:
-        costs_data = get_variant_costs_data(variant)
-        costs += costs_data.costs
-        margins += costs_data.margins
-    return CostsData(costs, margins)
-
-
-def get_variant_costs_data(variant: "ProductVariant") -> CostsData:
-    costs = []
-    margins = []
-    costs.append(get_cost_price(variant))
-    margin = get_margin_for_variant(variant)
-    if margin:
-        margins.append(margin)
-    return CostsData(costs, margins)
+    purchase_costs_range = MoneyRange(start=cost_min or 0, stop=cost_max or 0)
+    if margin_min is None:
+        return purchase_costs_range, (0, 0)
+    return purchase_costs_range, (margin_min, margin_max)
 
 
 def get_cost_price(variant: "ProductVariant") -> int:
@@ -60,10 +49,13 @@ def get_cost_price(variant: "ProductVariant") -> int:
     return variant.cost
 
 
-def get_margin_for_variant(variant: "ProductVariant") -> Optional[float]:
-    if variant.cost == 0:
+def get_margin(price: int, cost: int) -> Optional[float]:
+    if not cost or not price:
         return None
-    price = variant.price
-    margin = price - variant.cost
+    margin = price - cost
     percent = round((margin / price) * 100, 0)
     return percent
+
+
+def get_margin_for_variant(variant: "ProductVariant") -> Optional[float]:
+    return get_margin(variant.price, variant.cost)
@@ -6,4 +6,4 @@ class RegionsConfig(AppConfig):
 
     def ready(self):
         # noinspection PyUnresolvedReferences
-        pass
+        from . import signals
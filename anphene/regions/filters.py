@@ -1,11 +1,17 @@
 import django_filters
 
-from core.utils.filters import filter_fields_containing_value
 from .models import City, SubDistrict
+from .utils import search_regions
+
+
+def filter_region_search(qs, _, value):
+    if value:
+        qs = search_regions(qs, value)
+    return qs
 
 
 class CityFilter(django_filters.FilterSet):
-    search = django_filters.CharFilter(method=filter_fields_containing_value("name"))
+    search = django_filters.CharFilter(method=filter_region_search)
 
     class Meta:
         model = City
@@ -13,7 +19,8 @@ class CityFilter(django_filters.FilterSet):
 
 
 class SubDistrictFilter(django_filters.FilterSet):
-    search = django_filters.CharFilter(method=filter_fields_containing_value("name"))
+    # Matches the full address: sub-district, city and province names
+    search = django_filters.CharFilter(method=filter_region_search)
 
     class Meta:
         model = SubDistrict
@@ -1,17 +1,42 @@
 # Generated by Django 3.0.6 on 2020-05-10 07:49
-from django.core.management import call_command
+import json
+import os
 
+from django.core.management.color import no_style
 from django.db import migrations
 
-fixture_province = "fetch_province"
-fixture_city = "fetch_city"
-fixture_sub_district = "fetch_subdistrict"
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+
+# Fixture and model loaded from it, in the order of their dependencies
+fixtures = [
+    ("fetch_province", "Province"),
+    ("fetch_city", "City"),
+    ("fetch_subdistrict", "SubDistrict"),
+]
 
 
 def load_fixture(apps, schema_editor):
-    call_command("loaddata", fixture_province, app_label="regions")
-    call_command("loaddata", fixture_city, app_label="regions")
-    call_command("loaddata", fixture_sub_district, app_label="regions")
+    # Fixtures are loaded with historical models, `loaddata` would use the current
+    # ones and write columns added by later migrations.
+    loaded_models = []
+    for fixture, model_name in fixtures:
+        model = apps.get_model("regions", model_name)
+        with open(os.path.join(FIXTURES_DIR, f"{fixture}.json")) as f:
+            objects = json.load(f)
+        instances = []
+        for obj in objects:
+            fields = {
+                f"{name}_id" if model._meta.get_field(name).is_relation else name: value
+                for name, value in obj["fields"].items()
+            }
+            instances.append(model(pk=obj["pk"], **fields))
+        model.objects.using(schema_editor.connection.alias).bulk_create(instances)
+        loaded_models.append(model)
+
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), loaded_models):
+            cursor.execute(sql)
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,83 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def fill_search_documents(apps, _schema_editor):
+    City = apps.get_model("regions", "City")
+    SubDistrict = apps.get_model("regions", "SubDistrict")
+
+    city_names = {}
+    cities = list(City.objects.select_related("province"))
+    for city in cities:
+        city_name = f"{city.get_type_display()} {city.name}".strip()
+        city_names[city.pk] = f"{city_name} - {city.province.name}"
+        city.search_document = city_names[city.pk].lower()
+    City.objects.bulk_update(cities, ["search_document"], batch_size=BATCH_SIZE)
+
+    sub_districts = list(SubDistrict.objects.only("pk", "name", "city_id"))
+    for sub_district in sub_districts:
+        sub_district.full_name = f"{sub_district.name}, {city_names[sub_district.city_id]}"
+        sub_district.search_document = sub_district.full_name.lower()
+    SubDistrict.objects.bulk_update(
+        sub_districts, ["full_name", "search_document"], batch_size=BATCH_SIZE
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("regions", "0002_add_fixtures"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="city",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="subdistrict",
+            name="full_name",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="subdistrict",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(fill_search_documents, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="city",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"], name="city_search_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="city",
+            index=models.Index(
+                fields=["search_document"],
+                name="city_search_prefix",
+                opclasses=["text_pattern_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subdistrict",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="subdistrict_search_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subdistrict",
+            index=models.Index(
+                fields=["search_document"],
+                name="subdistrict_search_prefix",
+                opclasses=["text_pattern_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 3.0.8 on 2026-10-19 07:37
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("regions", "0003_region_search_documents"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name="city", name="city_search_prefix",),
+        migrations.RemoveIndex(model_name="subdistrict", name="subdistrict_search_prefix",),
+    ]
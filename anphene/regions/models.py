@@ -1,8 +1,18 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from . import CityType
 
 
+def get_search_indexes(prefix):
+    """Return indexes serving substring matches of the search document."""
+    return [
+        GinIndex(
+            name=f"{prefix}_search_trgm", fields=["search_document"], opclasses=["gin_trgm_ops"]
+        ),
+    ]
+
+
 class Province(models.Model):
     name = models.CharField(max_length=256)
 
@@ -15,8 +25,12 @@ class City(models.Model):
     type = models.CharField(max_length=12, choices=CityType.TYPE)
     name = models.CharField(max_length=256, db_index=True)
 
+    # Lowercase "<city name> - <province name>"
+    search_document = models.TextField(blank=True, default="", editable=False)
+
     class Meta:
         ordering = ["name"]
+        indexes = get_search_indexes("city")
 
     @property
     def city_name(self):
@@ -27,8 +41,13 @@ class SubDistrict(models.Model):
     city = models.ForeignKey(City, related_name="sub_districts", on_delete=models.PROTECT)
     name = models.CharField(max_length=256, db_index=True)
 
+    # Rendered `get_full_name` and its lowercase version for searching
+    full_name = models.TextField(blank=True, default="", editable=False)
+    search_document = models.TextField(blank=True, default="", editable=False)
+
     class Meta:
         ordering = ["name"]
+        indexes = get_search_indexes("subdistrict")
 
     def get_full_name(self):
         """
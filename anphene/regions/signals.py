@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save
+
+from .models import City, Province, SubDistrict
+from .utils import update_cities_search_documents, update_sub_districts_search_documents
+
+
+def update_province_search_documents(sender, instance, raw=False, **_kwargs):
+    if raw:
+        return
+    update_cities_search_documents(City.objects.filter(province=instance))
+    update_sub_districts_search_documents(SubDistrict.objects.filter(city__province=instance))
+
+
+def update_city_search_documents(sender, instance, raw=False, **_kwargs):
+    if raw:
+        return
+    update_cities_search_documents(City.objects.filter(pk=instance.pk))
+    update_sub_districts_search_documents(SubDistrict.objects.filter(city=instance))
+
+
+def update_sub_district_search_document(sender, instance, raw=False, **_kwargs):
+    if raw:
+        return
+    update_sub_districts_search_documents(SubDistrict.objects.filter(pk=instance.pk))
+
+
+post_save.connect(update_province_search_documents, sender=Province)
+post_save.connect(update_city_search_documents, sender=City)
+post_save.connect(update_sub_district_search_document, sender=SubDistrict)
@@ -1,3 +1,4 @@
+import graphene
 from graphene import relay
 
 from core.graph.connection import CountableDjangoObjectType
@@ -7,10 +8,15 @@ from .dataloader import CityByProvinceIdLoader, SubDistrictByCityIdLoader
 
 
 class SubDistrict(CountableDjangoObjectType):
+    full_name = graphene.String(
+        description="Full address of the sub district with its city and province."
+    )
+
     class Meta:
         description = "Sub District"
         interfaces = [relay.Node]
         model = models.SubDistrict
+        exclude_fields = ["search_document"]
 
 
 class City(CountableDjangoObjectType):
@@ -18,6 +24,7 @@ class City(CountableDjangoObjectType):
         description = "City"
         interfaces = [relay.Node]
         model = models.City
+        exclude_fields = ["search_document"]
 
     @staticmethod
     def resolve_name(root, _info):
@@ -0,0 +1,49 @@
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Case, IntegerField, QuerySet, Value, When
+
+from .models import City, SubDistrict
+
+SEARCH_DOCUMENT_BATCH_SIZE = 1000
+
+
+def update_cities_search_documents(cities: QuerySet):
+    cities = list(cities.select_related("province"))
+    for city in cities:
+        city.search_document = f"{city.city_name} - {city.province.name}".lower()
+    City.objects.bulk_update(cities, ["search_document"], batch_size=SEARCH_DOCUMENT_BATCH_SIZE)
+
+
+def update_sub_districts_search_documents(sub_districts: QuerySet):
+    sub_districts = list(sub_districts.select_related("city__province"))
+    for sub_district in sub_districts:
+        sub_district.full_name = sub_district.get_full_name()
+        sub_district.search_document = sub_district.full_name.lower()
+    SubDistrict.objects.bulk_update(
+        sub_districts, ["full_name", "search_document"], batch_size=SEARCH_DOCUMENT_BATCH_SIZE
+    )
+
+
+def search_regions(queryset: QuerySet, value: str) -> QuerySet:
+    """Return regions containing the value in their search document.
+
+    Regions whose name starts with the value go first, without the type of
+    cities, so "bandung" puts "Kab. Bandung" first. The rest is ranked by
+    trigram similarity to the value. Only the filter is served by an index,
+    the ranking is computed for the matching regions.
+    """
+    value = value.strip().lower()
+    if not value:
+        return queryset
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return (
+        queryset.filter(search_document__contains=value)
+        .annotate(
+            search_prefix=Case(
+                When(name__istartswith=value, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            search_rank=TrigramSimilarity("search_document", value),
+        )
+        .order_by("-search_prefix", "-search_rank", *ordering)
+    )
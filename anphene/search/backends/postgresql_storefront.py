@@ -1,7 +1,7 @@
 from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q
 
-from ...products.models import Product
+from ...products.models import Product, ProductVariant
 
 
 def search(phrase):
@@ -17,7 +17,8 @@ def search(phrase):
     """
     name_sim = TrigramSimilarity("name", phrase)
     ft_in_description = Q(description__search=phrase)
-    ft_by_sku = Q(variants__sku__search=phrase)
+    # Variants are matched with a subquery, a join would duplicate products
+    ft_by_sku = Q(pk__in=ProductVariant.objects.filter(sku__search=phrase).values("product_id"))
     name_similar = Q(name_sim__gt=0.2)
     return Product.objects.annotate(name_sim=name_sim).filter(
         (ft_in_description | name_similar | ft_by_sku)
@@ -1,8 +1,8 @@
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Union
 
-import requests
+import httpx
 
 from ... import Courier, CourierService, Waybill, WaybillHistory, WaybillStatus
 from ....plugins import PluginType
@@ -21,6 +21,18 @@ class PluginConfig:
 DESTINATION_TYPE = "subdistrict"
 URL_COST = "https://pro.rajaongkir.com/api/cost"
 URL_WAYBILL = "https://pro.rajaongkir.com/api/waybill"
+# Seconds to wait for Raja Ongkir before returning no results
+REQUEST_TIMEOUT = 10
+# Transport errors of httpx are not subclasses of its `HTTPError`
+REQUEST_ERRORS = (
+    httpx.HTTPError,
+    httpx.NetworkError,
+    httpx.ProtocolError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.PoolTimeout,
+)
 
 
 class RajaOngkirPlugin(BasePlugin):
@@ -76,7 +88,7 @@ class RajaOngkirPlugin(BasePlugin):
 
     def fetch_shipping_costs(
         self, address: "Address", weight: int, previous_value: list
-    ) -> List["Courier"]:
+    ) -> Union[List["Courier"], Awaitable[List["Courier"]]]:
         if previous_value:
             return previous_value
 
@@ -94,58 +106,78 @@ class RajaOngkirPlugin(BasePlugin):
             data["destination"] = destination
             data["weight"] = weight
             headers = {"key": key}
-            r = requests.post(URL_COST, headers=headers, data=data)
-            if r.status_code == 200:
-                try:
-                    results = r.json()["rajaongkir"]["results"]
-                    data = [
-                        Courier(
-                            code=result["code"],
-                            name=result["name"],
-                            services=[
-                                CourierService(
-                                    cost=service["cost"][0].get("value", 0),
-                                    service=service.get("service", ""),
-                                    description=service.get("description", ""),
-                                    etd=service["cost"][0].get("etd", ""),
-                                )
-                                for service in result["costs"]
-                            ],
-                        )
-                        for result in results
-                        if result["costs"]
-                    ]
-                    return data
-                except Exception:
-                    return previous_value
+            # Settings are read in the request thread, the request is awaited
+            return self.request_shipping_costs(headers, data, previous_value)
+        return previous_value
+
+    async def request_shipping_costs(
+        self, headers: dict, data: dict, previous_value: list
+    ) -> List["Courier"]:
+        try:
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                r = await client.post(URL_COST, headers=headers, data=data)
+        except REQUEST_ERRORS:
+            return previous_value
+        if r.status_code == 200:
+            try:
+                results = r.json()["rajaongkir"]["results"]
+                return [
+                    Courier(
+                        code=result["code"],
+                        name=result["name"],
+                        services=[
+                            CourierService(
+                                cost=service["cost"][0].get("value", 0),
+                                service=service.get("service", ""),
+                                description=service.get("description", ""),
+                                etd=service["cost"][0].get("etd", ""),
+                            )
+                            for service in result["costs"]
+                        ],
+                    )
+                    for result in results
+                    if result["costs"]
+                ]
+            except Exception:
+                return previous_value
         return previous_value
 
     def fetch_waybill(
         self, waybill: str, courier: str, previous_value: "Waybill"
-    ) -> Optional["Waybill"]:
+    ) -> Union[Optional["Waybill"], Awaitable[Optional["Waybill"]]]:
         if self.config.fetch_waybill:
             headers = {"key": self.config.params["key"]}
             data = {"courier": courier.lower(), "waybill": waybill}
-            r = requests.post(URL_WAYBILL, headers=headers, data=data)
-            if r.status_code == 200:
-                try:
-                    result = r.json()["rajaongkir"]["result"]
-                    status = result["delivery_status"]
-                    histories = result["manifest"]
-                    status = WaybillStatus(
-                        status=status["status"],
-                        receiver=status["pod_receiver"],
-                        date=f"{status['pod_date']} {status['pod_time']}",
+            return self.request_waybill(headers, data, previous_value)
+        return previous_value
+
+    async def request_waybill(
+        self, headers: dict, data: dict, previous_value: "Waybill"
+    ) -> Optional["Waybill"]:
+        try:
+            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+                r = await client.post(URL_WAYBILL, headers=headers, data=data)
+        except REQUEST_ERRORS:
+            return previous_value
+        if r.status_code == 200:
+            try:
+                result = r.json()["rajaongkir"]["result"]
+                status = result["delivery_status"]
+                histories = result["manifest"]
+                status = WaybillStatus(
+                    status=status["status"],
+                    receiver=status["pod_receiver"],
+                    date=f"{status['pod_date']} {status['pod_time']}",
+                )
+                histories = [
+                    WaybillHistory(
+                        date=f"{history['manifest_date']} {history['manifest_time']}",
+                        description=history["manifest_description"],
+                        city=history["city_name"],
                     )
-                    histories = [
-                        WaybillHistory(
-                            date=f"{history['manifest_date']} {history['manifest_time']}",
-                            description=history["manifest_description"],
-                            city=history["city_name"],
-                        )
-                        for history in histories
-                    ]
-                    return Waybill(status=status, histories=histories)
-                except Exception:
-                    return previous_value
+                    for history in histories
+                ]
+                return Waybill(status=status, histories=histories)
+            except Exception:
+                return previous_value
         return previous_value
@@ -24,6 +24,7 @@ class FetchShippingCost(BaseMutation):
         data = data.get("input")
         address = cls.get_node_or_error(info, data["address"], field="address", only_type=Address)
         weight = data.get("weight")
+        # Plugins can return a coroutine, it is awaited when the field is resolved
         couriers = get_plugins_manager().fetch_shipping_cost(address, weight)
 
         return cls(couriers=couriers)
@@ -50,6 +51,7 @@ class FetchWaybill(BaseMutation):
         data = data.get("input")
         waybill = data.get("waybill")
         courier_code = data.get("courier_code")
+        # Plugins can return a coroutine, it is awaited when the field is resolved
         waybill = get_plugins_manager().fetch_waybill(waybill, courier_code)
 
         return cls(waybill=waybill)
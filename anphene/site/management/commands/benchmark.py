@@ -0,0 +1,74 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from ....core.benchmarks.operations import OPERATIONS
+from ....core.benchmarks.runner import (
+    BENCHMARK_SETTINGS,
+    BenchmarkRunner,
+    load_results,
+    OperationFailed,
+    results_to_json,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure latency and query counts of representative GraphQL operations "
+        "against a database populated by `populatebenchmarkdb`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--operation",
+            action="append",
+            dest="operations",
+            choices=[operation.name for operation in OPERATIONS],
+            help="Only run the given operation, can be used multiple times.",
+        )
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument("--output", help="Save the results as JSON to the given path.")
+        parser.add_argument("--label", help="Label of the saved results, e.g. a commit.")
+        parser.add_argument(
+            "--compare", help="Compare the results with the ones saved in the given path."
+        )
+
+    def handle(self, *args, **options):
+        operations = [
+            operation
+            for operation in OPERATIONS
+            if not options["operations"] or operation.name in options["operations"]
+        ]
+        baseline = load_results(options["compare"]) if options["compare"] else {}
+
+        # Allows the test client to reach the API and keeps DEBUG off
+        setup_test_environment()
+        benchmark_settings = override_settings(**BENCHMARK_SETTINGS)
+        benchmark_settings.enable()
+        try:
+            runner = BenchmarkRunner(iterations=options["iterations"], warmup=options["warmup"])
+            results = runner.run(operations)
+        except OperationFailed as e:
+            raise CommandError(str(e))
+        finally:
+            benchmark_settings.disable()
+            teardown_test_environment()
+
+        self.stdout.write(
+            f"{'operation':<30}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'queries':>10}"
+        )
+        for result in results:
+            line = (
+                f"{result.name:<30}{result.p50:>10.1f}{result.p90:>10.1f}"
+                f"{result.p99:>10.1f}{result.max_queries:>10}"
+            )
+            previous = baseline.get(result.name)
+            if previous:
+                change = (result.p50 - previous.p50) / previous.p50 * 100
+                queries = result.max_queries - previous.max_queries
+                line += f"   p50 {change:+.1f}%, queries {queries:+d}"
+            self.stdout.write(line)
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(results_to_json(results, options["label"]))
@@ -0,0 +1,78 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from ....core.benchmarks.operations import OPERATIONS
+from ....core.benchmarks.query_counts import (
+    BASELINE_PATH,
+    compare_profiles,
+    get_page_size_dependent_counts,
+    load_baseline,
+    PAGE_SIZES,
+    profile_operation,
+    save_baseline,
+)
+from ....core.benchmarks.runner import BENCHMARK_SETTINGS, BenchmarkRunner, OperationFailed
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that benchmark operations do not execute more SQL queries than "
+        "recorded in the baseline, or a number of queries depending on the page size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Record the current queries of all operations as the baseline.",
+        )
+        parser.add_argument("--baseline", default=BASELINE_PATH, help="Path of the baseline.")
+
+    def handle(self, *args, **options):
+        path = options["baseline"]
+        if not options["update"] and not os.path.exists(path):
+            raise CommandError(f"There is no baseline in {path}, record it with --update.")
+        baseline = {} if options["update"] else load_baseline(path)
+
+        setup_test_environment()
+        benchmark_settings = override_settings(**BENCHMARK_SETTINGS)
+        benchmark_settings.enable()
+        try:
+            runner = BenchmarkRunner()
+            profiles = {}
+            problems = []
+            for operation in OPERATIONS:
+                profiles[operation.name] = profile = profile_operation(runner, operation)
+                counts = get_page_size_dependent_counts(runner, operation)
+                if counts:
+                    problems.append(
+                        f"{operation.name}: executes {counts} queries "
+                        f"for page sizes {list(PAGE_SIZES)}"
+                    )
+                if operation.name in baseline:
+                    problems += [
+                        f"{operation.name}: {problem}"
+                        for problem in compare_profiles(baseline[operation.name], profile)
+                    ]
+                elif not options["update"]:
+                    problems.append(f"{operation.name}: missing from the baseline")
+        except OperationFailed as e:
+            raise CommandError(str(e))
+        finally:
+            benchmark_settings.disable()
+            teardown_test_environment()
+
+        for name, profile in profiles.items():
+            expected = baseline.get(name)
+            line = f"{name:<30}{profile.count:>5} queries"
+            if expected and expected.count != profile.count:
+                line += f" (baseline {expected.count})"
+            self.stdout.write(line)
+
+        if options["update"]:
+            save_baseline(profiles, path)
+            self.stdout.write(f"Baseline saved to {path}")
+        if problems:
+            raise CommandError("Query count regressions:\n" + "\n".join(problems))
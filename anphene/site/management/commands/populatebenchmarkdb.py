@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ....core.benchmarks.data import CATALOGUE_SIZES, CatalogueGenerator, STAFF_EMAIL
+from ....products.models import Product
+from ....regions.models import SubDistrict
+
+
+class Command(BaseCommand):
+    help = "Populate an empty database with the catalogue used by the benchmarks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            choices=list(CATALOGUE_SIZES),
+            default="small",
+            help="Size of the generated catalogue.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the generated catalogue.")
+
+    def handle(self, *args, **options):
+        if Product.objects.exists():
+            raise CommandError("The catalogue has to be generated in an empty database.")
+        if not SubDistrict.objects.exists():
+            raise CommandError("Regions are missing, run the migrations first.")
+
+        generator = CatalogueGenerator(CATALOGUE_SIZES[options["size"]], seed=options["seed"])
+        counts = generator.create_catalogue()
+        for name, count in counts.items():
+            self.stdout.write(f"Created {count} {name}")
+        self.stdout.write(f"Staff operations are executed as {STAFF_EMAIL}")
@@ -0,0 +1,109 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, DatabaseError
+from django.db.models import Sum
+
+from core.exceptions import InsufficientStock
+from ....checkouts.models import Allocation, Checkout, CheckoutLine
+from ....checkouts.stock import release_checkout_stock, reserve_checkout_stock
+from ....products.models import ProductVariant
+
+
+class Command(BaseCommand):
+    help = (
+        "Reserve stock of a few variants for many checkouts at once and check that "
+        "no stock is oversold, against a database populated by `populatebenchmarkdb`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--variants", type=int, default=5)
+        parser.add_argument("--stock", type=int, default=100, help="Stock of each variant.")
+        parser.add_argument("--checkouts", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=16)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        variants = list(ProductVariant.objects.filter(track_inventory=True)[: options["variants"]])
+        if not variants:
+            raise CommandError("No variants found, run `populatebenchmarkdb` first.")
+        initial_stock = [
+            (variant.pk, variant.quantity, variant.quantity_allocated) for variant in variants
+        ]
+        variant_pks = [variant.pk for variant in variants]
+        ProductVariant.objects.filter(pk__in=variant_pks).update(
+            quantity=options["stock"], quantity_allocated=0
+        )
+
+        rng = random.Random(options["seed"])
+        checkouts = Checkout.objects.bulk_create([Checkout() for _ in range(options["checkouts"])])
+        CheckoutLine.objects.bulk_create(
+            [
+                CheckoutLine(checkout=checkout, variant_id=variant_pk, quantity=rng.randint(1, 3))
+                for checkout in checkouts
+                for variant_pk in rng.sample(variant_pks, rng.randint(1, len(variant_pks)))
+            ]
+        )
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                outcomes = list(executor.map(self.reserve, checkouts))
+            duration = time.perf_counter() - started
+
+            self.stdout.write(
+                f"{len(checkouts)} checkouts in {duration:.2f}s: "
+                f"{outcomes.count('reserved')} reserved, "
+                f"{outcomes.count('insufficient')} out of stock, "
+                f"{outcomes.count('failed')} failed"
+            )
+            errors = self.check_stock(variant_pks)
+            for error in errors:
+                self.stderr.write(error)
+            if outcomes.count("failed") or errors:
+                raise CommandError("Stock reservation did not hold up.")
+            self.stdout.write(self.style.SUCCESS("No stock was oversold."))
+        finally:
+            for checkout in checkouts:
+                release_checkout_stock(checkout)
+            Checkout.objects.filter(pk__in=[checkout.pk for checkout in checkouts]).delete()
+            for pk, quantity, quantity_allocated in initial_stock:
+                ProductVariant.objects.filter(pk=pk).update(
+                    quantity=quantity, quantity_allocated=quantity_allocated
+                )
+
+    @staticmethod
+    def reserve(checkout: Checkout) -> str:
+        try:
+            reserve_checkout_stock(checkout)
+        except InsufficientStock:
+            return "insufficient"
+        except DatabaseError:
+            return "failed"
+        finally:
+            connection.close()
+        return "reserved"
+
+    @staticmethod
+    def check_stock(variant_pks: List[int]) -> List[str]:
+        allocated = dict(
+            Allocation.objects.filter(variant_id__in=variant_pks)
+            .values_list("variant_id")
+            .annotate(Sum("quantity_allocated"))
+        )
+        stock = ProductVariant.objects.filter(pk__in=variant_pks).values_list(
+            "pk", "quantity", "quantity_allocated"
+        )
+        errors = []
+        for pk, quantity, quantity_allocated in stock:
+            if quantity_allocated > quantity:
+                errors.append(f"Variant {pk}: {quantity_allocated} allocated of {quantity}")
+            if quantity_allocated != allocated.get(pk, 0):
+                errors.append(
+                    f"Variant {pk}: {quantity_allocated} allocated, "
+                    f"{allocated.get(pk, 0)} in allocations"
+                )
+        return errors
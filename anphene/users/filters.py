@@ -6,12 +6,25 @@ from core.graph.types.common import DateRangeInput
 from core.utils.filters import filter_fields_containing_value, filter_range_field
 from .enums import StaffMemberStatus
 from .models import User
+from .search import search_users, search_users_by_email_prefix
 
 
 def filter_date_joined(qs, _, value):
     return filter_range_field(qs, "date_joined__date", value)
 
 
+def filter_user_search(qs, _, value):
+    if value:
+        qs = search_users(qs, value)
+    return qs
+
+
+def filter_email_prefix(qs, _, value):
+    if value:
+        qs = search_users_by_email_prefix(qs, value)
+    return qs
+
+
 def filter_status(qs, _, value):
     if value == StaffMemberStatus.ACTIVE:
         qs = qs.filter(is_staff=True, is_active=True)
@@ -22,13 +35,15 @@ def filter_status(qs, _, value):
 
 class CustomerFilter(django_filters.FilterSet):
     date_joined = ObjectTypeFilter(input_class=DateRangeInput, method=filter_date_joined)
-    search = django_filters.CharFilter(method=filter_fields_containing_value("name", "email"))
+    search = django_filters.CharFilter(method=filter_user_search)
+    email_prefix = django_filters.CharFilter(method=filter_email_prefix)
 
     class Meta:
         model = User
         fields = [
             "date_joined",
             "search",
+            "email_prefix",
         ]
 
 
@@ -37,17 +52,13 @@ class GroupFilter(django_filters.FilterSet):
 
 
 class StaffUserFilter(django_filters.FilterSet):
-    search_fields = (
-        "email",
-        "name",
-    )
-
     status = EnumFilter(input_class=StaffMemberStatus, method=filter_status)
-    search = django_filters.CharFilter(method=filter_fields_containing_value(*search_fields))
+    search = django_filters.CharFilter(method=filter_user_search)
+    email_prefix = django_filters.CharFilter(method=filter_email_prefix)
 
     class Meta:
         model = User
-        fields = ["status", "search"]
+        fields = ["status", "search", "email_prefix"]
 
 
 class CustomerFilterInput(FilterInputObjectType):
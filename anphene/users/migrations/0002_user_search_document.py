@@ -0,0 +1,64 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def prepare_search_document_value(email, name, note, phones, notes):
+    """Return the searchable text of a user, as the app did when this migration was added."""
+    values = [email, name, note]
+    for phone in phones:
+        if not phone:
+            continue
+        values.append(str(phone))
+        national_number = getattr(phone, "national_number", None)
+        if national_number:
+            values.append(f"0{national_number}")
+    values.extend(notes)
+    return "".join(f"{value.strip().lower()}\n" for value in values if value and value.strip())
+
+
+def fill_users_search_document(apps, _schema_editor):
+    User = apps.get_model("users", "User")
+    users = User.objects.order_by("pk").prefetch_related("addresses", "notes")
+    last_pk = 0
+    while True:
+        batch = list(users.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        if not batch:
+            break
+        for user in batch:
+            user.search_document = prepare_search_document_value(
+                user.email,
+                user.name,
+                user.note,
+                phones=[address.phone for address in user.addresses.all()],
+                notes=[note.content for note in user.notes.all()],
+            )
+        User.objects.bulk_update(batch, ["search_document"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="user",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(fill_users_search_document, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="user_search_document_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
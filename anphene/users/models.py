@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.fields import CIEmailField, JSONField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.db.models import CharField, Value
@@ -111,12 +112,22 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     objects = UserManager()
 
+    # Lowercase email, name, address phones and notes, starting with the email
+    search_document = models.TextField(blank=True, default="", editable=False)
+
     class Meta:
         permissions = (
             (UserPermissions.MANAGE_CUSTOMERS.codename, "Manage customers"),
             (UserPermissions.MANAGE_STAFF.codename, "Manage staff"),
             (GroupPermissions.MANAGE_GROUPS.codename, "Manage groups"),
         )
+        indexes = [
+            GinIndex(
+                name="user_search_document_trgm",
+                fields=["search_document"],
+                opclasses=["gin_trgm_ops"],
+            )
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -34,13 +34,13 @@ def resolve_groups(_info, **_kwargs):
 
 def resolve_customers(_info, **_kwargs):
     qs = models.User.objects.customers()
-    return qs.distinct()
+    return qs
 
 
 def resolve_staff_users(info, **_kwargs):
     user = info.context.user
     qs = models.User.objects.staff().exclude(id=user.id)
-    return qs.distinct()
+    return qs
 
 
 def resolve_user(info, id):
@@ -1,6 +1,7 @@
 import graphene
 
 from core.decorators import one_of_permissions_required, permission_required
+from core.graph.connection import EstimatedCount
 from core.graph.fields import FilterInputConnectionField
 from core.graph.types import Permission
 from .filters import CustomerFilterInput, GroupFilterInput, StaffUserInput
@@ -53,6 +54,8 @@ class UserQueries(graphene.ObjectType):
         filter=CustomerFilterInput(description="Filtering options for customers."),
         sort_by=UserSortingInput(description="Sort customers."),
         description="List of the shop's customers.",
+        keyset_pagination=True,
+        count_strategy=EstimatedCount(threshold=10000),
     )
     all_permissions = graphene.List(Permission, description="List of store permissions.")
     groups = FilterInputConnectionField(
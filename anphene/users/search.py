@@ -0,0 +1,69 @@
+from typing import Iterable, List
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import QuerySet
+
+from .models import User
+
+USER_SEARCH_DOCUMENT_BATCH_SIZE = 1000
+
+
+def prepare_user_search_document_value(
+    email: str, name: str = "", note: str = "", phones: Iterable = (), notes: Iterable = ()
+) -> str:
+    """Return the searchable text of a user, one lowercase value per line.
+
+    The document always starts with the email, so email prefixes can be matched
+    against the beginning of the document.
+    """
+    values: List[str] = [email, name, note]
+    for phone in phones:
+        if not phone:
+            continue
+        values.append(str(phone))
+        # Customers are often looked up by the local number without a country code
+        national_number = getattr(phone, "national_number", None)
+        if national_number:
+            values.append(f"0{national_number}")
+    values.extend(notes)
+    return "".join(f"{value.strip().lower()}\n" for value in values if value and value.strip())
+
+
+def update_users_search_documents(user_ids: Iterable[int]):
+    user_ids = list(user_ids)
+    for index in range(0, len(user_ids), USER_SEARCH_DOCUMENT_BATCH_SIZE):
+        batch_ids = user_ids[index : index + USER_SEARCH_DOCUMENT_BATCH_SIZE]
+        users = User.objects.filter(pk__in=batch_ids).prefetch_related("addresses", "notes")
+        for user in users:
+            user.search_document = prepare_user_search_document_value(
+                user.email,
+                user.name,
+                user.note,
+                phones=[address.phone for address in user.addresses.all()],
+                notes=[note.content for note in user.notes.all()],
+            )
+        User.objects.bulk_update(users, ["search_document"])
+
+
+def search_users(queryset: QuerySet, value: str) -> QuerySet:
+    """Return users containing the value in any of the searchable fields.
+
+    Matches are served by the trigram index on the search document and ranked
+    by their similarity to the value, the current ordering breaks ties.
+    """
+    value = value.strip().lower()
+    if not value:
+        return queryset
+    ordering = queryset.query.order_by
+    return (
+        queryset.filter(search_document__contains=value)
+        .annotate(search_rank=TrigramSimilarity("search_document", value))
+        .order_by("-search_rank", *ordering)
+    )
+
+
+def search_users_by_email_prefix(queryset: QuerySet, value: str) -> QuerySet:
+    value = value.strip().lower()
+    if not value:
+        return queryset
+    return queryset.filter(search_document__startswith=value)
@@ -0,0 +1,47 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from .models import Address, CustomerNote, User
+from .search import update_users_search_documents
+
+USER_SEARCH_FIELDS = {"email", "name", "note"}
+
+
+def update_user_search_document(sender, instance, update_fields=None, **_kwargs):
+    if update_fields is not None and not USER_SEARCH_FIELDS.intersection(update_fields):
+        return
+    update_users_search_documents([instance.pk])
+
+
+def update_address_users_search_documents(sender, instance, **_kwargs):
+    update_users_search_documents(instance.user_addresses.values_list("pk", flat=True))
+
+
+def store_address_users(sender, instance, **_kwargs):
+    # Links to users are gone once the address is deleted
+    instance._search_user_ids = list(instance.user_addresses.values_list("pk", flat=True))
+
+
+def update_deleted_address_users_search_documents(sender, instance, **_kwargs):
+    update_users_search_documents(getattr(instance, "_search_user_ids", []))
+
+
+def update_addresses_users_search_documents(sender, instance, action, reverse, pk_set, **_kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        update_users_search_documents([instance.pk])
+    elif pk_set:
+        update_users_search_documents(pk_set)
+
+
+def update_note_customer_search_document(sender, instance, **_kwargs):
+    update_users_search_documents([instance.customer_id])
+
+
+post_save.connect(update_user_search_document, sender=User)
+post_save.connect(update_address_users_search_documents, sender=Address)
+pre_delete.connect(store_address_users, sender=Address)
+post_delete.connect(update_deleted_address_users_search_documents, sender=Address)
+m2m_changed.connect(update_addresses_users_search_documents, sender=User.addresses.through)
+post_save.connect(update_note_customer_search_document, sender=CustomerNote)
+post_delete.connect(update_note_customer_search_document, sender=CustomerNote)
@@ -175,4 +175,4 @@ class Group(CountableDjangoObjectType):
     def resolve_available_staff(root: auth_models.Group, info, **kwargs):
         user = info.context.user
         qs = models.User.objects.staff().exclude(id=user.id).exclude(groups=root)
-        return qs.distinct()
+        return qs
@@ -9,3 +9,9 @@ class StaticRootGoogleCloudStorage(GoogleCloudStorage):
 class MediaRootGoogleCloudStorage(GoogleCloudStorage):
     location = "media"
     file_overwrite = False
+
+
+class PrivateGoogleCloudStorage(GoogleCloudStorage):
+    location = "private"
+    default_acl = "private"
+    file_overwrite = False
@@ -27,12 +27,17 @@ django_application = get_asgi_application()
 # from helloworld.asgi import HelloWorldApplication
 # application = HelloWorldApplication(application)
 
-# Import websocket application here, so apps from django_application are loaded first
+# Import websocket and GraphQL applications here, so apps are loaded first
 from config.websocket import websocket_application  # noqa isort:skip
+from core.handlers import GraphQLASGIHandler, is_graphql_request  # noqa isort:skip
+
+graphql_application = GraphQLASGIHandler()
 
 
 async def application(scope, receive, send):
-    if scope["type"] == "http":
+    if is_graphql_request(scope):
+        await graphql_application(scope, receive, send)
+    elif scope["type"] == "http":
         await django_application(scope, receive, send)
     elif scope["type"] == "websocket":
         await websocket_application(scope, receive, send)
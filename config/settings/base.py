@@ -42,6 +42,19 @@ LOCALE_PATHS = [str(ROOT_DIR / "locale")]
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db("DATABASE_URL")}
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Read-only replicas of the default database, as a comma separated list of URLs.
+# GraphQL queries read from one of them, see `core.db.routers`.
+DATABASE_REPLICAS = []
+for index, url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[])):
+    DATABASES[f"replica_{index}"] = env.db_url_config(url)
+    DATABASES[f"replica_{index}"]["TEST"] = {"MIRROR": "default"}
+    DATABASE_REPLICAS.append(f"replica_{index}")
+DATABASE_ROUTERS = ["core.db.routers.ReplicaRouter"]
+# Seconds for which a session reads from the primary after a mutation, so it
+# sees its own writes despite the replication lag. All requests read from the
+# primary for as long after cached data is invalidated, so that data read from
+# a lagging replica is not cached as the new one.
+DATABASE_REPLICA_STICKINESS = env.int("DATABASE_REPLICA_STICKINESS", default=10)
 
 # URLS
 # ------------------------------------------------------------------------------
@@ -74,6 +87,7 @@ LOCAL_APPS = [
     "anphene.checkouts.apps.CheckoutsConfig",
     "anphene.collections.apps.CollectionsConfig",
     "anphene.discounts.apps.DiscountsConfig",
+    "anphene.exports.apps.ExportsConfig",
     "anphene.menus.apps.MenusConfig",
     "anphene.pages.apps.PagesConfig",
     "anphene.plugins.apps.PluginsConfig",
@@ -157,6 +171,9 @@ STATICFILES_FINDERS = [
 MEDIA_ROOT = str(APPS_DIR / "media")
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "/media/"
+# Storage of files only staff may download through the API, e.g. exports
+PRIVATE_FILE_STORAGE = "core.utils.storages.PrivateFileSystemStorage"
+PRIVATE_MEDIA_ROOT = str(ROOT_DIR / "private_media")
 
 # TEMPLATES
 # ------------------------------------------------------------------------------
@@ -263,14 +280,55 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 # TODO: set to whatever value is adequate in your circumstances
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # http://docs.celeryproject.org/en/latest/userguide/configuration.html#beat-schedule
-CELERY_BEAT_SCHEDULE = {}
+CELERY_BEAT_SCHEDULE = {
+    "release-expired-allocations": {
+        "task": "anphene.checkouts.tasks.release_expired_allocations_task",
+        "schedule": 60,
+    },
+}
 
 # GRAPHENE
 # ------------------------------------------------------------------------------
 GRAPHENE = {
+    "MIDDLEWARE": ["core.graph.tracing.TracingMiddleware"],
     "RELAY_CONNECTION_ENFORCE_FIRST_OR_LAST": True,
     "RELAY_CONNECTION_MAX_LIMIT": 100,
 }
+# Queries with an estimated cost over the limit are rejected before execution,
+# see `core.graph.cost`. Set to 0 to only report the cost.
+GRAPHQL_QUERY_MAX_COST = env.int("GRAPHQL_QUERY_MAX_COST", default=50000)
+# Share of GraphQL operations whose resolvers and queries are traced and logged
+# to the "anphene.graphql.tracing" logger. Staff users can request the trace in
+# the response extensions with the "X-GraphQL-Tracing" header.
+GRAPHQL_TRACING_SAMPLE_RATE = env.float("GRAPHQL_TRACING_SAMPLE_RATE", default=0.01)
+# Log traced operations executing queries for every item of a list, e.g. on
+# staging with all operations traced
+GRAPHQL_QUERY_COUNT_GUARD = env.bool("GRAPHQL_QUERY_COUNT_GUARD", default=False)
+# Threads serving GraphQL requests of an ASGI worker, each of them can hold a
+# database connection. Requests awaiting external I/O keep their thread until it
+# completes, the limit is also the number of requests served at once.
+GRAPHQL_THREAD_POOL_SIZE = env.int("GRAPHQL_THREAD_POOL_SIZE", default=16)
+# Seconds public responses of queries sent without a session are cached for,
+# by the API and by CDNs. Set to 0 to disable the cache.
+GRAPHQL_PUBLIC_CACHE_TIMEOUT = env.int("GRAPHQL_PUBLIC_CACHE_TIMEOUT", default=60)
+# Mutations of these types invalidate all cached public responses
+GRAPHQL_PUBLIC_CACHE_MUTATIONS = [
+    "anphene.attributes.schema.AttributeMutations",
+    "anphene.categories.schema.CategoryMutations",
+    "anphene.collections.schema.CollectionMutations",
+    "anphene.discounts.schema.DiscountMutations",
+    "anphene.menus.schema.MenuMutations",
+    "anphene.pages.schema.PageMutations",
+    "anphene.products.schema.ProductMutations",
+    "anphene.site.schema.ShopMutations",
+]
+# Dotted path of the serializer of GraphQL request and response bodies, see
+# `core.graph.serializers`. By default orjson is used when installed.
+GRAPHQL_JSON_SERIALIZER = env("GRAPHQL_JSON_SERIALIZER", default=None)
+# Responses shorter than this many bytes are not compressed
+RESPONSE_COMPRESSION_MIN_SIZE = env.int("RESPONSE_COMPRESSION_MIN_SIZE", default=1024)
+# Redis whose pub/sub carries changes pushed to GraphQL subscriptions of websockets
+SUBSCRIPTIONS_REDIS_URL = env("SUBSCRIPTIONS_REDIS_URL", default=CELERY_BROKER_URL)
 
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -306,6 +364,8 @@ PLACEHOLDER_IMAGES = {
     1080: "images/placeholder1080x1080.png",
 }
 DEFAULT_PLACEHOLDER = "images/placeholder255x255.png"
+# Maximum number of thumbnail URLs kept in memory by each process
+THUMBNAIL_URL_CACHE_SIZE = env.int("THUMBNAIL_URL_CACHE_SIZE", default=10000)
 
 CORS_ALLOW_METHODS = [
     "OPTIONS",
@@ -314,6 +374,9 @@ CORS_ALLOW_METHODS = [
 
 ENABLE_SSL = env.bool("ENABLE_SSL", default=False)
 MAX_CHECKOUT_LINE_QUANTITY = 50
+# Seconds stock stays reserved for a checkout since its last reservation, stock
+# of abandoned checkouts is released once it expires
+CHECKOUT_ALLOCATION_TTL = env.int("CHECKOUT_ALLOCATION_TTL", default=15 * 60)
 
 # PLUGINS
 PLUGINS_MANAGER = "anphene.plugins.manager.PluginsManager"
@@ -7,6 +7,7 @@ from django.views import defaults as default_views
 from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie, get_token
 
 from anphene.core.api import schema
+from anphene.exports.views import download_export_file
 from core.views import GraphQLView
 
 
@@ -20,9 +21,11 @@ if settings.DEBUG:
 else:
     graph_url = path("graphql/", GraphQLView.as_view(schema=schema), name="api")
 
-urlpatterns = [graph_url, path("init/", init)] + static(
-    settings.MEDIA_URL, document_root=settings.MEDIA_ROOT
-)
+urlpatterns = [
+    graph_url,
+    path("init/", init),
+    path("exports/<int:pk>/", download_export_file, name="export-file-download"),
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 
 if settings.DEBUG:
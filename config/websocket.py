@@ -1,13 +1,177 @@
+"""Websocket endpoint serving GraphQL subscriptions.
+
+Speaks the `graphql-ws` protocol of subscriptions-transport-ws, only
+subscription operations are accepted, queries and mutations go over HTTP.
+"""
+import asyncio
+import json
+from functools import partial
+from typing import Dict, Optional
+
+from django.db import close_old_connections
+from graphql import graphql, parse
+from graphql.error import format_error, GraphQLError, GraphQLSyntaxError
+from graphql.execution import ExecutionResult
+
+from anphene.core.api import schema
+from core.graph.cost import get_operation
+from core.graph.subscriptions import SubscriptionBroker, SubscriptionContext
+
+GRAPHQL_WS_PROTOCOL = "graphql-ws"
+
+_broker: Optional[SubscriptionBroker] = None
+_broker_started: Optional[asyncio.Future] = None
+
+
+async def get_broker() -> SubscriptionBroker:
+    """Return the broker of the process, listening once the first connection needs it."""
+    global _broker, _broker_started
+    broker = _broker
+    if broker is None:
+        loop = asyncio.get_running_loop()
+        broker = _broker = SubscriptionBroker(loop)
+        _broker_started = loop.run_in_executor(None, broker.start)
+    try:
+        await _broker_started
+    except Exception:
+        if _broker is broker:
+            _broker = _broker_started = None
+        raise
+    return broker
+
+
+def execute_subscription(document, context, variables, operation_name):
+    try:
+        return graphql(
+            schema,
+            document,
+            context_value=context,
+            variable_values=variables,
+            operation_name=operation_name,
+            allow_subscriptions=True,
+        )
+    finally:
+        close_old_connections()
+
+
+class GraphQLWebsocketConnection:
+    def __init__(self, send, broker: SubscriptionBroker):
+        self.send = send
+        self.context = SubscriptionContext(broker)
+        self.operations: Dict[str, object] = {}
+
+    async def send_message(self, message_type: str, operation_id=None, payload=None):
+        message = {"type": message_type}
+        if operation_id is not None:
+            message["id"] = operation_id
+        if payload is not None:
+            message["payload"] = payload
+        await self.send({"type": "websocket.send", "text": json.dumps(message)})
+
+    def push_message(self, message_type: str, operation_id, payload=None):
+        # Called by observables from the event loop, messages are sent in order
+        asyncio.ensure_future(self.send_message(message_type, operation_id, payload))
+
+    async def receive(self, message: dict):
+        message_type = message.get("type")
+        operation_id = message.get("id")
+        if message_type == "connection_init":
+            await self.send_message("connection_ack")
+        elif message_type == "start":
+            await self.start(operation_id, message.get("payload") or {})
+        elif message_type == "stop":
+            self.stop(operation_id)
+            await self.send_message("complete", operation_id)
+        elif message_type != "connection_terminate":
+            await self.send_message(
+                "error", operation_id, {"message": f"Unknown message type {message_type}."}
+            )
+
+    async def start(self, operation_id, payload: dict):
+        self.stop(operation_id)
+        try:
+            document = parse(payload.get("query") or "")
+        except GraphQLSyntaxError as e:
+            await self.send_message("error", operation_id, format_error(e))
+            return
+        operation = get_operation(document, payload.get("operationName"))
+        if operation is None or operation.operation != "subscription":
+            error = GraphQLError("Only subscriptions are served over websocket.")
+            await self.send_message("error", operation_id, format_error(error))
+            return
+
+        # Subscription resolvers check requested objects in the database
+        result = await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                execute_subscription,
+                document,
+                context=self.context,
+                variables=payload.get("variables"),
+                operation_name=payload.get("operationName"),
+            ),
+        )
+        if isinstance(result, ExecutionResult):
+            errors = [format_error(error) for error in result.errors or []]
+            await self.send_message("error", operation_id, errors[0] if errors else None)
+            return
+
+        self.operations[operation_id] = result.subscribe(
+            on_next=lambda execution_result: self.push_message(
+                "data", operation_id, self.format_result(execution_result)
+            ),
+            on_error=lambda error: self.push_message("error", operation_id, format_error(error)),
+            on_completed=lambda: self.push_message("complete", operation_id),
+        )
+
+    def stop(self, operation_id):
+        disposable = self.operations.pop(operation_id, None)
+        if disposable:
+            disposable.dispose()
+
+    def close(self):
+        for operation_id in list(self.operations):
+            self.stop(operation_id)
+
+    @staticmethod
+    def format_result(execution_result: ExecutionResult) -> dict:
+        payload = {"data": execution_result.data}
+        if execution_result.errors:
+            payload["errors"] = [format_error(error) for error in execution_result.errors]
+        return payload
+
+
 async def websocket_application(scope, receive, send):
-    while True:
-        event = await receive()
+    connection = None
+    try:
+        while True:
+            event = await receive()
 
-        if event["type"] == "websocket.connect":
-            await send({"type": "websocket.accept"})
+            if event["type"] == "websocket.connect":
+                accept = {"type": "websocket.accept"}
+                if GRAPHQL_WS_PROTOCOL in scope.get("subprotocols", []):
+                    accept["subprotocol"] = GRAPHQL_WS_PROTOCOL
+                await send(accept)
 
-        if event["type"] == "websocket.disconnect":
-            break
+            if event["type"] == "websocket.disconnect":
+                break
 
-        if event["type"] == "websocket.receive":
-            if event["text"] == "ping":
-                await send({"type": "websocket.send", "text": "pong!"})
+            if event["type"] == "websocket.receive":
+                if event.get("text") == "ping":
+                    await send({"type": "websocket.send", "text": "pong!"})
+                    continue
+                try:
+                    message = json.loads(event.get("text") or "")
+                except ValueError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                if connection is None:
+                    connection = GraphQLWebsocketConnection(send, await get_broker())
+                await connection.receive(message)
+                if message.get("type") == "connection_terminate":
+                    await send({"type": "websocket.close"})
+                    break
+    finally:
+        if connection:
+            connection.close()
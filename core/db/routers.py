@@ -0,0 +1,95 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+# Database serving reads of the current context, `None` reads from the primary
+_read_database: ContextVar[Optional[str]] = ContextVar("read_database", default=None)
+
+# Cookie set after a mutation, reads of its session go to the primary while it lasts
+PRIMARY_DATABASE_COOKIE = "use_primary_db"
+
+# Cache key set after cached data was invalidated, all reads go to the primary while it lasts
+REPLICAS_LAGGING_CACHE_KEY = "database_replicas:lagging"
+
+
+class ReplicaRouter:
+    """Route reads to the replica chosen for the current context.
+
+    Reads go to the primary database unless a replica is explicitly chosen with
+    `use_database_for_reads`, management commands and tasks are never affected.
+    Writes and migrations always go to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            # Related objects are read from the same database as the instance
+            return instance._state.db
+        return _read_database.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def use_database_for_reads(alias: Optional[str]):
+    token = _read_database.set(alias)
+    try:
+        yield
+    finally:
+        _read_database.reset(token)
+
+
+def get_replica_for_request(request: HttpRequest) -> Optional[str]:
+    """Return a replica serving reads of the request, `None` if it has to use the primary."""
+    if not settings.DATABASE_REPLICAS:
+        return None
+    if request.COOKIES.get(PRIMARY_DATABASE_COOKIE):
+        # The session wrote data the replicas could have not received yet
+        return None
+    if cache.get(REPLICAS_LAGGING_CACHE_KEY):
+        return None
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+def mark_replicas_lagging():
+    """Make requests read from the primary until replicas receive committed changes.
+
+    Called once cached data is invalidated, otherwise a request reading from
+    a lagging replica would cache the old data under the new cache version.
+    """
+    if settings.DATABASE_REPLICAS:
+        cache.set(REPLICAS_LAGGING_CACHE_KEY, True, timeout=settings.DATABASE_REPLICA_STICKINESS)
+
+
+def use_primary_database(resolver):
+    """Force a resolver to read from the primary database.
+
+    Querysets returned by the resolver are bound to the primary as well, since
+    they are evaluated once the resolver returns.
+    """
+
+    @wraps(resolver)
+    def wrapper(*args, **kwargs):
+        with use_database_for_reads(None):
+            result = resolver(*args, **kwargs)
+        if isinstance(result, QuerySet):
+            return result.using(DEFAULT_DB_ALIAS)
+        return result
+
+    return wrapper
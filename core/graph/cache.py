@@ -0,0 +1,89 @@
+"""Cache of public GraphQL responses.
+
+Responses of queries sent without a session are the same for every visitor,
+they are cached under the version of the catalogue and served with `ETag`
+and `Cache-Control` headers, so a CDN can serve repeats as well. Mutations
+changing public data bump the version, see `GRAPHQL_PUBLIC_CACHE_MUTATIONS`.
+"""
+import hashlib
+import json
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+from graphene.utils.str_converters import to_camel_case
+from graphql.language import ast
+
+from ..utils.cache import bump_cache_version, get_cache_version
+
+PUBLIC_CACHE_NAMESPACE = "graphql_public_responses"
+
+
+def is_public_request(request: HttpRequest) -> bool:
+    """Return whether the response cannot depend on who sent the request.
+
+    Without a session cookie the user is anonymous, the session is not read so
+    that public responses do not vary on cookies.
+    """
+    return bool(settings.GRAPHQL_PUBLIC_CACHE_TIMEOUT) and (
+        settings.SESSION_COOKIE_NAME not in request.COOKIES
+    )
+
+
+def get_public_cache_key(request: HttpRequest, data: dict) -> str:
+    params = [
+        request.get_host(),
+        data.get("query"),
+        data.get("variables"),
+        data.get("operationName"),
+    ]
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode())
+    return f"{PUBLIC_CACHE_NAMESPACE}:{digest.hexdigest()}"
+
+
+def get_etag(content: bytes) -> str:
+    return hashlib.md5(content).hexdigest()
+
+
+def get_public_response(key: str) -> Optional[Tuple[str, bytes]]:
+    """Return the ETag and content of the cached response."""
+    return cache.get(key, version=get_cache_version(PUBLIC_CACHE_NAMESPACE))
+
+
+def set_public_response(key: str, content: bytes) -> str:
+    etag = get_etag(content)
+    cache.set(
+        key,
+        (etag, content),
+        timeout=settings.GRAPHQL_PUBLIC_CACHE_TIMEOUT,
+        version=get_cache_version(PUBLIC_CACHE_NAMESPACE),
+    )
+    return etag
+
+
+@lru_cache()
+def get_public_cache_mutations() -> FrozenSet[str]:
+    fields = set()
+    for path in settings.GRAPHQL_PUBLIC_CACHE_MUTATIONS:
+        fields.update(to_camel_case(name) for name in import_string(path)._meta.fields)
+    return frozenset(fields)
+
+
+def get_root_field_names(operation: ast.OperationDefinition) -> Optional[FrozenSet[str]]:
+    """Return names of root fields of the operation, `None` if it uses fragments."""
+    names = set()
+    for selection in operation.selection_set.selections:
+        if not isinstance(selection, ast.Field):
+            return None
+        names.add(selection.name.value)
+    return frozenset(names)
+
+
+def invalidate_public_cache(operation: ast.OperationDefinition):
+    """Bump the version of cached responses if the mutation changes public data."""
+    names = get_root_field_names(operation)
+    if names is None or names & get_public_cache_mutations():
+        bump_cache_version(PUBLIC_CACHE_NAMESPACE)
@@ -1,11 +1,106 @@
-from typing import Any, Dict
+import hashlib
+from typing import Any, Dict, Optional, Tuple
 
 import graphene
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
 from graphene.relay.connection import Connection
 from graphene_django.types import DjangoObjectType
 
 ConnectionArguments = Dict[str, Any]
 
+# Total count of a connection and whether it is exact
+TotalCount = Tuple[int, bool]
+
+
+class CountStrategy:
+    """Way of counting all items of a connection for its `totalCount`."""
+
+    def count(self, queryset: QuerySet) -> TotalCount:
+        raise NotImplementedError()
+
+
+class ExactCount(CountStrategy):
+    def count(self, queryset: QuerySet) -> TotalCount:
+        return queryset.count(), True
+
+
+class CappedCount(CountStrategy):
+    """Count items up to `limit`, bigger connections report `limit` as not exact."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+
+    def count(self, queryset: QuerySet) -> TotalCount:
+        count = queryset.order_by()[: self.limit + 1].count()
+        if count > self.limit:
+            return self.limit, False
+        return count, True
+
+
+class EstimatedCount(CountStrategy):
+    """Report the number of rows estimated by the query planner.
+
+    Estimates under `threshold` are replaced with exact counts, the planner
+    is the least accurate for small and heavily filtered results.
+    """
+
+    def __init__(self, threshold: int = 1000):
+        self.threshold = threshold
+
+    def count(self, queryset: QuerySet) -> TotalCount:
+        if connections[queryset.db].vendor != "postgresql":
+            return queryset.count(), True
+        # `QuerySet.explain` returns the plan as text, psycopg2 decodes JSON itself
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate < self.threshold:
+            return queryset.count(), True
+        return estimate, False
+
+
+class CachedCount(CountStrategy):
+    """Count items exactly and reuse the count for the same query for `timeout` seconds."""
+
+    def __init__(self, timeout: int = 60):
+        self.timeout = timeout
+
+    def count(self, queryset: QuerySet) -> TotalCount:
+        sql, params = queryset.order_by().query.sql_with_params()
+        fingerprint = hashlib.md5(f"{sql}:{params!r}".encode()).hexdigest()
+        key = f"connection_count:{queryset.db}:{fingerprint}"
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, timeout=self.timeout)
+        return count, True
+
+
+exact_count = ExactCount()
+
+
+def get_total_count(root) -> TotalCount:
+    """Count all items of the resolved connection, at most once per connection."""
+    total_count = getattr(root, "_total_count", None)
+    if total_count is not None:
+        return total_count
+
+    iterable = root.iterable
+    length: Optional[int] = getattr(root, "length", None)
+    if isinstance(iterable, list):
+        total_count = len(iterable), True
+    elif length is not None:
+        total_count = length, True
+    else:
+        strategy = getattr(root, "count_strategy", None) or exact_count
+        total_count = strategy.count(iterable)
+    root._total_count = total_count
+    return total_count
+
 
 class NonNullConnection(Connection):
     class Meta:
@@ -40,12 +135,22 @@ class CountableConnection(NonNullConnection):
         abstract = True
 
     total_count = graphene.Int(description="A total count of items in the collections.")
+    total_count_is_exact = graphene.Boolean(
+        description=(
+            "Whether the total count is exact, it is a lower bound or an estimate "
+            "for large collections otherwise."
+        )
+    )
 
     @staticmethod
     def resolve_total_count(root, *_args, **_kwargs):
-        if isinstance(root.iterable, list):
-            return len(root.iterable)
-        return root.length
+        count, _ = get_total_count(root)
+        return count
+
+    @staticmethod
+    def resolve_total_count_is_exact(root, *_args, **_kwargs):
+        _, is_exact = get_total_count(root)
+        return is_exact
 
 
 class CountableDjangoObjectType(DjangoObjectType):
@@ -0,0 +1,223 @@
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+from django.conf import settings
+from graphene.relay.connection import Connection
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLSchema
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import (
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLUnionType,
+    get_named_type,
+)
+from graphql.utils.type_from_ast import type_from_ast
+from graphql.utils.value_from_ast import value_from_ast
+
+
+class FieldCost(NamedTuple):
+    """Estimated cost of resolving a field.
+
+    `complexity` is the cost of a single resolved object and `list_size` the
+    expected number of objects returned by a list field. Types declare costs of
+    their fields in a `field_costs` mapping of field names to `FieldCost`.
+    """
+
+    complexity: int = 1
+    list_size: Optional[int] = None
+
+
+# Expected size of list fields without declared costs
+DEFAULT_LIST_SIZE = 10
+
+
+class QueryCostError(GraphQLError):
+    pass
+
+
+def get_max_query_cost() -> Optional[int]:
+    """Return the maximum cost of executed queries, `None` when it is not limited."""
+    return settings.GRAPHQL_QUERY_MAX_COST or None
+
+
+def get_operation(document: ast.Document, operation_name: Optional[str]):
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, ast.OperationDefinition)
+    ]
+    if operation_name is None:
+        return operations[0] if len(operations) == 1 else None
+    for operation in operations:
+        if operation.name and operation.name.value == operation_name:
+            return operation
+    return None
+
+
+class QueryCostAnalyzer:
+    """Estimate the cost of executing a query without resolving any field.
+
+    Each resolved object costs its `complexity` and nested selections are
+    multiplied by the number of objects their field returns: `first` or `last`
+    argument of connections and declared or default size of lists.
+    """
+
+    def __init__(self, schema: GraphQLSchema, document: ast.Document, variables: Dict):
+        self.schema = schema
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        self.variables = variables if isinstance(variables, dict) else {}
+        # Costs of fragments by their name and type, spreads are not walked again
+        self.fragment_costs: Dict[Tuple[str, str], int] = {}
+
+    def get_operation_cost(self, operation: ast.OperationDefinition) -> int:
+        if operation.operation == "mutation":
+            root_type = self.schema.get_mutation_type()
+        elif operation.operation == "subscription":
+            root_type = self.schema.get_subscription_type()
+        else:
+            root_type = self.schema.get_query_type()
+        if root_type is None:
+            return 0
+
+        self.variables = self.get_variables(operation)
+        self.fragment_costs = {}
+        return self.get_selection_set_cost(root_type, operation.selection_set, set())
+
+    def get_variables(self, operation: ast.OperationDefinition) -> Dict[str, Any]:
+        variables = {}
+        for definition in operation.variable_definitions or []:
+            name = definition.variable.name.value
+            if name in self.variables:
+                variables[name] = self.variables[name]
+            elif definition.default_value is not None:
+                variable_type = type_from_ast(self.schema, definition.type)
+                variables[name] = value_from_ast(definition.default_value, variable_type)
+        return variables
+
+    def get_selection_set_cost(
+        self, parent_type, selection_set: Optional[ast.SelectionSet], fragments: Set[str]
+    ) -> int:
+        if selection_set is None:
+            return 0
+
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                cost += self.get_field_cost(parent_type, selection, fragments)
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = self.get_type_condition(selection, parent_type)
+                cost += self.get_selection_set_cost(
+                    fragment_type, selection.selection_set, fragments
+                )
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                # Cycles are reported by the validation, they are not followed here
+                if fragment is None or name in fragments:
+                    continue
+                fragment_type = self.get_type_condition(fragment, parent_type)
+                cost += self.get_fragment_cost(name, fragment, fragment_type, fragments)
+        return cost
+
+    def get_fragment_cost(
+        self, name: str, fragment: ast.FragmentDefinition, fragment_type, fragments: Set[str]
+    ) -> int:
+        key = (name, str(fragment_type))
+        if key not in self.fragment_costs:
+            self.fragment_costs[key] = self.get_selection_set_cost(
+                fragment_type, fragment.selection_set, fragments | {name}
+            )
+        return self.fragment_costs[key]
+
+    def get_type_condition(self, fragment, parent_type):
+        if fragment.type_condition is None:
+            return parent_type
+        return self.schema.get_type(fragment.type_condition.name.value) or parent_type
+
+    def get_field_cost(self, parent_type, field: ast.Field, fragments: Set[str]) -> int:
+        if not isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+            return 0
+        field_def = parent_type.fields.get(field.name.value)
+        if field_def is None:
+            return 0
+
+        field_type = get_named_type(field_def.type)
+        if not isinstance(field_type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)):
+            return 0
+
+        field_cost = get_declared_field_cost(parent_type, field.name.value)
+        children_cost = self.get_selection_set_cost(field_type, field.selection_set, fragments)
+        cost = field_cost.complexity + children_cost
+        return cost * self.get_multiplier(parent_type, field_def, field, field_cost)
+
+    def get_multiplier(
+        self, parent_type, field_def: GraphQLField, field: ast.Field, field_cost: FieldCost
+    ) -> int:
+        if "first" in field_def.args or "last" in field_def.args:
+            args = self.get_arguments(field_def, field)
+            limit = args.get("first") or args.get("last")
+            if isinstance(limit, int) and limit > 0:
+                return limit
+            return graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+
+        if not is_list_type(field_def.type):
+            return 1
+        # Edges are already multiplied by the size requested from their connection
+        if is_connection_type(parent_type):
+            return 1
+        if field_cost.list_size is not None:
+            return field_cost.list_size
+        return DEFAULT_LIST_SIZE
+
+    def get_arguments(self, field_def: GraphQLField, field: ast.Field) -> Dict[str, Any]:
+        args = {}
+        for argument in field.arguments or []:
+            arg_def = field_def.args.get(argument.name.value)
+            if arg_def is None:
+                continue
+            try:
+                args[argument.name.value] = value_from_ast(
+                    argument.value, arg_def.type, self.variables
+                )
+            except Exception:
+                # Invalid arguments are reported by the validation
+                continue
+        return args
+
+
+def is_list_type(graphql_type) -> bool:
+    if isinstance(graphql_type, GraphQLNonNull):
+        graphql_type = graphql_type.of_type
+    return isinstance(graphql_type, GraphQLList)
+
+
+def is_connection_type(graphql_type) -> bool:
+    graphene_type = getattr(graphql_type, "graphene_type", None)
+    return isinstance(graphene_type, type) and issubclass(graphene_type, Connection)
+
+
+def get_declared_field_cost(graphql_type, field_name: str) -> FieldCost:
+    graphene_type = getattr(graphql_type, "graphene_type", None)
+    field_costs = getattr(graphene_type, "field_costs", {})
+    return field_costs.get(field_name, FieldCost())
+
+
+def get_query_cost(
+    schema: GraphQLSchema,
+    document: ast.Document,
+    variables: Optional[Dict],
+    operation_name: Optional[str] = None,
+) -> int:
+    """Return the estimated cost of executing the operation of the document."""
+    operation = get_operation(document, operation_name)
+    if operation is None:
+        return 0
+    return QueryCostAnalyzer(schema, document, variables).get_operation_cost(operation)
@@ -4,6 +4,8 @@ from django.http import HttpRequest
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from .tracing import get_request_trace
+
 
 class DataLoader(BaseLoader):
     context_key = None
@@ -27,8 +29,19 @@ class DataLoader(BaseLoader):
             self.user = context.user
             super().__init__()
 
+    def load(self, key=None):
+        trace = get_request_trace(self.context)
+        if trace is not None and self.cache and self.get_cache_key(key) in self._promise_cache:
+            trace.record_cache_hit(type(self).__name__)
+        return super().load(key)
+
     def batch_load_fn(self, keys):
-        results = self.batch_load(keys)
+        trace = get_request_trace(self.context)
+        if trace is None:
+            results = self.batch_load(keys)
+        else:
+            with trace.loader_batch(type(self).__name__, len(keys)):
+                results = self.batch_load(keys)
         if not isinstance(results, Promise):
             return Promise.resolve(results)
         return results
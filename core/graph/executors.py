@@ -0,0 +1,58 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, Optional
+
+from promise import Promise
+
+
+class EventLoopExecutor:
+    """Execute resolvers in the request thread and await their coroutines on an event loop.
+
+    Resolvers are plain functions, but a resolver doing external I/O can return a
+    coroutine, e.g. by being declared with `async def`. Coroutines run concurrently
+    on the event loop of the ASGI server, while ORM work, dataloaders and promises
+    stay in the request thread, as none of them may be shared between threads.
+
+    The request thread waits until all coroutines of the operation finish, so a
+    request awaiting a slow upstream service still holds its thread of the pool,
+    see `GRAPHQL_THREAD_POOL_SIZE`. What is gained is that coroutines of the same
+    operation run concurrently and that waiting does not block the event loop.
+
+    Without an event loop, e.g. under WSGI or in management commands, coroutines
+    are run to completion one by one.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.futures: Dict[Future, Promise] = {}
+
+    def execute(self, fn, *args, **kwargs):
+        result = fn(*args, **kwargs)
+        if not asyncio.iscoroutine(result):
+            return result
+        if self.loop is None:
+            return asyncio.run(result)
+
+        future = asyncio.run_coroutine_threadsafe(result, self.loop)
+        promise = Promise()
+        self.futures[future] = promise
+        return promise
+
+    def wait_until_finished(self):
+        # Promises are settled in the request thread, values completed by them
+        # can await again
+        while self.futures:
+            done, _ = wait(self.futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                promise = self.futures.pop(future)
+                try:
+                    value = future.result()
+                except Exception as e:
+                    promise.do_reject(e)
+                else:
+                    promise.do_resolve(value)
+
+    def clean(self):
+        for future in self.futures:
+            future.cancel()
+        self.futures = {}
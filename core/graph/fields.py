@@ -1,13 +1,24 @@
 import json
 from functools import partial
+from typing import Any, List, Optional
 
 import graphene
 import graphene_django_optimizer as gql_optimizer
-from django.core.exceptions import FieldError
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q, QuerySet
+from graphene.relay import PageInfo
 from graphene_django.fields import DjangoConnectionField
+from graphene_django.utils import maybe_queryset
 from graphql.error import GraphQLError
+from graphql_relay.connection.arrayconnection import get_offset_with_default, offset_to_cursor
+from graphql_relay.utils import base64, unbase64
 from promise import Promise
 
+from .connection import CountStrategy, exact_count
+
+KEYSET_CURSOR_PREFIX = "keyset"
+
 
 def patch_pagination_args(field: DjangoConnectionField):
     """Add descriptions to pagination arguments in a connection field.
@@ -25,17 +36,172 @@ def patch_pagination_args(field: DjangoConnectionField):
     ].description = "Return the elements in the list that come after the specified cursor."
 
 
+def get_keyset_ordering(queryset: QuerySet) -> Optional[List[str]]:
+    """Return fields the queryset is ordered by, ended with the PK tie-breaker.
+
+    Return None if the queryset is ordered by expressions, rows can't be
+    identified in such ordering.
+    """
+    query = queryset.query
+    ordering = query.order_by or (query.get_meta().ordering if query.default_ordering else [])
+    keyset_ordering = []
+    for field in ordering:
+        if not isinstance(field, str) or field == "?":
+            return None
+        keyset_ordering.append(field)
+        if field.lstrip("-") in ("pk", query.get_meta().pk.name):
+            return keyset_ordering
+    return keyset_ordering + ["pk"]
+
+
+def _is_nullable(model, field_name: str) -> bool:
+    if field_name == "pk":
+        return False
+    try:
+        return model._meta.get_field(field_name).null
+    except FieldDoesNotExist:
+        # Annotations and lookups spanning relations
+        return True
+
+
+def get_keyset_lookup(model, ordering: List[str], values: List[Any], reverse=False) -> Q:
+    """Return lookup matching rows placed after given values in the ordering.
+
+    The lookup is the expanded form of `(k1, k2, pk) > (v1, v2, v_pk)` which also
+    supports mixed directions and NULLs, sorted last in ascending order as Postgres
+    does. With `reverse` it matches rows placed before the values.
+    """
+    lookup = Q(pk__in=[])
+    preceding_equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        descending = field.startswith("-") != reverse
+        nullable = _is_nullable(model, name)
+        if value is None:
+            after = Q(**{f"{name}__isnull": False}) if descending else None
+            equal = Q(**{f"{name}__isnull": True})
+        else:
+            after = Q(**{f"{name}__lt" if descending else f"{name}__gt": value})
+            if nullable and not descending:
+                after |= Q(**{f"{name}__isnull": True})
+            equal = Q(**{name: value})
+        if after is not None:
+            lookup |= preceding_equal & after
+        preceding_equal &= equal
+
+    # Redundant bound on the leading key lets the database use a range scan
+    field, value = ordering[0], values[0]
+    name = field.lstrip("-")
+    if value is not None and not _is_nullable(model, name):
+        descending = field.startswith("-") != reverse
+        lookup &= Q(**{f"{name}__lte" if descending else f"{name}__gte": value})
+    return lookup
+
+
+def get_keyset_values(node, ordering: List[str]) -> List[Any]:
+    values = []
+    for index, field in enumerate(ordering):
+        name = field.lstrip("-")
+        if name == "pk":
+            values.append(node.pk)
+        elif "__" in name:
+            values.append(getattr(node, f"keyset_value_{index}"))
+        else:
+            values.append(getattr(node, name))
+    return values
+
+
+def to_keyset_cursor(node, ordering: List[str]) -> str:
+    values = get_keyset_values(node, ordering)
+    return base64(json.dumps([KEYSET_CURSOR_PREFIX, ordering, values], cls=DjangoJSONEncoder))
+
+
+def from_keyset_cursor(cursor: str, ordering: List[str]) -> List[Any]:
+    """Return ordering values encoded in the cursor.
+
+    Cursors are valid only for the ordering they were created with.
+    """
+    try:
+        prefix, cursor_ordering, values = json.loads(unbase64(cursor))
+    except (TypeError, ValueError):
+        raise GraphQLError("Received cursor is invalid.")
+    if (
+        prefix != KEYSET_CURSOR_PREFIX
+        or cursor_ordering != ordering
+        or not isinstance(values, list)
+        or len(values) != len(ordering)
+    ):
+        raise GraphQLError("Received cursor is invalid.")
+    return values
+
+
 class BaseConnectionField(graphene.ConnectionField):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         patch_pagination_args(self)
 
 
+def _with_count_strategy(count_strategy: CountStrategy, connection):
+    connection.count_strategy = count_strategy
+    return connection
+
+
+def resolve_with_count_strategy(resolver, count_strategy: CountStrategy, *args, **kwargs):
+    connection = resolver(*args, **kwargs)
+    if Promise.is_thenable(connection):
+        return Promise.resolve(connection).then(partial(_with_count_strategy, count_strategy))
+    return _with_count_strategy(count_strategy, connection)
+
+
 class BaseDjangoConnectionField(DjangoConnectionField):
+    """Django connection field counting items only when `totalCount` is requested.
+
+    `count_strategy` decides how `totalCount` is computed, items are counted
+    exactly by default.
+    """
+
     def __init__(self, *args, **kwargs):
+        self.count_strategy = kwargs.pop("count_strategy", None) or exact_count
         super().__init__(*args, **kwargs)
         patch_pagination_args(self)
 
+    @classmethod
+    def resolve_connection(cls, connection, args, iterable):
+        iterable = maybe_queryset(iterable)
+        first = args.get("first")
+        paginates_forward = (
+            isinstance(first, int) and args.get("last") is None and not args.get("before")
+        )
+        if not isinstance(iterable, QuerySet) or not paginates_forward:
+            # Paginating backward needs the length of the whole list
+            return super().resolve_connection(connection, args, iterable)
+
+        # Fetch one more item to know whether there is a next page without counting
+        start = get_offset_with_default(args.get("after"), -1) + 1
+        nodes = list(iterable[start : start + first + 1])
+        has_next_page = len(nodes) > first
+        edges = [
+            connection.Edge(node=node, cursor=offset_to_cursor(start + index))
+            for index, node in enumerate(nodes[:first])
+        ]
+        page_info = PageInfo(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=False,
+            has_next_page=has_next_page,
+        )
+        connection = connection(edges=edges, page_info=page_info)
+        connection.iterable = iterable
+        connection.length = None
+        return connection
+
+    def get_resolver(self, parent_resolver):
+        return partial(
+            resolve_with_count_strategy,
+            super().get_resolver(parent_resolver),
+            self.count_strategy,
+        )
+
 
 class PrefetchingConnectionField(BaseDjangoConnectionField):
     @classmethod
@@ -71,7 +237,17 @@ class PrefetchingConnectionField(BaseDjangoConnectionField):
 
 
 class FilterInputConnectionField(PrefetchingConnectionField):
+    """Connection field with filtering and sorting inputs.
+
+    With `keyset_pagination=True` cursors encode the sort key values of a row
+    instead of its offset, so pages are fetched with range conditions, stay fast
+    however deep they are and don't shift when rows are added or removed.
+    """
+
     def __init__(self, *args, **kwargs):
+        # PAGINATION
+        self.keyset_pagination = kwargs.pop("keyset_pagination", False)
+
         # FILTER
         self.filter_field_name = kwargs.pop("filter_field_name", "filter")
         self.filter_input = kwargs.get(self.filter_field_name)
@@ -98,6 +274,7 @@ class FilterInputConnectionField(PrefetchingConnectionField):
         filterset_class,
         filters_name,
         sort_enum,
+        keyset_pagination,
         root,
         info,
         **args,
@@ -151,7 +328,10 @@ class FilterInputConnectionField(PrefetchingConnectionField):
         # but iterable might be promise
         iterable = queryset_resolver(connection, iterable, info, args)
 
-        on_resolve = partial(cls.resolve_connection, connection, args)
+        if keyset_pagination:
+            on_resolve = partial(cls.resolve_keyset_connection, connection, args)
+        else:
+            on_resolve = partial(cls.resolve_connection, connection, args)
 
         filter_input = args.get(filters_name)
 
@@ -174,4 +354,61 @@ class FilterInputConnectionField(PrefetchingConnectionField):
             self.filterset_class,
             self.filter_field_name,
             self.sort_enum,
+            self.keyset_pagination,
+        )
+
+    @classmethod
+    def resolve_keyset_connection(cls, connection, args, iterable):
+        iterable = maybe_queryset(iterable)
+        ordering = get_keyset_ordering(iterable) if isinstance(iterable, QuerySet) else None
+        if ordering is None:
+            return cls.resolve_connection(connection, args, iterable)
+
+        queryset = iterable.order_by(*ordering).annotate(
+            **{
+                f"keyset_value_{index}": F(field.lstrip("-"))
+                for index, field in enumerate(ordering)
+                if "__" in field
+            }
+        )
+        model = queryset.model
+
+        after = args.get("after")
+        if after:
+            values = from_keyset_cursor(after, ordering)
+            queryset = queryset.filter(get_keyset_lookup(model, ordering, values))
+        before = args.get("before")
+        if before:
+            values = from_keyset_cursor(before, ordering)
+            queryset = queryset.filter(get_keyset_lookup(model, ordering, values, reverse=True))
+
+        first = args.get("first")
+        last = args.get("last")
+        has_previous_page = has_next_page = False
+        if isinstance(first, int):
+            nodes = list(queryset[: first + 1])
+            has_next_page = len(nodes) > first
+            nodes = nodes[:first]
+            if isinstance(last, int):
+                has_previous_page = len(nodes) > last
+                nodes = nodes[len(nodes) - last :] if last else []
+        elif isinstance(last, int):
+            nodes = list(queryset.reverse()[: last + 1])
+            has_previous_page = len(nodes) > last
+            nodes = nodes[:last][::-1]
+        else:
+            nodes = list(queryset)
+
+        edges = [
+            connection.Edge(node=node, cursor=to_keyset_cursor(node, ordering)) for node in nodes
+        ]
+        page_info = PageInfo(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=has_previous_page,
+            has_next_page=has_next_page,
         )
+        connection = connection(edges=edges, page_info=page_info)
+        connection.iterable = iterable
+        connection.length = None
+        return connection
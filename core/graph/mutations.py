@@ -12,7 +12,12 @@ from graphene_django.registry import get_global_registry
 from graphql.error import GraphQLError
 
 from .types import Error, Upload
-from .utils import from_global_id_strict_type, get_nodes, snake_to_camel_case
+from .utils import (
+    from_global_id_strict_type,
+    get_nodes,
+    resolve_global_ids_to_primary_keys,
+    snake_to_camel_case,
+)
 from ..exceptions import PermissionDenied
 
 permissions = importlib.import_module(f"{settings.APP_NAME}.core.permissions")
@@ -156,6 +161,15 @@ class BaseMutation(graphene.Mutation):
             raise ValidationError({field: ValidationError(str(e), code="graphql_error")})
         return instances
 
+    @classmethod
+    def get_pks_or_error(cls, ids, field, only_type=None):
+        """Resolve global IDs to primary keys without fetching the nodes."""
+        try:
+            _, pks = resolve_global_ids_to_primary_keys(ids, only_type)
+            return [int(pk) for pk in pks]
+        except (GraphQLError, ValueError) as e:
+            raise ValidationError({field: ValidationError(str(e), code="graphql_error")})
+
     @classmethod
     def clean_instance(cls, info, instance):
         """Clean the instance that was created using the input data.
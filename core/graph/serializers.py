@@ -0,0 +1,52 @@
+"""JSON serializers of GraphQL request and response bodies.
+
+The serializer is picked with the `GRAPHQL_JSON_SERIALIZER` setting, by default
+`orjson` is used when installed and the standard library otherwise. Both produce
+bytes, which are used as the response content as they are.
+"""
+import json
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONSerializer:
+    """Serializer of the standard library, encoding what `JsonResponse` does."""
+
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+    def dumps(self, data: Any) -> bytes:
+        return self.encoder.encode(data).encode("utf-8")
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class ORJSONSerializer(JSONSerializer):
+    """Serializer of `orjson`, values it does not know are encoded as by Django."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("ORJSONSerializer requires the orjson package.")
+
+    def dumps(self, data: Any) -> bytes:
+        # Decimals and lazy translations can still be found in errors and JSON scalars
+        return orjson.dumps(data, default=self.encoder.default, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+@lru_cache()
+def get_serializer() -> JSONSerializer:
+    if settings.GRAPHQL_JSON_SERIALIZER:
+        return import_string(settings.GRAPHQL_JSON_SERIALIZER)()
+    return ORJSONSerializer() if orjson is not None else JSONSerializer()
@@ -0,0 +1,112 @@
+"""GraphQL subscriptions fed by Redis pub/sub.
+
+Changes are published to Redis channels once their transaction commits. Every
+websocket worker listens to all channels of the namespace with a single
+connection and fans messages out to the subscriptions of its connections.
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import redis
+from django.conf import settings
+from rx import Observable
+
+logger = logging.getLogger("anphene.graphql.subscriptions")
+
+CHANNEL_PREFIX = "anphene.subscriptions."
+
+Subscriber = Callable[[dict], None]
+
+
+def get_channel(name: str) -> str:
+    return f"{CHANNEL_PREFIX}{name}"
+
+
+@lru_cache()
+def get_redis() -> redis.Redis:
+    return redis.Redis.from_url(settings.SUBSCRIPTIONS_REDIS_URL)
+
+
+def publish(messages: Iterable[Tuple[str, dict]]):
+    """Publish messages to their channels in a single round trip.
+
+    Pushes are best effort, an unavailable Redis does not fail the change.
+    """
+    pipeline = get_redis().pipeline(transaction=False)
+    for channel, message in messages:
+        pipeline.publish(channel, json.dumps(message))
+    try:
+        pipeline.execute()
+    except redis.RedisError:
+        logger.exception("Unable to publish subscription messages")
+
+
+class SubscriptionBroker:
+    """Deliver messages of the Redis channels to subscribers of the process.
+
+    Messages are received in a thread of the Redis client and handed over to
+    the event loop, subscribers are always called from it.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.subscribers: Dict[str, Set[Subscriber]] = defaultdict(set)
+        self.listener = None
+
+    def start(self):
+        pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(**{f"{CHANNEL_PREFIX}*": self.receive})
+        self.listener = pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+    def stop(self):
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+
+    def receive(self, message):
+        channel = message["channel"].decode()
+        if channel in self.subscribers:
+            self.loop.call_soon_threadsafe(self.dispatch, channel, message["data"])
+
+    def dispatch(self, channel: str, data: bytes):
+        message = json.loads(data)
+        for subscriber in list(self.subscribers.get(channel, ())):
+            subscriber(message)
+
+    def subscribe(self, channels: List[str], subscriber: Subscriber):
+        for channel in channels:
+            self.subscribers[channel].add(subscriber)
+
+    def unsubscribe(self, channels: List[str], subscriber: Subscriber):
+        for channel in channels:
+            self.subscribers[channel].discard(subscriber)
+            if not self.subscribers[channel]:
+                del self.subscribers[channel]
+
+
+class SubscriptionContext:
+    """Context of operations executed over a websocket connection."""
+
+    def __init__(self, broker: SubscriptionBroker):
+        self.broker = broker
+
+
+def subscribe_to_channels(info, channels: List[str]) -> Observable:
+    """Return an observable of messages published to any of the channels.
+
+    Subscription fields resolve to it, the fields of the subscription are then
+    resolved with each message as their value.
+    """
+    broker = info.context.broker
+
+    def subscribe(observer):
+        # Disposed observers replace their callbacks, keep the subscribed one
+        on_next = observer.on_next
+        broker.subscribe(channels, on_next)
+        return lambda: broker.unsubscribe(channels, on_next)
+
+    return Observable.create(subscribe)
@@ -0,0 +1,200 @@
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager, ExitStack
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest
+from graphene.utils.str_converters import to_camel_case
+
+logger = logging.getLogger("anphene.graphql.tracing")
+query_count_logger = logging.getLogger("anphene.graphql.query_count")
+
+TRACING_HEADER = "HTTP_X_GRAPHQL_TRACING"
+
+# Queries executed outside of any resolver or dataloader batch
+UNATTRIBUTED_SCOPE = ("request", "")
+
+
+@dataclass
+class FieldStats:
+    calls: int = 0
+    duration: float = 0
+    queries: int = 0
+    query_duration: float = 0
+
+
+@dataclass
+class LoaderStats:
+    batches: int = 0
+    keys: int = 0
+    max_batch_size: int = 0
+    cache_hits: int = 0
+    duration: float = 0
+    queries: int = 0
+    query_duration: float = 0
+
+
+class RequestTrace:
+    """Timings and database queries of a single GraphQL operation.
+
+    Queries are attributed to the innermost running resolver or dataloader
+    batch. Resolve time of a field only covers its resolver, promises are
+    completed later and counted in the dataloader batches.
+    """
+
+    def __init__(self, operation_name: Optional[str] = None):
+        self.operation_name = operation_name
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.fields: Dict[str, FieldStats] = defaultdict(FieldStats)
+        self.loaders: Dict[str, LoaderStats] = defaultdict(LoaderStats)
+        self.scopes: List[Tuple[str, str]] = []
+        self.unattributed = FieldStats()
+
+    @contextmanager
+    def field(self, path: str):
+        self.scopes.append(("field", path))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = self.fields[path]
+            stats.calls += 1
+            stats.duration += time.perf_counter() - start
+            self.scopes.pop()
+
+    @contextmanager
+    def loader_batch(self, name: str, batch_size: int):
+        self.scopes.append(("loader", name))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = self.loaders[name]
+            stats.batches += 1
+            stats.keys += batch_size
+            stats.max_batch_size = max(stats.max_batch_size, batch_size)
+            stats.duration += time.perf_counter() - start
+            self.scopes.pop()
+
+    def record_cache_hit(self, name: str):
+        self.loaders[name].cache_hits += 1
+
+    def record_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            kind, key = self.scopes[-1] if self.scopes else UNATTRIBUTED_SCOPE
+            if kind == "field":
+                stats = self.fields[key]
+            elif kind == "loader":
+                stats = self.loaders[key]
+            else:
+                stats = self.unattributed
+            stats.queries += 1
+            stats.query_duration += time.perf_counter() - start
+
+    @contextmanager
+    def record(self):
+        """Record queries of all database connections until the block exits."""
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self.record_query))
+            try:
+                yield self
+            finally:
+                self.duration = time.perf_counter() - self.start
+
+    def as_dict(self) -> dict:
+        fields = sorted(self.fields.items(), key=lambda item: -item[1].duration)
+        queries = sum(stats.queries for stats in self.fields.values())
+        queries += sum(stats.queries for stats in self.loaders.values())
+        return {
+            "operationName": self.operation_name,
+            "duration": self.duration,
+            "queries": queries + self.unattributed.queries,
+            "unattributedQueries": self.unattributed.queries,
+            "fields": [{"path": path, **stats_as_dict(stats)} for path, stats in fields],
+            "dataloaders": [
+                {"name": name, **stats_as_dict(stats)}
+                for name, stats in sorted(self.loaders.items())
+            ],
+        }
+
+
+def stats_as_dict(stats) -> dict:
+    return {to_camel_case(key): value for key, value in asdict(stats).items()}
+
+
+def get_request_trace(request: HttpRequest) -> Optional[RequestTrace]:
+    return getattr(request, "graphql_trace", None)
+
+
+def is_tracing_requested(request: HttpRequest) -> bool:
+    """Return whether the trace should be returned in the response extensions."""
+    user = getattr(request, "user", None)
+    return bool(request.META.get(TRACING_HEADER)) and getattr(user, "is_staff", False)
+
+
+def should_trace(request: HttpRequest) -> bool:
+    if is_tracing_requested(request):
+        return True
+    return random.random() < settings.GRAPHQL_TRACING_SAMPLE_RATE
+
+
+def log_trace(trace: RequestTrace):
+    logger.info(json.dumps(trace.as_dict()))
+
+
+def get_queries_per_item(trace: RequestTrace) -> List[str]:
+    """Return descriptions of fields and dataloaders querying once per resolved item.
+
+    Their number of queries grows with the page size of the operation.
+    """
+    problems = []
+    for path, stats in sorted(trace.fields.items()):
+        if stats.calls > 1 and stats.queries >= stats.calls:
+            problems.append(
+                f"field {path} executed {stats.queries} queries for {stats.calls} items"
+            )
+    for name, stats in sorted(trace.loaders.items()):
+        if stats.batches > 1 and stats.max_batch_size == 1 and stats.queries >= stats.batches:
+            problems.append(
+                f"dataloader {name} executed {stats.queries} queries "
+                f"in {stats.batches} batches of a single key"
+            )
+    return problems
+
+
+def check_query_count(trace: RequestTrace):
+    """Log operations executing queries for every item of a list."""
+    problems = get_queries_per_item(trace)
+    if problems:
+        query_count_logger.warning(
+            "Operation %s executes queries per item: %s",
+            trace.operation_name,
+            "; ".join(problems),
+        )
+
+
+def get_field_path(info) -> str:
+    # List indexes are left out to aggregate the same field of all list items
+    return ".".join(str(key) for key in info.path if not isinstance(key, int))
+
+
+class TracingMiddleware:
+    """Time resolvers of operations traced by `GraphQLView`."""
+
+    def resolve(self, next_, root, info, **kwargs):
+        trace = get_request_trace(info.context)
+        if trace is None:
+            return next_(root, info, **kwargs)
+        with trace.field(get_field_path(info)):
+            return next_(root, info, **kwargs)
@@ -1,7 +1,7 @@
 import graphene
 
 from ..enums import PermissionEnum
-from ...utils.images import get_thumbnail
+from ...utils.images import build_absolute_image_uri, get_thumbnail
 
 
 class Error(graphene.ObjectType):
@@ -52,7 +52,7 @@ class Image(graphene.ObjectType):
             )
         else:
             url = image.url
-        url = info.context.build_absolute_uri(url)
+        url = build_absolute_image_uri(info.context, url)
         return Image(url, alt)
 
 
@@ -0,0 +1,62 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core import signals
+from django.core.exceptions import RequestAborted
+from django.core.handlers.asgi import ASGIHandler
+from django.db import close_old_connections
+from django.urls import set_script_prefix
+
+from .views import API_PATH
+
+
+def is_graphql_request(scope) -> bool:
+    return scope["type"] == "http" and scope["path"] == str(API_PATH)
+
+
+class GraphQLASGIHandler(ASGIHandler):
+    """Serve the GraphQL API without blocking the event loop.
+
+    Requests go through the whole Django stack in a bounded pool of threads,
+    which also bounds database connections of the process and the number of
+    requests served at once, including those waiting on external services. The
+    event loop of the server is attached to the request, resolvers awaiting
+    external I/O run on it concurrently, see `core.graph.executors.EventLoopExecutor`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=settings.GRAPHQL_THREAD_POOL_SIZE, thread_name_prefix="graphql"
+        )
+
+    async def __call__(self, scope, receive, send):
+        try:
+            body_file = await self.read_body(receive)
+        except RequestAborted:
+            return
+        set_script_prefix(self.get_script_prefix(scope))
+        request, error_response = self.create_request(scope, body_file)
+        if request is None:
+            await self.send_response(error_response, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        request.event_loop = loop
+        context = contextvars.copy_context()
+        response = await loop.run_in_executor(
+            self.thread_pool, context.run, self.handle_request, scope, request
+        )
+        response._handler_class = self.__class__
+        await self.send_response(response, send)
+
+    def handle_request(self, scope, request):
+        signals.request_started.send(sender=self.__class__, scope=scope)
+        try:
+            return self.get_response(request)
+        finally:
+            # Connections belong to the pool thread, the finished signal of the
+            # response is sent from the event loop
+            close_old_connections()
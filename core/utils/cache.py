@@ -0,0 +1,74 @@
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from ..db.routers import mark_replicas_lagging
+
+VERSION_KEY = "{namespace}:version"
+
+
+def _new_version() -> int:
+    # A fresh, time based version makes sure entries written under a version
+    # that was evicted from the cache can never become reachable again.
+    return time.time_ns()
+
+
+def get_cache_version(namespace: str) -> int:
+    """Return the current version of cached entries stored in the namespace."""
+    key = VERSION_KEY.format(namespace=namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(namespace: str):
+    """Invalidate all entries stored in the namespace.
+
+    The version is bumped once the current transaction is committed, so
+    concurrent requests cannot cache the data that is just being replaced.
+    Requests read from the primary for a while after, replicas may not have
+    the committed changes yet.
+    """
+
+    def bump():
+        key = VERSION_KEY.format(namespace=namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_version(), timeout=None)
+        mark_replicas_lagging()
+
+    transaction.on_commit(bump)
+
+
+def get_or_set_many_versioned(
+    namespace: str,
+    keys: Iterable[Any],
+    fetch: Callable[[Iterable[Any]], Dict[Any, Any]],
+    prefix: str = "",
+    timeout: Optional[int] = None,
+) -> Dict[Any, Any]:
+    """Return the cached values for given keys, fetching and storing the missing ones.
+
+    `fetch` receives the keys missing from the cache and returns a dict mapping
+    each of them to its value.
+    """
+    version = get_cache_version(namespace)
+    cache_keys = {f"{namespace}:{prefix}{key}": key for key in keys}
+    cached = cache.get_many(list(cache_keys), version=version)
+    values = {cache_keys[cache_key]: value for cache_key, value in cached.items()}
+
+    missing = [key for cache_key, key in cache_keys.items() if cache_key not in cached]
+    if missing:
+        fetched = fetch(missing)
+        cache.set_many(
+            {f"{namespace}:{prefix}{key}": value for key, value in fetched.items()},
+            timeout=timeout,
+            version=version,
+        )
+        values.update(fetched)
+    return values
@@ -0,0 +1,87 @@
+"""Compression of response content negotiated with `Accept-Encoding`.
+
+Brotli is preferred when the `brotli` package is installed, gzip is always
+available.
+"""
+import gzip
+import re
+from typing import Callable, Dict
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ACCEPT_ENCODING_RE = re.compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?\s*")
+
+
+def compress_gzip(content: bytes) -> bytes:
+    # Fast levels already get most of the ratio on JSON and take a fraction of the time
+    return gzip.compress(content, compresslevel=5, mtime=0)
+
+
+def compress_brotli(content: bytes) -> bytes:
+    return brotli.compress(content, mode=brotli.MODE_TEXT, quality=4)
+
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {"gzip": compress_gzip}
+if brotli is not None:
+    COMPRESSORS = {"br": compress_brotli, **COMPRESSORS}
+
+
+def get_accepted_encodings(request: HttpRequest) -> Dict[str, float]:
+    encodings = {}
+    for value in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        match = ACCEPT_ENCODING_RE.fullmatch(value)
+        if not match:
+            continue
+        name, quality = match.groups()
+        try:
+            encodings[name.lower()] = float(quality) if quality else 1.0
+        except ValueError:
+            continue
+    return encodings
+
+
+def get_response_encoding(request: HttpRequest) -> str:
+    """Return the supported encoding the client prefers, an empty string if none."""
+    accepted = get_accepted_encodings(request)
+    best_encoding, best_quality = "", 0.0
+    for encoding in COMPRESSORS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+def compress_response(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+    """Compress the content of the response in the encoding the client accepts.
+
+    Content shorter than `RESPONSE_COMPRESSION_MIN_SIZE` is sent as it is, its
+    compression would take longer than sending it.
+    """
+    if (
+        response.streaming
+        or response.status_code == 304
+        or response.has_header("Content-Encoding")
+    ):
+        return response
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if len(response.content) < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+        return response
+    encoding = get_response_encoding(request)
+    if not encoding:
+        return response
+
+    response.content = COMPRESSORS[encoding](response.content)
+    response["Content-Length"] = str(len(response.content))
+    response["Content-Encoding"] = encoding
+    # The content differs from the one the ETag was computed for, as in GZipMiddleware
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response["ETag"] = "W/" + etag
+    return response
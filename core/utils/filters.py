@@ -1,9 +1,40 @@
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.constants import LOOKUP_SEP
 from django.utils import timezone
 
 from core.graph.enums import ReportingPeriod
 
 
+def lookup_spans_to_many(model, lookup: str) -> bool:
+    """Return True if the lookup follows a relation that can duplicate rows."""
+    opts = model._meta
+    for part in lookup.split(LOOKUP_SEP):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return False
+        if not field.is_relation:
+            return False
+        if field.many_to_many or field.one_to_many:
+            return True
+        opts = field.related_model._meta
+    return False
+
+
+def filter_without_duplicates(queryset, query: Q, lookups):
+    """Filter the queryset, matching rows through to-many relations with EXISTS.
+
+    Joins used by to-many lookups would return a row once per related match,
+    the subquery keeps the results free of duplicates without `DISTINCT`.
+    """
+    model = queryset.model
+    if not any(lookup_spans_to_many(model, lookup) for lookup in lookups):
+        return queryset.filter(query)
+    matching = model._base_manager.filter(query, pk=OuterRef("pk"))
+    return queryset.filter(Exists(matching))
+
+
 def filter_by_query_param(queryset, query, search_fields):
     """Filter queryset according to given parameters.
 
@@ -18,7 +49,7 @@ def filter_by_query_param(queryset, query, search_fields):
         query_objects = Q()
         for q in query_by:
             query_objects |= Q(**{q: query_by[q]})
-        return queryset.filter(query_objects).distinct()
+        return filter_without_duplicates(queryset, query_objects, search_fields)
     return queryset
 
 
@@ -61,7 +92,7 @@ def filter_range_field(qs, field, value):
 
 
 def filter_by_include_ids(qs, ids, field):
-    return qs.filter(**{f"{field}__in": ids})
+    return filter_without_duplicates(qs, Q(**{f"{field}__in": ids}), [field])
 
 
 def filter_by_exclude_ids(qs, ids, field):
@@ -1,15 +1,18 @@
 import logging
 import os
 import re
+import threading
 import warnings
-from functools import reduce
+from collections import OrderedDict
+from functools import lru_cache, reduce
 from uuid import uuid4
 from django import template
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.templatetags.static import static
 from django.utils.deconstruct import deconstructible
-from versatileimagefield.image_warmer import VersatileImageFieldWarmer
+
+from .thumbnails import warm_image
 
 logger = logging.getLogger(__name__)
 register = template.Library()
@@ -49,15 +52,28 @@ def choose_placeholder(size=""):
     return placeholder
 
 
-def get_available_sizes_by_method(method, rendition_key_set):
-    sizes = []
-    for available_size in AVAILABLE_SIZES[rendition_key_set]:
-        available_method, avail_size_str = available_size.split("__")
-        if available_method == method:
-            sizes.append(min([int(s) for s in avail_size_str.split("x")]))
-    return sizes
+def get_available_sizes_by_method_table():
+    """Return sorted square sizes of renditions grouped by key set and method."""
+    sizes_table = {}
+    for rendition_key_set, sizes in AVAILABLE_SIZES.items():
+        sizes_by_method = {}
+        for available_size in sizes:
+            available_method, avail_size_str = available_size.split("__")
+            sizes_by_method.setdefault(available_method, []).append(
+                min([int(s) for s in avail_size_str.split("x")])
+            )
+        sizes_table[rendition_key_set] = {
+            method: sorted(method_sizes) for method, method_sizes in sizes_by_method.items()
+        }
+    return sizes_table
+
+
+AVAILABLE_SIZES_BY_METHOD = get_available_sizes_by_method_table()
+SIZE_CACHE_SIZE = 256
 
 
+# Sizes are requested by clients, only the most used ones are kept
+@lru_cache(maxsize=SIZE_CACHE_SIZE)
 def get_thumbnail_size(size, method, rendition_key_set):
     """Return the closest larger size if not more than 2 times larger.
 
@@ -71,7 +87,7 @@ def get_thumbnail_size(size, method, rendition_key_set):
     size_name = "%s__%s" % (method, size_str)
     if size_name in AVAILABLE_SIZES[rendition_key_set] or on_demand:
         return size_str
-    avail_sizes = sorted(get_available_sizes_by_method(method, rendition_key_set))
+    avail_sizes = AVAILABLE_SIZES_BY_METHOD[rendition_key_set].get(method, [])
     larger = [x for x in avail_sizes if size < x <= size * 2]
     smaller = [x for x in avail_sizes if x <= size]
 
@@ -87,10 +103,52 @@ def get_thumbnail_size(size, method, rendition_key_set):
     return None
 
 
+class ThumbnailUrlCache:
+    """Thread safe, bounded LRU cache of thumbnail URLs."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.urls = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            url = self.urls.get(key)
+            if url is not None:
+                self.urls.move_to_end(key)
+            return url
+
+    def set(self, key, url):
+        with self.lock:
+            self.urls[key] = url
+            self.urls.move_to_end(key)
+            if len(self.urls) > self.maxsize:
+                self.urls.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.urls.clear()
+
+
+thumbnail_urls = ThumbnailUrlCache(maxsize=settings.THUMBNAIL_URL_CACHE_SIZE)
+
+
+@lru_cache(maxsize=SIZE_CACHE_SIZE)
+def get_placeholder_url(size):
+    return static(choose_placeholder("%sx%s" % (size, size)))
+
+
 @register.simple_tag()
 def get_thumbnail(image_file, size, method, rendition_key_set="products"):
     if image_file:
         used_size = get_thumbnail_size(size, method, rendition_key_set)
+        # Uploaded images are always stored under a new, unique name, so the name
+        # identifies the file contents. PPOI is a part of the key as cropping
+        # methods use it to name the renditions.
+        key = (image_file.name, used_size, method, getattr(image_file, "ppoi", None))
+        url = thumbnail_urls.get(key)
+        if url is not None:
+            return url
         try:
             thumbnail = getattr(image_file, method)[used_size]
         except Exception:
@@ -98,8 +156,9 @@ def get_thumbnail(image_file, size, method, rendition_key_set="products"):
                 "Thumbnail fetch failed", extra={"image_file": image_file, "size": size}
             )
         else:
+            thumbnail_urls.set(key, thumbnail.url)
             return thumbnail.url
-    return static(choose_placeholder("%sx%s" % (size, size)))
+    return get_placeholder_url(size)
 
 
 @register.simple_tag()
@@ -108,6 +167,21 @@ def get_product_image_thumbnail(instance, size, method):
     return get_thumbnail(image_file, size, method)
 
 
+def build_absolute_image_uri(request, url):
+    """Return an absolute URL of an image, from a base computed once per request.
+
+    Storages return URLs which are already quoted, so unlike
+    `HttpRequest.build_absolute_uri` no further escaping is made.
+    """
+    if not url.startswith("/") or url.startswith("//"):
+        return request.build_absolute_uri(url)
+    base_uri = getattr(request, "_image_base_uri", None)
+    if base_uri is None:
+        base_uri = request.build_absolute_uri("/")[:-1]
+        request._image_base_uri = base_uri
+    return base_uri + url
+
+
 def create_thumbnails(pk, model, size_set, image_attr=None):
     instance = model.objects.get(pk=pk)
     if not image_attr:
@@ -116,11 +190,8 @@ def create_thumbnails(pk, model, size_set, image_attr=None):
     if image_instance.name == "":
         # There is no file, skip processing
         return
-    warmer = VersatileImageFieldWarmer(
-        instance_or_queryset=instance, rendition_key_set=size_set, image_attr=image_attr
-    )
     logger.info("Creating thumbnails for  %s", pk)
-    num_created, failed_to_create = warmer.warm()
+    num_created, failed_to_create = warm_image(image_instance, size_set)
     if num_created:
         logger.info("Created %d thumbnails", num_created)
     if failed_to_create:
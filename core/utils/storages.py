@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, get_storage_class, Storage
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+
+
+@deconstructible
+class PrivateFileSystemStorage(FileSystemStorage):
+    """Local storage of files that are never served, see `PRIVATE_MEDIA_ROOT`."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("location", settings.PRIVATE_MEDIA_ROOT)
+        super().__init__(**kwargs)
+
+
+@deconstructible
+class PrivateStorage(Storage):
+    """Storage of files only staff may read, backed by `PRIVATE_FILE_STORAGE`.
+
+    The backend is picked when first used, so that fields using this storage do
+    not depend on the settings of the environment migrations are made in.
+    """
+
+    @cached_property
+    def backend(self) -> Storage:
+        return get_storage_class(settings.PRIVATE_FILE_STORAGE)()
+
+    def _open(self, name, mode="rb"):
+        return self.backend.open(name, mode)
+
+    def _save(self, name, content):
+        return self.backend.save(name, content)
+
+    def get_available_name(self, name, max_length=None):
+        return self.backend.get_available_name(name, max_length=max_length)
+
+    def delete(self, name):
+        self.backend.delete(name)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def url(self, name):
+        return self.backend.url(name)
+
+
+private_storage = PrivateStorage()
@@ -0,0 +1,151 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import reduce
+from typing import Iterable, List, Optional, Tuple
+
+from django.apps import apps
+from django.db import connections
+from django.db.models import Q, QuerySet
+from versatileimagefield.utils import get_rendition_key_set, get_resized_path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Rendition:
+    method: str
+    width: int
+    height: int
+    path: str
+
+
+def get_renditions(image_file, rendition_key_set: str) -> List[Rendition]:
+    """Return all renditions of the rendition key set for the image file."""
+    renditions = []
+    for _, size_key in get_rendition_key_set(rendition_key_set):
+        method, size = size_key.split("__")
+        width, height = [int(i) for i in size.split("x")]
+        path = get_resized_path(
+            path_to_image=image_file.name,
+            width=width,
+            height=height,
+            filename_key=getattr(image_file, method).get_filename_key(),
+            storage=image_file.storage,
+        )
+        renditions.append(Rendition(method=method, width=width, height=height, path=path))
+    return renditions
+
+
+def get_missing_renditions(image_file, rendition_key_set: str) -> List[Rendition]:
+    storage = image_file.storage
+    return [
+        rendition
+        for rendition in get_renditions(image_file, rendition_key_set)
+        if not storage.exists(rendition.path)
+    ]
+
+
+def create_renditions(image_file, renditions: Iterable[Rendition]) -> Tuple[int, List[str]]:
+    """Create given renditions of the image, decoding the source image only once.
+
+    Return the number of created renditions and the list of paths
+    of renditions that failed to be created.
+    """
+    renditions = list(renditions)
+    if not renditions:
+        return 0, []
+
+    sizer = getattr(image_file, renditions[0].method)
+    try:
+        image, file_ext, image_format, mime_type = sizer.retrieve_image(image_file.name)
+        image, save_kwargs = sizer.preprocess(image, image_format)
+        image.load()
+    except Exception:
+        logger.exception("Failed to open image", extra={"path": image_file.name})
+        return 0, [rendition.path for rendition in renditions]
+
+    num_created = 0
+    failed_to_create = []
+    for rendition in renditions:
+        sizer = getattr(image_file, rendition.method)
+        try:
+            # Sizers resize the image in place, each rendition needs its own copy
+            imagefile = sizer.process_image(
+                image=image.copy(),
+                image_format=image_format,
+                save_kwargs=save_kwargs,
+                width=rendition.width,
+                height=rendition.height,
+            )
+            sizer.save_image(imagefile, rendition.path, file_ext, mime_type)
+        except Exception:
+            logger.exception("Thumbnail generation failed", extra={"path": rendition.path})
+            failed_to_create.append(rendition.path)
+        else:
+            num_created += 1
+    return num_created, failed_to_create
+
+
+def warm_image(image_file, rendition_key_set: str) -> Tuple[int, List[str]]:
+    """Create all missing renditions of the image."""
+    if not image_file or not image_file.name:
+        return 0, []
+    return create_renditions(image_file, get_missing_renditions(image_file, rendition_key_set))
+
+
+def warm_images_batch(
+    model_label: str, pks: List[int], image_attr: str, rendition_key_set: str
+) -> Tuple[int, List[str]]:
+    """Create all missing renditions for a batch of model instances."""
+    model = apps.get_model(model_label)
+    num_created = 0
+    failed_to_create: List[str] = []
+    for instance in model.objects.filter(pk__in=pks).order_by("pk"):
+        image_file = reduce(getattr, image_attr.split("."), instance)
+        created, failed = warm_image(image_file, rendition_key_set)
+        num_created += created
+        failed_to_create += failed
+    return num_created, failed_to_create
+
+
+def warm_images(
+    queryset: QuerySet,
+    rendition_key_set: str,
+    image_attr: str = "image",
+    batch_size: int = 50,
+    workers: Optional[int] = None,
+) -> Tuple[int, List[str]]:
+    """Create all missing renditions of images in the queryset.
+
+    Images are split in batches processed by a pool of `workers` processes,
+    or in the current process when `workers` is 1. Celery workers cannot spawn
+    child processes, tasks should always use a single worker.
+    """
+    queryset = queryset.exclude(Q(**{image_attr: ""}) | Q(**{f"{image_attr}__isnull": True}))
+    pks = list(queryset.order_by("pk").values_list("pk", flat=True))
+    batches = [pks[i : i + batch_size] for i in range(0, len(pks), batch_size)]
+    model_label = queryset.model._meta.label
+
+    if workers == 1 or len(batches) <= 1:
+        results = [
+            warm_images_batch(model_label, batch, image_attr, rendition_key_set)
+            for batch in batches
+        ]
+    else:
+        # Forked processes must not share the parent's database connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    warm_images_batch,
+                    [model_label] * len(batches),
+                    batches,
+                    [image_attr] * len(batches),
+                    [rendition_key_set] * len(batches),
+                )
+            )
+
+    num_created = sum(created for created, _ in results)
+    failed_to_create = [path for _, failed in results for path in failed]
+    return num_created, failed_to_create
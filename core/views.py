@@ -1,12 +1,14 @@
 import json
 import logging
 import traceback
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from django.conf import settings
-from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
 from django.utils.functional import SimpleLazyObject
 from django.views.generic import View
 from graphene_django.settings import graphene_settings
@@ -16,6 +18,25 @@ from graphql.error import format_error as format_graphql_error, GraphQLError, Gr
 from graphql.execution import ExecutionResult
 
 from .exceptions import PermissionDenied, ReadOnlyException
+from .db.routers import get_replica_for_request, PRIMARY_DATABASE_COOKIE, use_database_for_reads
+from .graph.cache import (
+    get_public_cache_key,
+    get_public_response,
+    invalidate_public_cache,
+    is_public_request,
+    set_public_response,
+)
+from .graph.cost import get_max_query_cost, get_operation, get_query_cost, QueryCostError
+from .graph.executors import EventLoopExecutor
+from .graph.serializers import get_serializer
+from .graph.tracing import (
+    check_query_count,
+    is_tracing_requested,
+    log_trace,
+    RequestTrace,
+    should_trace,
+)
+from .utils.compression import compress_response
 
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
 
@@ -57,6 +78,9 @@ class GraphQLView(View):
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
         if request.method == "GET":
+            if "query" in request.GET:
+                # Queries sent over GET can be cached by CDNs
+                return self.handle_query(request)
             if settings.DEBUG:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
@@ -71,21 +95,64 @@ class GraphQLView(View):
     def render_playground(self, request):
         return render(request, "graphql/playground.html", {})
 
-    def handle_query(self, request: HttpRequest) -> JsonResponse:
+    def handle_query(self, request: HttpRequest) -> HttpResponse:
+        return compress_response(request, self.get_query_response(request))
+
+    def get_query_response(self, request: HttpRequest) -> HttpResponse:
         try:
             data = self.parse_body(request)
         except ValueError:
-            return JsonResponse(
-                data={"errors": [self.format_error("Unable to parse query.")]}, status=400,
+            return self.json_response(
+                {"errors": [self.format_error("Unable to parse query.")]}, status=400
             )
 
+        public_cache_key = None
+        if not isinstance(data, list) and is_public_request(request):
+            public_cache_key = get_public_cache_key(request, data)
+            cached = get_public_response(public_cache_key)
+            if cached:
+                etag, content = cached
+                response = HttpResponse(content, content_type="application/json")
+                return self.public_response(request, response, etag)
+
         if isinstance(data, list):
             responses = [self.get_response(request, entry) for entry in data]
             result: Union[list, Optional[dict]] = [response for response, code in responses]
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        response = self.json_response(result, status=status_code)
+        if (
+            public_cache_key
+            and status_code == 200
+            and getattr(request, "public_operation", False)
+            and not result.get("errors")
+        ):
+            etag = set_public_response(public_cache_key, response.content)
+            return self.public_response(request, response, etag)
+        if getattr(request, "executed_mutation", False) and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                PRIMARY_DATABASE_COOKIE,
+                "1",
+                max_age=settings.DATABASE_REPLICA_STICKINESS,
+                httponly=True,
+            )
+        return response
+
+    @staticmethod
+    def json_response(data, status: int = 200) -> HttpResponse:
+        # Encoded straight to bytes, which are the content of the response as they are
+        return HttpResponse(
+            get_serializer().dumps(data), status=status, content_type="application/json"
+        )
+
+    @staticmethod
+    def public_response(request: HttpRequest, response: HttpResponse, etag: str):
+        response["ETag"] = quote_etag(etag)
+        patch_cache_control(response, public=True, max_age=settings.GRAPHQL_PUBLIC_CACHE_TIMEOUT)
+        if request.method == "GET":
+            return get_conditional_response(request, etag=response["ETag"], response=response)
+        return response
 
     def get_response(
         self, request: HttpRequest, data: dict
@@ -100,12 +167,20 @@ class GraphQLView(View):
                 status_code = 400
             else:
                 response["data"] = execution_result.data
+            if execution_result.extensions:
+                response["extensions"] = execution_result.extensions
             result: Optional[Dict[str, List[Any]]] = response
         else:
             result = None
 
         return result, status_code
 
+    def get_executor(self, request: HttpRequest):
+        if self.executor:
+            return self.executor
+        # Resolvers can await on the event loop of requests served over ASGI
+        return EventLoopExecutor(getattr(request, "event_loop", None))
+
     def get_root_value(self):
         return self.root_value
 
@@ -141,31 +216,71 @@ class GraphQLView(View):
         if error:
             return error
 
-        extra_options: Dict[str, Optional[Any]] = {}
-        if self.executor:
-            # We only include it optionally since
-            # executor is not a valid argument in all backends
-            extra_options["executor"] = self.executor
-        try:
-            return document.execute(  # type: ignore
-                root=self.get_root_value(),
-                variables=variables,
-                operation_name=operation_name,
-                context=request,
-                middleware=self.middleware,
-                **extra_options,
+        query_cost = get_query_cost(self.schema, document.document_ast, variables, operation_name)
+        max_query_cost = get_max_query_cost()
+        extensions = {
+            "cost": {"requestedQueryCost": query_cost, "maximumAvailable": max_query_cost}
+        }
+        if max_query_cost is not None and query_cost > max_query_cost:
+            error = QueryCostError(
+                f"The query exceeds the maximum cost of {max_query_cost}, "
+                f"its estimated cost is {query_cost}."
             )
+            return ExecutionResult(errors=[error], invalid=True, extensions=extensions)
+
+        extra_options: Dict[str, Optional[Any]] = {"executor": self.get_executor(request)}
+
+        # Queries read from a replica, mutations read and write on the primary
+        operation = get_operation(document.document_ast, operation_name)
+        read_database = None
+        if operation is not None and operation.operation == "query":
+            read_database = get_replica_for_request(request)
+            request.public_operation = True
+        elif operation is not None and operation.operation == "mutation":
+            if request.method == "GET":
+                error = GraphQLError("Mutations can only be sent with a POST request.")
+                return ExecutionResult(errors=[error], invalid=True, extensions=extensions)
+            request.executed_mutation = True
+            invalidate_public_cache(operation)
+
+        trace = RequestTrace(operation_name) if should_trace(request) else None
+        request.graphql_trace = trace
+        try:
+            with use_database_for_reads(read_database), trace.record() if trace else nullcontext():
+                execution_result = document.execute(  # type: ignore
+                    root=self.get_root_value(),
+                    variables=variables,
+                    operation_name=operation_name,
+                    context=request,
+                    middleware=self.middleware,
+                    **extra_options,
+                )
         except Exception as e:
-            return ExecutionResult(errors=[e], invalid=True)
+            execution_result = ExecutionResult(errors=[e], invalid=True)
+        finally:
+            request.graphql_trace = None
+
+        if trace:
+            log_trace(trace)
+            if settings.GRAPHQL_QUERY_COUNT_GUARD:
+                check_query_count(trace)
+            if is_tracing_requested(request):
+                extensions["tracing"] = trace.as_dict()
+        execution_result.extensions.update(extensions)
+        return execution_result
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data = request.GET.dict()
+            if "variables" in data:
+                data["variables"] = get_serializer().loads(data["variables"])
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
         if content_type == "application/json":
-            body = request.body.decode("utf-8")
-            return json.loads(body)
+            return get_serializer().loads(request.body)
         if content_type in ["application/x-www-form-urlencoded", "multipart/form-data"]:
             return request.POST
         return {}